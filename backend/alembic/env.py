@@ -30,6 +30,17 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+# Indexes created only by migrations because metadata.create_all cannot build
+# them (e.g. the pg_trgm index needs the extension); autogenerate must not
+# propose dropping them
+MIGRATION_ONLY_INDEXES = {"ix_product_master_canonical_name_trgm"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Skip migration-only indexes when autogenerate compares the schema."""
+    return not (type_ == "index" and name in MIGRATION_ONLY_INDEXES)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -52,6 +63,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -74,7 +86,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
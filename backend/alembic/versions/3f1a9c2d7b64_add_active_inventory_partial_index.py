@@ -0,0 +1,37 @@
+"""Add partial index for active inventory items
+
+Revision ID: 3f1a9c2d7b64
+Revises: c943e915cf61
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1a9c2d7b64"
+down_revision: str | Sequence[str] | None = "c943e915cf61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_inventory_item_active_product_expiry",
+        "inventory_item",
+        ["product_master_id", "expiry_date"],
+        unique=False,
+        postgresql_where=sa.text("status NOT IN ('empty', 'discarded')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_inventory_item_active_product_expiry",
+        table_name="inventory_item",
+    )
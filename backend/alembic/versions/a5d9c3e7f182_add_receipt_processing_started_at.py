@@ -0,0 +1,31 @@
+"""Add receipt.processing_started_at for stale claim recovery
+
+Revision ID: a5d9c3e7f182
+Revises: e8b4c1d9f736
+Create Date: 2026-10-16 23:41:12.408317
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a5d9c3e7f182"
+down_revision: str | Sequence[str] | None = "e8b4c1d9f736"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "receipt",
+        sa.Column("processing_started_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("receipt", "processing_started_at")
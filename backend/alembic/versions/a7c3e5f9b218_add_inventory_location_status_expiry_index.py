@@ -0,0 +1,35 @@
+"""Add composite index for filtered inventory listings
+
+Revision ID: a7c3e5f9b218
+Revises: e91b3f6c0d48
+Create Date: 2026-10-16 17:48:05.392617
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5f9b218"
+down_revision: str | Sequence[str] | None = "e91b3f6c0d48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_inventory_item_location_status_expiry",
+        "inventory_item",
+        ["location", "status", "expiry_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_inventory_item_location_status_expiry",
+        table_name="inventory_item",
+    )
@@ -0,0 +1,32 @@
+"""Add file_sha256 to receipt
+
+Revision ID: b7e2d4a91c08
+Revises: 3f1a9c2d7b64
+Create Date: 2026-10-16 11:40:02.551930
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2d4a91c08"
+down_revision: str | Sequence[str] | None = "3f1a9c2d7b64"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("receipt", sa.Column("file_sha256", sa.String(64), nullable=True))
+    op.create_index(
+        op.f("ix_receipt_file_sha256"), "receipt", ["file_sha256"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_receipt_file_sha256"), table_name="receipt")
+    op.drop_column("receipt", "file_sha256")
@@ -0,0 +1,33 @@
+"""Add GIN index on category meal_contexts
+
+Revision ID: b81d6e3c9a25
+Revises: f4b9d2e7a053
+Create Date: 2026-10-16 20:14:36.251984
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b81d6e3c9a25"
+down_revision: str | Sequence[str] | None = "f4b9d2e7a053"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_category_meal_contexts",
+        "category",
+        ["meal_contexts"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_category_meal_contexts", table_name="category")
@@ -0,0 +1,44 @@
+"""Add partial index for the shopping list's priority ordering
+
+Revision ID: c2f8a4d61e97
+Revises: a7c3e5f9b218
+Create Date: 2026-10-16 18:31:47.905126
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2f8a4d61e97"
+down_revision: str | Sequence[str] | None = "a7c3e5f9b218"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_shopping_list_item_active_priority",
+        "shopping_list_item",
+        [
+            sa.text(
+                "(CASE priority WHEN 'urgent' THEN 1 WHEN 'normal' THEN 2 "
+                "WHEN 'low' THEN 3 ELSE 4 END)"
+            ),
+            "added_at",
+            "id",
+        ],
+        unique=False,
+        postgresql_where=sa.text("is_purchased IS false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_shopping_list_item_active_priority",
+        table_name="shopping_list_item",
+    )
@@ -0,0 +1,40 @@
+"""Server-side defaults for timestamp columns
+
+Revision ID: c6e2a9f4d187
+Revises: b81d6e3c9a25
+Create Date: 2026-10-16 21:02:11.408327
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c6e2a9f4d187"
+down_revision: str | Sequence[str] | None = "b81d6e3c9a25"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TIMESTAMP_COLUMNS = (
+    ("consumption_log", "logged_at"),
+    ("inventory_item", "created_at"),
+    ("product_master", "created_at"),
+    ("product_master", "updated_at"),
+    ("receipt", "created_at"),
+    ("shopping_list_item", "added_at"),
+    ("store_product_alias", "last_seen"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("clock_timestamp()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
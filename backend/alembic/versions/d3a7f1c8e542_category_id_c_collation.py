@@ -0,0 +1,50 @@
+"""Use the C collation for category ids
+
+Revision ID: d3a7f1c8e542
+Revises: c6e2a9f4d187
+Create Date: 2026-10-16 21:37:52.915604
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a7f1c8e542"
+down_revision: str | Sequence[str] | None = "c6e2a9f4d187"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "product_master",
+        "category",
+        type_=sa.String(collation="C"),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "category",
+        "id",
+        type_=sa.String(collation="C"),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "product_master",
+        "category",
+        type_=sa.String(),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        "category",
+        "id",
+        type_=sa.String(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,32 @@
+"""Add (created_at, id) index for receipt keyset pagination
+
+Revision ID: d4c8e1f7a253
+Revises: b7e2d4a91c08
+Create Date: 2026-10-16 14:05:31.207416
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4c8e1f7a253"
+down_revision: str | Sequence[str] | None = "b7e2d4a91c08"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_receipt_created_at_id",
+        "receipt",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_receipt_created_at_id", table_name="receipt")
@@ -0,0 +1,66 @@
+"""Replace store_product_alias single-column indexes with composites
+
+Revision ID: e8b4c1d9f736
+Revises: d3a7f1c8e542
+Create Date: 2026-10-16 22:48:05.731940
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b4c1d9f736"
+down_revision: str | Sequence[str] | None = "d3a7f1c8e542"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_store_product_alias_chain_name",
+        "store_product_alias",
+        ["store_chain", "receipt_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_store_product_alias_chain_barcode",
+        "store_product_alias",
+        ["store_chain", "barcode"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_store_product_alias_store_chain", table_name="store_product_alias"
+    )
+    op.drop_index(
+        "ix_store_product_alias_receipt_name", table_name="store_product_alias"
+    )
+    op.drop_index("ix_store_product_alias_barcode", table_name="store_product_alias")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_store_product_alias_barcode",
+        "store_product_alias",
+        ["barcode"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_store_product_alias_receipt_name",
+        "store_product_alias",
+        ["receipt_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_store_product_alias_store_chain",
+        "store_product_alias",
+        ["store_chain"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_store_product_alias_chain_barcode", table_name="store_product_alias"
+    )
+    op.drop_index("ix_store_product_alias_chain_name", table_name="store_product_alias")
@@ -0,0 +1,38 @@
+"""Add trigram index for product canonical_name search
+
+Revision ID: e91b3f6c0d48
+Revises: d4c8e1f7a253
+Create Date: 2026-10-16 15:20:12.583904
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e91b3f6c0d48"
+down_revision: str | Sequence[str] | None = "d4c8e1f7a253"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_product_master_canonical_name_trgm",
+        "product_master",
+        ["canonical_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"canonical_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_product_master_canonical_name_trgm",
+        table_name="product_master",
+    )
@@ -0,0 +1,56 @@
+"""Make receipt (batch_id, file_sha256) unique
+
+Revision ID: f2c7a8e4d905
+Revises: a5d9c3e7f182
+Create Date: 2026-10-17 00:12:47.193826
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a8e4d905"
+down_revision: str | Sequence[str] | None = "a5d9c3e7f182"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Uploads that raced before the constraint existed keep their rows; only
+    # the earliest one per batch keeps its digest
+    op.execute(
+        """
+        UPDATE receipt SET file_sha256 = NULL
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY batch_id, file_sha256 ORDER BY created_at, id
+                ) AS position
+                FROM receipt
+                WHERE file_sha256 IS NOT NULL
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_index(
+        "ix_receipt_batch_id_file_sha256",
+        "receipt",
+        ["batch_id", "file_sha256"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+        postgresql_where=sa.text("file_sha256 IS NOT NULL"),
+    )
+    op.drop_index(op.f("ix_receipt_file_sha256"), table_name="receipt")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_receipt_file_sha256"), "receipt", ["file_sha256"], unique=False
+    )
+    op.drop_index("ix_receipt_batch_id_file_sha256", table_name="receipt")
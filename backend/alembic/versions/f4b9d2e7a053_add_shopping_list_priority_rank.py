@@ -0,0 +1,64 @@
+"""Add generated priority_rank column to shopping_list_item
+
+Revision ID: f4b9d2e7a053
+Revises: c2f8a4d61e97
+Create Date: 2026-10-16 19:05:22.718340
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b9d2e7a053"
+down_revision: str | Sequence[str] | None = "c2f8a4d61e97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PRIORITY_RANK_SQL = (
+    "CASE priority WHEN 'urgent' THEN 1 WHEN 'normal' THEN 2 "
+    "WHEN 'low' THEN 3 ELSE 4 END"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A stored generated column is filled for existing rows by ADD COLUMN
+    op.add_column(
+        "shopping_list_item",
+        sa.Column(
+            "priority_rank",
+            sa.SmallInteger(),
+            sa.Computed(PRIORITY_RANK_SQL, persisted=True),
+            nullable=False,
+        ),
+    )
+    op.drop_index(
+        "ix_shopping_list_item_active_priority",
+        table_name="shopping_list_item",
+    )
+    op.create_index(
+        "ix_shopping_list_item_active_priority",
+        "shopping_list_item",
+        ["priority_rank", "added_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_purchased IS false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_shopping_list_item_active_priority",
+        table_name="shopping_list_item",
+    )
+    op.create_index(
+        "ix_shopping_list_item_active_priority",
+        "shopping_list_item",
+        [sa.text(f"({PRIORITY_RANK_SQL})"), "added_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_purchased IS false"),
+    )
+    op.drop_column("shopping_list_item", "priority_rank")
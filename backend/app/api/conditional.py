@@ -0,0 +1,36 @@
+"""Conditional GET helpers (ETag / If-None-Match) for cacheable endpoints."""
+
+import hashlib
+
+from fastapi import Request
+
+
+def compute_etag(body: bytes) -> str:
+    """Build a strong ETag from a serialized response body.
+
+    Args:
+        body: Serialized response body.
+
+    Returns:
+        Quoted ETag header value.
+    """
+    return f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match matches the current ETag.
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag of the resource.
+
+    Returns:
+        True if a 304 Not Modified response can be sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
@@ -1,21 +1,43 @@
 """API endpoints for Category CRUD operations."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import compute_etag, is_not_modified
+from app.api.responses import json_bytes_response
 from app.crud import category as crud_category
 from app.db.session import get_db
 from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
+from app.services import response_cache
 
 router = APIRouter()
 
+_category_list_adapter = TypeAdapter(list[CategoryResponse])
+
 
 @router.get("", response_model=list[CategoryResponse])
-async def list_categories(db: AsyncSession = Depends(get_db)) -> list[CategoryResponse]:
-    """Get all categories sorted by sort_order."""
-    categories = await crud_category.get_categories(db)
-    return categories
+async def list_categories(
+    request: Request, db: AsyncSession = Depends(get_db)
+) -> list[CategoryResponse]:
+    """Get all categories sorted by sort_order.
+
+    Categories carry no timestamps, so the ETag hashes the serialized list.
+    A cache hit returns the stored JSON bytes as-is, without decoding them.
+    """
+    body = await response_cache.cached_json(
+        "categories",
+        "list",
+        _category_list_adapter,
+        lambda: crud_category.get_categories(db),
+    )
+    etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return json_bytes_response(body, headers=headers)
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
@@ -23,7 +45,12 @@ async def get_category(
     category_id: str, db: AsyncSession = Depends(get_db)
 ) -> CategoryResponse:
     """Get a specific category by ID."""
-    category = await crud_category.get_category(db, category_id)
+    category = await response_cache.cached_response(
+        "categories",
+        f"id:{category_id}",
+        CategoryResponse,
+        lambda: crud_category.get_category(db, category_id),
+    )
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -38,12 +65,14 @@ async def create_category(
 ) -> CategoryResponse:
     """Create a new category."""
     try:
-        return await crud_category.create_category(db, category)
+        created = await crud_category.create_category(db, category)
     except IntegrityError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Category with ID '{category.id}' already exists",
         ) from e
+    await response_cache.invalidate("categories")
+    return created
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
@@ -59,6 +88,7 @@ async def update_category(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Category '{category_id}' not found",
         )
+    await response_cache.invalidate("categories")
     return category
 
 
@@ -71,3 +101,4 @@ async def delete_category(category_id: str, db: AsyncSession = Depends(get_db))
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Category '{category_id}' not found",
         )
+    await response_cache.invalidate("categories")
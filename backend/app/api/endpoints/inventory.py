@@ -2,48 +2,51 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.api.exceptions import handle_integrity_errors
+from app.api.responses import json_bytes_response, pydantic_json_response
 from app.crud import inventory_item as crud_inventory
 from app.db.session import get_db
 from app.models.inventory_item import InventoryItem
-from app.models.product_master import ProductMaster
-from app.schemas.consume import ConsumeRequest
+from app.schemas.consume import BulkConsumeItem, ConsumeRequest
 from app.schemas.inventory_item import (
     InventoryItemCreate,
     InventoryItemResponse,
     InventoryItemUpdate,
 )
-from app.services.broadcast_helpers import broadcast_inventory_update
+from app.services import response_cache
+from app.services.broadcast_helpers import (
+    broadcast_inventory_update,
+    broadcast_inventory_updates,
+)
 
 router = APIRouter()
 
+_inventory_list_adapter = TypeAdapter(list[InventoryItemResponse])
 
-async def _get_product_name(db: AsyncSession, item) -> str | None:
+
+def _get_product_name(item: InventoryItem) -> str | None:
     """Get product name for broadcast display.
 
+    The CRUD layer always eager-loads ``product_master``, so no query is issued.
+
     Args:
-        db: Database session.
         item: Inventory item.
 
     Returns:
         Product canonical name or None if not found.
     """
-    try:
-        if hasattr(item, "product_master") and item.product_master:
-            return item.product_master.canonical_name
-        # Query if relationship not loaded
-        result = await db.execute(
-            select(ProductMaster).where(ProductMaster.id == item.product_master_id)
-        )
-        product = result.scalar_one_or_none()
-        return product.canonical_name if product else None
-    except Exception:
-        return None
+    return item.product_master.canonical_name if item.product_master else None
 
 
 @router.get("", response_model=list[InventoryItemResponse])
@@ -56,10 +59,15 @@ async def list_inventory(
     db: AsyncSession = Depends(get_db),
 ) -> list[InventoryItemResponse]:
     """Get all inventory items with optional filters."""
-    items = await crud_inventory.get_inventory_items(
-        db, location=location, status=status, expiring_days=expiring_days
+    body = await response_cache.cached_json(
+        "inventory",
+        f"list:{location or ''}:{status or ''}:{expiring_days}",
+        _inventory_list_adapter,
+        lambda: crud_inventory.get_inventory_items(
+            db, location=location, status=status, expiring_days=expiring_days
+        ),
     )
-    return items
+    return json_bytes_response(body)
 
 
 @router.get("/{item_id}", response_model=InventoryItemResponse)
@@ -67,7 +75,12 @@ async def get_inventory_item(
     item_id: UUID, db: AsyncSession = Depends(get_db)
 ) -> InventoryItemResponse:
     """Get a specific inventory item by ID."""
-    item = await crud_inventory.get_inventory_item(db, item_id)
+    item = await response_cache.cached_response(
+        "inventory",
+        f"id:{item_id}",
+        InventoryItemResponse,
+        lambda: crud_inventory.get_inventory_item(db, item_id),
+    )
     if not item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,28 +93,80 @@ async def get_inventory_item(
     "", response_model=InventoryItemResponse, status_code=status.HTTP_201_CREATED
 )
 async def create_inventory_item(
-    item: InventoryItemCreate, db: AsyncSession = Depends(get_db)
+    item: InventoryItemCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ) -> InventoryItemResponse:
     """Create a new inventory item."""
-    async with handle_integrity_errors():
-        created_item = await crud_inventory.create_inventory_item(db, item)
+    try:
+        # IntegrityError is still mapped for the race where the product is
+        # deleted between the existence check and the insert
+        async with handle_integrity_errors():
+            created_item = await crud_inventory.create_inventory_item(db, item)
+    except crud_inventory.ProductNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    await response_cache.invalidate("inventory")
 
-    product_name = await _get_product_name(db, created_item)
-    await broadcast_inventory_update(
+    background_tasks.add_task(
+        broadcast_inventory_update,
         inventory_item_id=created_item.id,
         action="created",
         current_quantity=created_item.current_quantity,
         status=created_item.status,
-        product_name=product_name,
+        product_name=_get_product_name(created_item),
     )
 
     return created_item
 
 
+@router.post(
+    "/bulk",
+    response_model=list[InventoryItemResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_inventory_items(
+    items: list[InventoryItemCreate],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> list[InventoryItemResponse]:
+    """Create many inventory items in one transaction."""
+    try:
+        async with handle_integrity_errors():
+            created_items = await crud_inventory.create_inventory_items(db, items)
+    except crud_inventory.ProductNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    await response_cache.invalidate("inventory")
+
+    background_tasks.add_task(
+        broadcast_inventory_updates,
+        [
+            {
+                "inventory_item_id": created_item.id,
+                "action": "created",
+                "current_quantity": created_item.current_quantity,
+                "status": created_item.status,
+                "product_name": _get_product_name(created_item),
+            }
+            for created_item in created_items
+        ],
+    )
+
+    return pydantic_json_response(
+        _inventory_list_adapter, created_items, status_code=status.HTTP_201_CREATED
+    )
+
+
 @router.patch("/{item_id}", response_model=InventoryItemResponse)
 async def update_inventory_item(
     item_id: UUID,
     item_update: InventoryItemUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> InventoryItemResponse:
     """Update an inventory item."""
@@ -111,14 +176,15 @@ async def update_inventory_item(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Inventory item with ID '{item_id}' not found",
         )
+    await response_cache.invalidate("inventory")
 
-    product_name = await _get_product_name(db, item)
-    await broadcast_inventory_update(
+    background_tasks.add_task(
+        broadcast_inventory_update,
         inventory_item_id=item.id,
         action="updated",
         current_quantity=item.current_quantity,
         status=item.status,
-        product_name=product_name,
+        product_name=_get_product_name(item),
     )
 
     return item
@@ -126,16 +192,13 @@ async def update_inventory_item(
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_inventory_item(
-    item_id: UUID, db: AsyncSession = Depends(get_db)
+    item_id: UUID,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete an inventory item."""
     # Get item before deletion for broadcast (with product relationship loaded)
-    result = await db.execute(
-        select(InventoryItem)
-        .where(InventoryItem.id == item_id)
-        .options(selectinload(InventoryItem.product_master))
-    )
-    item = result.scalar_one_or_none()
+    item = await crud_inventory.get_inventory_item(db, item_id)
 
     if not item:
         raise HTTPException(
@@ -143,17 +206,57 @@ async def delete_inventory_item(
             detail=f"Inventory item with ID '{item_id}' not found",
         )
 
-    product_name = await _get_product_name(db, item)
+    product_name = _get_product_name(item)
     await crud_inventory.delete_inventory_item(db, item_id)
-    await broadcast_inventory_update(
-        inventory_item_id=item_id, action="deleted", product_name=product_name
+    await response_cache.invalidate("inventory")
+    background_tasks.add_task(
+        broadcast_inventory_update,
+        inventory_item_id=item_id,
+        action="deleted",
+        product_name=product_name,
     )
 
 
+@router.post("/consume", response_model=list[InventoryItemResponse])
+async def bulk_consume_inventory_items(
+    consumptions: list[BulkConsumeItem],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+) -> list[InventoryItemResponse]:
+    """Consume from many inventory items in one statement (all-or-nothing)."""
+    try:
+        items = await crud_inventory.consume_inventory_items_bulk(
+            db, [(entry.item_id, entry.quantity) for entry in consumptions]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+    await response_cache.invalidate("inventory")
+
+    background_tasks.add_task(
+        broadcast_inventory_updates,
+        [
+            {
+                "inventory_item_id": item.id,
+                "action": "consumed",
+                "current_quantity": item.current_quantity,
+                "status": item.status,
+                "product_name": _get_product_name(item),
+            }
+            for item in items
+        ],
+    )
+
+    return pydantic_json_response(_inventory_list_adapter, items)
+
+
 @router.post("/{item_id}/consume", response_model=InventoryItemResponse)
 async def consume_inventory_item(
     item_id: UUID,
     consume_request: ConsumeRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> InventoryItemResponse:
     """Consume/reduce quantity from an inventory item."""
@@ -166,14 +269,15 @@ async def consume_inventory_item(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Inventory item with ID '{item_id}' not found",
             )
+        await response_cache.invalidate("inventory")
 
-        product_name = await _get_product_name(db, item)
-        await broadcast_inventory_update(
+        background_tasks.add_task(
+            broadcast_inventory_update,
             inventory_item_id=item.id,
             action="consumed",
             current_quantity=item.current_quantity,
             status=item.status,
-            product_name=product_name,
+            product_name=_get_product_name(item),
         )
 
         return item
@@ -1,12 +1,16 @@
 """API endpoints for Product CRUD operations."""
 
+import asyncio
+from email.utils import format_datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import compute_etag, is_not_modified
 from app.api.exceptions import handle_integrity_errors
+from app.api.responses import json_bytes_response, pydantic_json_response
 from app.crud import product_master as crud_product
 from app.db.session import get_db
 from app.schemas.product_master import (
@@ -14,6 +18,7 @@ from app.schemas.product_master import (
     ProductMasterResponse,
     ProductMasterUpdate,
 )
+from app.services import response_cache
 from app.services.off_service import (
     OffApiError,
     OffProductNotFoundError,
@@ -22,29 +27,74 @@ from app.services.off_service import (
 
 router = APIRouter()
 
+_product_adapter = TypeAdapter(ProductMasterResponse)
+_product_list_adapter = TypeAdapter(list[ProductMasterResponse])
+
+# Enrichments currently running, keyed by barcode. Concurrent requests for the
+# same barcode await the first one instead of calling OFF and upserting again.
+_inflight: dict[str, asyncio.Future[tuple[ProductMasterResponse, bool]]] = {}
+
 
 @router.get("", response_model=list[ProductMasterResponse])
 async def list_products(
+    request: Request,
     search: str | None = Query(None, description="Search by product name"),
     db: AsyncSession = Depends(get_db),
 ) -> list[ProductMasterResponse]:
-    """Get all products with optional search filter."""
-    products = await crud_product.get_products(db, search=search)
-    return products
+    """Get all products with optional search filter.
+
+    The ETag is derived from the table's latest ``updated_at`` and row count,
+    so warm clients get a 304 without the list being fetched or serialized.
+    """
+    last_modified, count = await crud_product.get_products_version(db)
+    etag = compute_etag(f"{last_modified}:{count}:{search or ''}".encode())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = await response_cache.cached_json(
+        "products",
+        f"list:{search or ''}",
+        _product_list_adapter,
+        lambda: crud_product.get_products(db, search=search),
+    )
+    return json_bytes_response(body, headers=headers)
 
 
 @router.get("/barcode/{barcode}", response_model=ProductMasterResponse)
 async def lookup_by_barcode(
-    barcode: str, db: AsyncSession = Depends(get_db)
+    barcode: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
 ) -> ProductMasterResponse:
-    """Lookup a product by barcode/OFF product ID."""
-    product = await crud_product.get_product_by_barcode(db, barcode)
+    """Lookup a product by barcode/OFF product ID.
+
+    Cached like other product reads (product writes invalidate it) and served
+    with an ETag, so repeat scans revalidate with a bodyless 304.
+    """
+    product = await response_cache.cached_response(
+        "products",
+        f"barcode:{barcode}",
+        ProductMasterResponse,
+        lambda: crud_product.get_product_by_barcode(db, barcode),
+    )
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with barcode '{barcode}' not found",
         )
-    return product
+
+    body = ProductMasterResponse.model_validate(product, from_attributes=True)
+    etag = compute_etag(body.model_dump_json().encode())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return body
 
 
 @router.get("/{product_id}", response_model=ProductMasterResponse)
@@ -52,7 +102,12 @@ async def get_product(
     product_id: UUID, db: AsyncSession = Depends(get_db)
 ) -> ProductMasterResponse:
     """Get a specific product by ID."""
-    product = await crud_product.get_product(db, product_id)
+    product = await response_cache.cached_response(
+        "products",
+        f"id:{product_id}",
+        ProductMasterResponse,
+        lambda: crud_product.get_product(db, product_id),
+    )
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,7 +124,23 @@ async def create_product(
 ) -> ProductMasterResponse:
     """Create a new product."""
     async with handle_integrity_errors():
-        return await crud_product.create_product(db, product)
+        created = await crud_product.create_product(db, product)
+    await response_cache.invalidate("products")
+    return created
+
+
+@router.post("/bulk", response_model=list[ProductMasterResponse])
+async def bulk_upsert_products(
+    products: list[ProductMasterCreate], db: AsyncSession = Depends(get_db)
+) -> list[ProductMasterResponse]:
+    """Create or update many products in one transaction.
+
+    Products whose ``off_product_id`` already exists are updated in place.
+    """
+    async with handle_integrity_errors():
+        upserted = await crud_product.bulk_upsert_products(db, products)
+    await response_cache.invalidate("products")
+    return upserted
 
 
 @router.patch("/{product_id}", response_model=ProductMasterResponse)
@@ -85,6 +156,7 @@ async def update_product(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID '{product_id}' not found",
         )
+    await response_cache.invalidate("products")
     return product
 
 
@@ -97,6 +169,8 @@ async def delete_product(product_id: UUID, db: AsyncSession = Depends(get_db)) -
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Product with ID '{product_id}' not found",
         )
+    # Shopping list items referencing the product were unlinked
+    await response_cache.invalidate("products", "shopping")
 
 
 @router.post("/enrich")
@@ -118,22 +192,13 @@ async def enrich_product(
         - 503: Open Food Facts API unavailable
     """
     try:
-        enriched_data = await enrich_product_from_off(barcode)
-
-        async with handle_integrity_errors():
-            product, created = await crud_product.enrich_product_from_off_data(
-                db, enriched_data
-            )
+        product, created = await _enrich_coalesced(barcode, db)
 
-        response_data = ProductMasterResponse.model_validate(
-            product, from_attributes=True
-        ).model_dump(mode="json")
-
-        if created:
-            return JSONResponse(
-                content=response_data, status_code=status.HTTP_201_CREATED
-            )
-        return JSONResponse(content=response_data, status_code=status.HTTP_200_OK)
+        return pydantic_json_response(
+            _product_adapter,
+            product,
+            status_code=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
 
     except OffProductNotFoundError as e:
         raise HTTPException(
@@ -145,3 +210,70 @@ async def enrich_product(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Open Food Facts API unavailable: {str(e)}",
         ) from e
+
+
+async def _enrich_coalesced(
+    barcode: str, db: AsyncSession
+) -> tuple[ProductMasterResponse, bool]:
+    """Run one enrichment per barcode, sharing its outcome with concurrent callers.
+
+    Callers that join an enrichment already in flight get the shared product
+    with created=False, since only the first caller created it. If that
+    enrichment is cancelled (its request disconnected), a waiting caller
+    takes over and runs it with its own session.
+
+    Args:
+        barcode: Product barcode to enrich.
+        db: Database session of the request that performs the enrichment.
+
+    Returns:
+        Tuple of (product response, created flag).
+    """
+    while (pending := _inflight.get(barcode)) is not None:
+        try:
+            # Shield so a disconnecting follower doesn't cancel the shared result
+            product, _ = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if pending.cancelled() and not (task and task.cancelling()):
+                continue
+            raise
+        return product, False
+
+    future: asyncio.Future[tuple[ProductMasterResponse, bool]] = (
+        asyncio.get_running_loop().create_future()
+    )
+    # Mark the exception as retrieved when no follower awaited it
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight[barcode] = future
+    try:
+        result = await _enrich_and_store(barcode, db)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(barcode, None)
+
+
+async def _enrich_and_store(
+    barcode: str, db: AsyncSession
+) -> tuple[ProductMasterResponse, bool]:
+    """Fetch OFF data for a barcode and upsert it into product_master."""
+    # The session holds no connection while OFF is queried; the upsert that
+    # follows finds any existing product by barcode itself
+    enriched_data = await enrich_product_from_off(barcode)
+
+    async with handle_integrity_errors():
+        product, created = await crud_product.enrich_product_from_off_data(
+            db, enriched_data
+        )
+    await response_cache.invalidate("products")
+
+    # Validate while the session is still open; followers only get the model
+    return ProductMasterResponse.model_validate(product, from_attributes=True), created
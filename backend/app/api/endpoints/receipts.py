@@ -1,80 +1,154 @@
 """API endpoints for Receipt upload and management."""
 
-from datetime import date, timedelta
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy import select
+from celery.result import AsyncResult
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.api.responses import pydantic_json_response
+from app.core.celery_app import celery_app
 from app.crud import receipt as crud_receipt
 from app.db.session import get_db
 from app.models.inventory_item import InventoryItem
 from app.models.product_master import ProductMaster
 from app.schemas.receipt import (
+    ReceiptBatchItemResult,
+    ReceiptBatchProcessingResponse,
     ReceiptConfirmRequest,
     ReceiptConfirmResponse,
     ReceiptProcessingResponse,
     ReceiptResponse,
+    ReceiptTaskResponse,
+    ReceiptTaskStatusResponse,
 )
+from app.services import response_cache
 from app.services.broadcast_helpers import broadcast_receipt_status
 from app.services.receipt_processing import ReceiptProcessingService
+from app.tasks import process_receipt_batch_task, process_receipt_task
 
 router = APIRouter()
 
-# Allowed file types for receipt upload
-ALLOWED_CONTENT_TYPES = {
-    "image/jpeg",
-    "image/jpg",
-    "image/png",
-    "image/webp",
-    "application/pdf",
-}
+_receipt_list_adapter = TypeAdapter(list[ReceiptResponse])
+
+# Allowed file types for receipt upload, identified by their leading magic
+# bytes and mapped to the extension stored on disk. The client's content type
+# and filename are never trusted, so the OCR service can always dispatch on
+# the extension.
+FILE_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"%PDF-", ".pdf"),
+)
+# Enough for every signature above plus the WebP "RIFF....WEBP" header
+SNIFF_BYTES = 12
+ALLOWED_FILE_TYPES = "JPEG/PNG/WebP/PDF"
+
+# Read uploads in 1 MiB chunks instead of buffering the whole file
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _sniff_extension(head: bytes) -> str | None:
+    """Return the storage extension for a file's leading bytes, if allowed."""
+    # RIFF alone also matches WAV/AVI; WebP is identified at offset 8
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    for signature, extension in FILE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    return None
+
+
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield the uploaded file's content in UPLOAD_CHUNK_SIZE chunks."""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
 
 
 @router.post(
     "/scan", response_model=ReceiptResponse, status_code=status.HTTP_201_CREATED
 )
 async def upload_receipt(
+    request: Request,
+    response: Response,
     file: UploadFile = File(...),
     store_chain: str | None = Form(None),
     purchase_date: date | None = Form(None),
+    batch_id: UUID | None = Form(None),
     db: AsyncSession = Depends(get_db),
 ) -> ReceiptResponse:
     """Upload a receipt image or PDF for processing.
 
     Args:
+        request: Incoming request, used to build the Location header.
+        response: Response carrying the Location header.
         file: The receipt image or PDF file.
         store_chain: Optional store chain name (e.g., "S-Market", "K-Citymarket").
         purchase_date: Optional purchase date.
+        batch_id: Optional client-generated ID grouping receipts for batch processing.
         db: Database session.
 
+    A re-upload of a file already in this batch is not stored again: the
+    existing receipt is returned as-is and the store_chain and purchase_date
+    sent with the duplicate are ignored.
+
     Returns:
-        Created receipt with metadata.
+        Created receipt with metadata (201), or the existing receipt (200) if
+        the same file was already uploaded in this batch.
 
     Raises:
         HTTPException 400: If file type is not supported.
+        HTTPException 409: If the same file's existing receipt was deleted
+            while this upload was being stored.
     """
-    # Validate file type
-    if file.content_type not in ALLOWED_CONTENT_TYPES:
+    # Validate file type from its content before streaming the rest to disk
+    file_extension = _sniff_extension(await file.read(SNIFF_BYTES))
+    if file_extension is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unsupported file type: {file.content_type}. "
-            f"Allowed types: {', '.join(ALLOWED_CONTENT_TYPES)}",
+            detail="Unsupported file type: content is not a recognised "
+            f"{ALLOWED_FILE_TYPES} file",
         )
+    await file.seek(0)
 
-    # Read file content
-    file_content = await file.read()
-
-    # Create receipt with file storage
-    receipt = await crud_receipt.create_receipt(
-        db,
-        file_content=file_content,
-        filename=file.filename or "receipt",
-        store_chain=store_chain,
-        purchase_date=purchase_date,
+    # Create receipt with file storage (a re-upload returns the existing one)
+    try:
+        receipt, created = await crud_receipt.create_receipt(
+            db,
+            file_chunks=_iter_upload(file),
+            file_extension=file_extension,
+            store_chain=store_chain,
+            purchase_date=purchase_date,
+            batch_id=batch_id,
+        )
+    except crud_receipt.DuplicateUploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        ) from e
+
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    response.headers["Location"] = str(
+        request.url_for("get_receipt", receipt_id=str(receipt.id))
     )
-
     return receipt
 
 
@@ -108,24 +182,37 @@ async def get_receipt(
 async def list_receipts(
     status: str | None = None,
     store: str | None = None,
+    limit: int = Query(100, ge=1, le=500, description="Maximum receipts to return"),
+    cursor: str | None = Query(
+        None, description=f"Keyset cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> list[ReceiptResponse]:
-    """Get all receipts with optional filtering.
+    """Get receipts with optional filtering, one keyset page at a time.
 
     Args:
         status: Optional filter by processing_status (e.g., "uploaded", "processing", "completed").
         store: Optional filter by store_chain.
+        limit: Maximum receipts per page.
+        cursor: Cursor returned with the previous page.
         db: Database session.
 
     Returns:
-        List of receipts sorted by created_at (most recent first).
+        List of receipts sorted by created_at (most recent first). A full page
+        sets X-Next-Cursor for fetching the next one.
     """
     receipts = await crud_receipt.get_receipts(
         db,
         status=status,
         store_chain=store,
+        limit=limit,
+        before=decode_cursor(cursor, datetime, UUID) if cursor else None,
     )
-    return receipts
+    headers = {}
+    if len(receipts) == limit:
+        last = receipts[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return pydantic_json_response(_receipt_list_adapter, receipts, headers=headers)
 
 
 @router.post("/{receipt_id}/process", response_model=ReceiptProcessingResponse)
@@ -150,6 +237,8 @@ async def process_receipt(
 
     Raises:
         HTTPException 404: If receipt not found.
+        HTTPException 409: If the receipt is already being processed or has
+            been confirmed.
     """
     # Get receipt
     receipt = await crud_receipt.get_receipt(db, receipt_id)
@@ -159,9 +248,15 @@ async def process_receipt(
             detail=f"Receipt '{receipt_id}' not found",
         )
 
-    # Process receipt
+    # Process receipt (the claim refuses confirmed and in-progress receipts)
     processing_service = ReceiptProcessingService(db)
     result = await processing_service.process_receipt(receipt)
+    if result is None:
+        if receipt.processing_status == "confirmed":
+            detail = f"Receipt '{receipt_id}' has already been confirmed"
+        else:
+            detail = f"Receipt '{receipt_id}' is already being processed"
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
     return ReceiptProcessingResponse(
         success=result.success,
@@ -171,10 +266,154 @@ async def process_receipt(
     )
 
 
+@router.post(
+    "/batches/{batch_id}/process", response_model=ReceiptBatchProcessingResponse
+)
+async def process_receipt_batch(
+    batch_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> ReceiptBatchProcessingResponse:
+    """Process every pending receipt in an upload batch.
+
+    OCR and LLM extraction for all receipts are submitted concurrently, so
+    vLLM batches the prompts instead of serving them one request at a time.
+    Receipts that are already completed, confirmed or in progress are skipped.
+
+    Args:
+        batch_id: Batch ID the receipts were uploaded with.
+        db: Database session.
+
+    Returns:
+        Per-receipt processing results.
+
+    Raises:
+        HTTPException 404: If the batch has no receipts.
+    """
+    processed = await ReceiptProcessingService(db).process_batch(batch_id)
+    if processed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Receipt batch '{batch_id}' not found",
+        )
+
+    return ReceiptBatchProcessingResponse(
+        batch_id=batch_id,
+        results=[
+            ReceiptBatchItemResult(
+                receipt_id=receipt.id,
+                success=result.success,
+                items_extracted=(
+                    len(result.extraction.products) if result.extraction else 0
+                ),
+                items_matched=len(result.matched_products),
+                error=result.error,
+            )
+            for receipt, result in processed
+        ],
+    )
+
+
+@router.post(
+    "/batches/{batch_id}/process/async",
+    response_model=ReceiptTaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def process_receipt_batch_async(
+    batch_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> ReceiptTaskResponse:
+    """Queue an upload batch for processing on the Celery worker.
+
+    The worker submits the batch's extractions together, so vLLM batches
+    them just like the synchronous batch endpoint. Poll
+    ``GET /receipts/tasks/{task_id}`` or listen for ``receipt_status``
+    WebSocket messages for progress.
+
+    Args:
+        batch_id: Batch ID the receipts were uploaded with.
+        db: Database session.
+
+    Returns:
+        Task ID for status polling.
+
+    Raises:
+        HTTPException 404: If the batch has no receipts.
+    """
+    if not await crud_receipt.get_receipts(db, batch_id=batch_id, limit=1):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Receipt batch '{batch_id}' not found",
+        )
+
+    task = process_receipt_batch_task.delay(str(batch_id))
+    return ReceiptTaskResponse(task_id=task.id, status="queued")
+
+
+@router.post(
+    "/{receipt_id}/process/async",
+    response_model=ReceiptTaskResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def process_receipt_async(
+    receipt_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> ReceiptTaskResponse:
+    """Queue a receipt for processing on the Celery worker.
+
+    Returns immediately; poll ``GET /receipts/tasks/{task_id}`` or listen for
+    ``receipt_status`` WebSocket messages for progress.
+
+    Args:
+        receipt_id: Receipt UUID to process.
+        db: Database session.
+
+    Returns:
+        Task ID for status polling.
+
+    Raises:
+        HTTPException 404: If receipt not found.
+    """
+    receipt = await crud_receipt.get_receipt(db, receipt_id)
+    if not receipt:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Receipt '{receipt_id}' not found",
+        )
+
+    task = process_receipt_task.delay(str(receipt_id))
+    return ReceiptTaskResponse(task_id=task.id, status="queued")
+
+
+@router.get("/tasks/{task_id}", response_model=ReceiptTaskStatusResponse)
+def get_processing_task(task_id: str) -> ReceiptTaskStatusResponse:
+    """Get the state of a background receipt processing task.
+
+    Sync handler: the Celery result backend client is blocking, so FastAPI
+    runs this in its threadpool.
+
+    Args:
+        task_id: Celery task ID returned by the async process endpoint.
+
+    Returns:
+        Task state, plus the processing result once finished.
+    """
+    task = AsyncResult(task_id, app=celery_app)
+    if task.successful():
+        return ReceiptTaskStatusResponse(
+            task_id=task_id, state=task.state, result=task.result
+        )
+    if task.failed():
+        return ReceiptTaskStatusResponse(
+            task_id=task_id, state=task.state, error=str(task.result)
+        )
+    return ReceiptTaskStatusResponse(task_id=task_id, state=task.state)
+
+
 @router.post("/{receipt_id}/confirm", response_model=ReceiptConfirmResponse)
 async def confirm_receipt(
     receipt_id: UUID,
     confirm_request: ReceiptConfirmRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> ReceiptConfirmResponse:
     """Confirm extracted receipt items and create inventory.
@@ -186,6 +425,7 @@ async def confirm_receipt(
     Args:
         receipt_id: Receipt UUID to confirm.
         confirm_request: List of confirmed items to add to inventory.
+        background_tasks: Runs the status broadcast after the response.
         db: Database session.
 
     Returns:
@@ -204,48 +444,50 @@ async def confirm_receipt(
         )
 
     try:
-        items_created = 0
-
+        # Validate all products and fetch their shelf lives in one query
+        product_ids = {item.product_id for item in confirm_request.items}
+        result = await db.execute(
+            select(ProductMaster.id, ProductMaster.default_shelf_life_days).where(
+                ProductMaster.id.in_(product_ids)
+            )
+        )
+        shelf_life_days = dict(result.all())
         for item in confirm_request.items:
-            # Validate product exists
-            stmt = select(ProductMaster).where(ProductMaster.id == item.product_id)
-            result = await db.execute(stmt)
-            product = result.scalar_one_or_none()
-
-            if not product:
+            if item.product_id not in shelf_life_days:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Product '{item.product_id}' not found",
                 )
 
-            # Calculate expiry date
-            expiry_date = item.purchase_date + timedelta(
-                days=product.default_shelf_life_days
-            )
-
-            # Create inventory item
-            inventory_item = InventoryItem(
-                product_master_id=item.product_id,
-                receipt_id=receipt_id,
-                initial_quantity=item.quantity,
-                current_quantity=item.quantity,
-                unit=item.unit,
-                status="sealed",
-                purchase_date=item.purchase_date,
-                expiry_date=expiry_date,
-                expiry_source="calculated",
-                location="main_fridge",  # Default location
-            )
-
-            db.add(inventory_item)
-            items_created += 1
+        rows = [
+            {
+                "product_master_id": item.product_id,
+                "receipt_id": receipt_id,
+                "initial_quantity": item.quantity,
+                "current_quantity": item.quantity,
+                "unit": item.unit,
+                "status": "sealed",
+                "purchase_date": item.purchase_date,
+                "expiry_date": item.purchase_date
+                + timedelta(days=shelf_life_days[item.product_id]),
+                "expiry_source": "calculated",
+                "location": "main_fridge",  # Default location
+            }
+            for item in confirm_request.items
+        ]
+        # One executemany INSERT instead of a flush per object
+        if rows:
+            await db.execute(insert(InventoryItem), rows)
+        items_created = len(rows)
 
         # Update receipt status
         receipt.processing_status = "confirmed"
         await db.commit()
+        await response_cache.invalidate("inventory")
 
-        # Broadcast confirmed status
-        await broadcast_receipt_status(
+        # Broadcast confirmed status after the response is sent
+        background_tasks.add_task(
+            broadcast_receipt_status,
             receipt_id=receipt.id,
             status="confirmed",
             items_extracted=receipt.items_extracted,
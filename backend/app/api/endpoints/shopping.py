@@ -1,10 +1,22 @@
 """Shopping list API endpoints."""
 
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+)
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.api.responses import json_bytes_response, pydantic_json_response
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.crud.shopping_list_item import shopping_list_item
 from app.db.session import get_db
@@ -12,26 +24,35 @@ from app.schemas.shopping_list_item import (
     ShoppingListItemCreate,
     ShoppingListItemResponse,
     ShoppingListItemUpdate,
+    ShoppingPriority,
 )
+from app.services import response_cache
 from app.services.broadcast_helpers import broadcast_shopping_list_update
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+_shopping_list_adapter = TypeAdapter(list[ShoppingListItemResponse])
+
 
 @router.get("/", response_model=list[ShoppingListItemResponse])
 async def get_shopping_list(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum items to return"),
-    priority: str | None = Query(
+    priority: ShoppingPriority | None = Query(
         None, description="Filter by priority: urgent, normal, low"
     ),
     include_purchased: bool = Query(False, description="Include purchased items"),
+    cursor: str | None = Query(
+        None, description=f"Keyset cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """Get shopping list items with optional filtering.
 
     By default, only returns unpurchased items ordered by priority (urgent first).
+    A full page sets the X-Next-Cursor header; pass it back as ``cursor`` to
+    fetch the next page without an OFFSET scan.
     """
     logger.info(
         "get_shopping_list",
@@ -49,9 +70,17 @@ async def get_shopping_list(
         limit=limit,
         priority=priority,
         include_purchased=include_purchased,
+        after=decode_cursor(cursor, int, datetime, UUID) if cursor else None,
     )
 
-    return items
+    headers = {}
+    if len(items) == limit:
+        last = items[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            last.priority_rank, last.added_at, last.id
+        )
+
+    return pydantic_json_response(_shopping_list_adapter, items, headers=headers)
 
 
 @router.get("/urgent", response_model=list[ShoppingListItemResponse])
@@ -60,12 +89,20 @@ async def get_urgent_items(
 ):
     """Get all urgent unpurchased items.
 
-    Useful for quick access to critical shopping items.
+    Useful for quick access to critical shopping items. Dashboards poll this,
+    so the body is cached for URGENT_ITEMS_CACHE_TTL; shopping writes
+    invalidate it.
     """
     logger.info("get_urgent_items")
 
-    items = await shopping_list_item.get_urgent_items(db)
-    return items
+    body = await response_cache.cached_json(
+        "shopping",
+        "urgent",
+        _shopping_list_adapter,
+        lambda: shopping_list_item.get_urgent_items(db),
+        ttl=settings.URGENT_ITEMS_CACHE_TTL,
+    )
+    return json_bytes_response(body)
 
 
 @router.get("/{item_id}", response_model=ShoppingListItemResponse)
@@ -91,6 +128,7 @@ async def get_shopping_item(
 )
 async def create_shopping_item(
     item_in: ShoppingListItemCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new shopping list item.
@@ -108,24 +146,12 @@ async def create_shopping_item(
         },
     )
 
-    # Validate priority
-    if item_in.priority not in ["urgent", "normal", "low"]:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid priority: {item_in.priority}. Must be urgent, normal, or low.",
-        )
-
-    # Validate source
-    if item_in.source not in ["manual", "auto_restock", "recipe"]:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid source: {item_in.source}. Must be manual, auto_restock, or recipe.",
-        )
-
     item = await shopping_list_item.create(db, obj_in=item_in)
+    await response_cache.invalidate("shopping")
 
     # Broadcast creation
-    await broadcast_shopping_list_update(
+    background_tasks.add_task(
+        broadcast_shopping_list_update,
         shopping_list_item_id=item.id,
         action="created",
         name=item.name,
@@ -142,6 +168,7 @@ async def create_shopping_item(
 async def update_shopping_item(
     item_id: UUID,
     item_in: ShoppingListItemUpdate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Update a shopping list item.
@@ -157,17 +184,12 @@ async def update_shopping_item(
             detail=f"Shopping list item {item_id} not found",
         )
 
-    # Validate priority if being updated
-    if item_in.priority and item_in.priority not in ["urgent", "normal", "low"]:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Invalid priority: {item_in.priority}. Must be urgent, normal, or low.",
-        )
-
     updated_item = await shopping_list_item.update(db, db_obj=item, obj_in=item_in)
+    await response_cache.invalidate("shopping")
 
     # Broadcast update
-    await broadcast_shopping_list_update(
+    background_tasks.add_task(
+        broadcast_shopping_list_update,
         shopping_list_item_id=updated_item.id,
         action="updated",
         name=updated_item.name,
@@ -183,6 +205,7 @@ async def update_shopping_item(
 @router.post("/{item_id}/purchase", response_model=ShoppingListItemResponse)
 async def mark_item_purchased(
     item_id: UUID,
+    background_tasks: BackgroundTasks,
     purchased: bool = Query(
         True, description="Mark as purchased (true) or unpurchased (false)"
     ),
@@ -206,9 +229,11 @@ async def mark_item_purchased(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Shopping list item {item_id} not found",
         )
+    await response_cache.invalidate("shopping")
 
     # Broadcast purchase status change
-    await broadcast_shopping_list_update(
+    background_tasks.add_task(
+        broadcast_shopping_list_update,
         shopping_list_item_id=item.id,
         action="purchased",
         name=item.name,
@@ -224,6 +249,7 @@ async def mark_item_purchased(
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_shopping_item(
     item_id: UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a shopping list item."""
@@ -243,9 +269,11 @@ async def delete_shopping_item(
     item_priority = item.priority
 
     await shopping_list_item.remove(db, id=item_id)
+    await response_cache.invalidate("shopping")
 
     # Broadcast deletion
-    await broadcast_shopping_list_update(
+    background_tasks.add_task(
+        broadcast_shopping_list_update,
         shopping_list_item_id=item_id,
         action="deleted",
         name=item_name,
@@ -1,6 +1,6 @@
 """WebSocket endpoint for real-time updates."""
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket
 
 from app.core.logging import get_logger
 from app.services.websockets import manager
@@ -30,18 +30,15 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         logger.info("websocket_client_connected")
 
-        # Keep connection alive and handle incoming messages
-        while True:
-            # Receive messages (for potential future client-to-server communication)
-            data = await websocket.receive_text()
-            logger.debug("websocket_message_received", extra={"data": data})
+        # Updates are server-to-client only, so just wait for the disconnect.
+        # Keep-alive ping/pong frames are answered by uvicorn itself
+        # (--ws-ping-interval), so an idle client costs no Python wakeups.
+        # Raw receive() skips decoding any stray client frames.
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
 
-            # Currently, we only broadcast server-to-client
-            # Future: could implement ping/pong or client commands here
-
-    except WebSocketDisconnect:
         logger.info("websocket_client_disconnected")
-        manager.disconnect(websocket)
     except Exception as e:
         logger.error("websocket_error", extra={"error": str(e)}, exc_info=True)
+    finally:
         manager.disconnect(websocket)
@@ -0,0 +1,58 @@
+"""Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row on a page. The next page
+filters on ``(sort key) > cursor`` instead of using OFFSET, so Postgres
+does not have to scan and discard all the earlier rows.
+"""
+
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*parts: Any) -> str:
+    """Encode sort key values into an opaque URL-safe cursor.
+
+    Args:
+        parts: Sort key values of the last row (datetimes, UUIDs, ints).
+
+    Returns:
+        Base64 cursor string.
+    """
+    raw = "|".join(
+        part.isoformat() if isinstance(part, datetime) else str(part) for part in parts
+    )
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from the client.
+        types: Expected type of each part, in order.
+
+    Returns:
+        Tuple of parsed sort key values.
+
+    Raises:
+        HTTPException 400: If the cursor is malformed.
+    """
+    try:
+        parts = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        if len(parts) != len(types):
+            raise ValueError("wrong number of cursor parts")
+        return tuple(
+            datetime.fromisoformat(part) if type_ is datetime else type_(part)
+            for part, type_ in zip(parts, types, strict=True)
+        )
+    except (ValueError, binascii.Error, UnicodeDecodeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
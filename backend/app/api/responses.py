@@ -0,0 +1,56 @@
+"""Pre-serialized JSON responses for large or hand-built payloads."""
+
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+def pydantic_json_response(
+    adapter: TypeAdapter,
+    value: Any,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serialize a value with Pydantic's Rust serializer and wrap it in a Response.
+
+    Skips FastAPI's response_model round trip (re-validation plus
+    ``jsonable_encoder`` on older releases), which dominates on list payloads.
+    Accepts ORM objects and cached dicts alike.
+
+    Args:
+        adapter: TypeAdapter for the endpoint's response model.
+        value: ORM object(s) or plain data matching the response model.
+        status_code: HTTP status code.
+        headers: Extra response headers.
+
+    Returns:
+        Response with the JSON-encoded body.
+    """
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return json_bytes_response(body, status_code=status_code, headers=headers)
+
+
+def json_bytes_response(
+    body: bytes,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Wrap an already-encoded JSON body (e.g. a cached payload) in a Response.
+
+    Args:
+        body: JSON bytes.
+        status_code: HTTP status code.
+        headers: Extra response headers.
+
+    Returns:
+        Response with the given body.
+    """
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -11,6 +11,8 @@ ENV_FILE = PROJECT_ROOT / ".env"
 class Settings(BaseSettings):
     # Application
     DEBUG: bool = False
+    # Time functions decorated with @log_performance (read at import time)
+    PERF_LOGGING: bool = False
 
     # Database
     POSTGRES_SERVER: str
@@ -23,10 +25,33 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
 
+    # Connection pool (per process; size for uvicorn workers x concurrency)
+    DB_POOL_SIZE: int = 15
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    # Prepared statements cached per connection by asyncpg / SQLAlchemy's adapter
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+
     # Redis
     REDIS_HOST: str
     REDIS_PORT: int = 6379
 
+    # Redis response cache for GET endpoints
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: int = 60  # seconds
+    URGENT_ITEMS_CACHE_TTL: int = 30  # polled by dashboards, rarely changes
+
+    # Receipt uploads: open stored files with O_DSYNC so every write is on
+    # stable storage before the upload returns (no separate fsync)
+    RECEIPT_DURABLE_WRITE: bool = False
+    # A receipt left in "processing" longer than this (worker crash, cancelled
+    # request) may be claimed again
+    RECEIPT_PROCESSING_TIMEOUT: int = 1800  # seconds
+
+    # WebSocket: messages buffered per client before the oldest are dropped
+    WS_CLIENT_QUEUE_SIZE: int = 100
+
     # CORS — comma-separated list of allowed origins, e.g.
     # ALLOWED_ORIGINS=http://localhost:3000,http://192.168.0.10:17301
     ALLOWED_ORIGINS: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -49,9 +74,18 @@ class Settings(BaseSettings):
     LLM_API_KEY: str = "ollama"  # Default for local Ollama
     LLM_MODEL: str = "qwen3-8B"  # Qwen3 8B model for receipt extraction
     LLM_TEMPERATURE: float = 0.1
+    LLM_TIMEOUT: float = 300.0  # seconds per extraction request
+    LLM_MAX_CONCURRENCY: int = 32  # in-flight OCR+LLM extractions per batch
+    # vLLM guided decoding: constrains output to the ReceiptExtraction schema.
+    # Off by default; response_format json_schema caused thinking loops with
+    # the current model, so enable only once verified against the deployment.
+    LLM_GUIDED_JSON: bool = False
+    LLM_GUIDED_DECODING_BACKEND: str = "xgrammar"
 
     # Open Food Facts API
     OPENFOODFACTS_API_URL: str = "https://world.openfoodfacts.org/api/v2"
+    OFF_TIMEOUT: float = 5.0  # seconds; bounds how long a scan waits on OFF
+    OFF_CONNECT_TIMEOUT: float = 2.0
 
     # Fuzzy matching thresholds
     FUZZY_MATCH_THRESHOLD: int = 80  # Minimum score (0-100) for fuzzy match
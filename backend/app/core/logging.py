@@ -1,19 +1,39 @@
-import json
+import atexit
+import copy
+import functools
+import inspect
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
-from datetime import UTC, datetime
+import time
 from pathlib import Path
 
+import orjson
+
 from .config import settings
 
+_JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+# Optional record attributes (set via ``extra=``) and their JSON keys
+_EXTRA_FIELDS = (
+    ("user_id", "user_id"),
+    ("request_id", "request_id"),
+    ("operation", "operation"),
+    ("duration", "duration_ms"),
+)
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
 
     def format(self, record: logging.LogRecord) -> str:
+        # record.created is already set by logging; format it directly as
+        # UTC ISO 8601 instead of building a datetime per record
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
         log_entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": f"{timestamp}.{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,17 +43,10 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add extra fields if they exist
-        if hasattr(record, "user_id"):
-            log_entry["user_id"] = record.user_id
-
-        if hasattr(record, "request_id"):
-            log_entry["request_id"] = record.request_id
-
-        if hasattr(record, "operation"):
-            log_entry["operation"] = record.operation
-
-        if hasattr(record, "duration"):
-            log_entry["duration_ms"] = record.duration
+        attrs = record.__dict__
+        for attr, key in _EXTRA_FIELDS:
+            if attr in attrs:
+                log_entry[key] = attrs[attr]
 
         # Add exception info if present
         if record.exc_info:
@@ -43,7 +56,58 @@ class JSONFormatter(logging.Formatter):
         if record.stack_info:
             log_entry["stack_info"] = self.formatStack(record.stack_info)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        # orjson emits UTF-8 directly (no ASCII escaping); str() covers
+        # extras it can't encode (e.g. Decimal)
+        return orjson.dumps(log_entry, default=str, option=_JSON_OPTIONS).decode()
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock ``prepare`` formats the record on the calling thread and drops
+    ``exc_info``; this one only freezes the message so the JSON formatter
+    still sees the original record fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _start_file_listener(handler: logging.Handler) -> logging.Handler:
+    """Run a handler on a background thread, returning the handler to attach.
+
+    Args:
+        handler: Handler that does the actual (formatting and) writing.
+
+    Returns:
+        QueueHandler that enqueues records for the listener thread.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for old_handler in _queue_listener.handlers:
+            old_handler.close()
+    else:
+        atexit.register(_stop_file_listener)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    return _DeferredQueueHandler(log_queue)
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
 
 
 def setup_logging():
@@ -60,6 +124,17 @@ def setup_logging():
 
     log_dir.mkdir(exist_ok=True, parents=True)
 
+    # app.log receives most records, so JSON formatting and the file write
+    # happen on a listener thread; request code only enqueues the record
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "app.log",
+        maxBytes=10485760,  # 10MB
+        backupCount=5,
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(JSONFormatter())
+    queue_handler = _start_file_listener(file_handler)
+
     logging_config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -77,12 +152,8 @@ def setup_logging():
                 "stream": sys.stdout,
             },
             "file": {
-                "class": "logging.handlers.RotatingFileHandler",
+                "()": lambda: queue_handler,
                 "level": "INFO",
-                "formatter": "json",
-                "filename": str(log_dir / "app.log"),
-                "maxBytes": 10485760,  # 10MB
-                "backupCount": 5,
             },
             "error_file": {
                 "class": "logging.handlers.RotatingFileHandler",
@@ -124,89 +195,66 @@ def setup_logging():
     logging.config.dictConfig(logging_config)
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name"""
     return logging.getLogger(f"app.{name}")
 
 
-class LoggerMixin:
-    """Mixin class to add logging capabilities to any class"""
-
-    @property
-    def logger(self) -> logging.Logger:
-        return get_logger(self.__class__.__name__)
-
-
 # Performance logging decorator
 def log_performance(operation: str):
-    """Decorator to log operation performance"""
+    """Decorator to log operation performance.
+
+    Returns the function unchanged unless ``settings.PERF_LOGGING`` is enabled
+    when it is decorated, so hot paths pay nothing for it in production.
+    """
 
     def decorator(func):
-        import asyncio
-        import functools
-        import time
+        if not settings.PERF_LOGGING:
+            return func
+
+        logger = get_logger("performance")
+        success_extra = {"operation": operation, "status": "success"}
+        error_extra = {"operation": operation, "status": "error"}
+
+        def log_success(start: int) -> None:
+            duration = (time.perf_counter_ns() - start) / 1_000_000
+            logger.info(
+                "Operation completed successfully",
+                extra=success_extra | {"duration": duration},
+            )
+
+        def log_failure(start: int, error: Exception) -> None:
+            duration = (time.perf_counter_ns() - start) / 1_000_000
+            logger.error(
+                "Operation failed: %s",
+                error,
+                extra=error_extra | {"duration": duration, "error": str(error)},
+            )
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            logger = get_logger("performance")
-            start_time = time.time()
-
+            start = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
-                duration = (time.time() - start_time) * 1000
-                logger.info(
-                    "Operation completed successfully",
-                    extra={
-                        "operation": operation,
-                        "duration": duration,
-                        "status": "success",
-                    },
-                )
-                return result
             except Exception as e:
-                duration = (time.time() - start_time) * 1000
-                logger.error(
-                    f"Operation failed: {str(e)}",
-                    extra={
-                        "operation": operation,
-                        "duration": duration,
-                        "status": "error",
-                        "error": str(e),
-                    },
-                )
+                log_failure(start, e)
                 raise
+            log_success(start)
+            return result
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            logger = get_logger("performance")
-            start_time = time.time()
-
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration = (time.time() - start_time) * 1000
-                logger.info(
-                    "Operation completed successfully",
-                    extra={
-                        "operation": operation,
-                        "duration": duration,
-                        "status": "success",
-                    },
-                )
-                return result
             except Exception as e:
-                duration = (time.time() - start_time) * 1000
-                logger.error(
-                    f"Operation failed: {str(e)}",
-                    extra={
-                        "operation": operation,
-                        "duration": duration,
-                        "status": "error",
-                        "error": str(e),
-                    },
-                )
+                log_failure(start, e)
                 raise
+            log_success(start)
+            return result
 
-        if asyncio.iscoroutinefunction(func):
+        if inspect.iscoroutinefunction(func):
             return async_wrapper
         else:
             return sync_wrapper
@@ -1,7 +1,7 @@
 from typing import Any, Generic, TypeVar
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -23,8 +23,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         self.model = model
 
     async def get(self, db: AsyncSession, id: Any) -> ModelType | None:
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        return result.scalars().first()
+        return await db.get(self.model, id)
 
     async def get_multi(
         self, db: AsyncSession, *, skip: int = 0, limit: int = 100
@@ -33,11 +32,11 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)  # type: ignore
-        db.add(db_obj)
+        # INSERT ... RETURNING yields the stored row without a refresh SELECT
+        db_obj = await db.scalar(
+            insert(self.model).values(**obj_in.model_dump()).returning(self.model)
+        )
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def update(
@@ -47,22 +46,31 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: UpdateSchemaType | dict[str, Any],
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
+            update_data = obj_in.model_dump(exclude_unset=True)
+        columns = self.model.__table__.columns
+        update_data = {
+            field: value for field, value in update_data.items() if field in columns
+        }
+        if not update_data:
+            return db_obj
+
+        # UPDATE ... RETURNING refreshes db_obj in the same round trip
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**update_data)
+            .returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        db_obj = result.scalar_one()
         await db.commit()
-        await db.refresh(db_obj)
         return db_obj
 
     async def remove(self, db: AsyncSession, *, id: int) -> ModelType:
-        result = await db.execute(select(self.model).filter(self.model.id == id))
-        obj = result.scalars().first()
+        obj = await db.get(self.model, id)
         await db.delete(obj)
         await db.commit()
         return obj
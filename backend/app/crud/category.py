@@ -1,11 +1,14 @@
 """CRUD operations for Category model."""
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
+# Built once; lambda statements skip rebuilding the SELECT and its cache key
+_CATEGORIES_STMT = lambda_stmt(lambda: select(Category).order_by(Category.sort_order))
+
 
 async def get_categories(db: AsyncSession) -> list[Category]:
     """Get all categories sorted by sort_order.
@@ -16,7 +19,7 @@ async def get_categories(db: AsyncSession) -> list[Category]:
     Returns:
         List of all categories.
     """
-    result = await db.execute(select(Category).order_by(Category.sort_order))
+    result = await db.execute(_CATEGORIES_STMT)
     return list(result.scalars().all())
 
 
@@ -30,8 +33,7 @@ async def get_category(db: AsyncSession, category_id: str) -> Category | None:
     Returns:
         Category if found, None otherwise.
     """
-    result = await db.execute(select(Category).where(Category.id == category_id))
-    return result.scalar_one_or_none()
+    return await db.get(Category, category_id)
 
 
 async def create_category(db: AsyncSession, category: CategoryCreate) -> Category:
@@ -50,7 +52,6 @@ async def create_category(db: AsyncSession, category: CategoryCreate) -> Categor
     db_category = Category(**category.model_dump())
     db.add(db_category)
     await db.commit()
-    await db.refresh(db_category)
     return db_category
 
 
@@ -67,17 +68,20 @@ async def update_category(
     Returns:
         Updated category if found, None otherwise.
     """
-    db_category = await get_category(db, category_id)
-    if not db_category:
-        return None
-
     # Update only provided fields
     update_data = category_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_category, field, value)
-
+    if not update_data:
+        return await get_category(db, category_id)
+
+    # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+    result = await db.execute(
+        update(Category)
+        .where(Category.id == category_id)
+        .values(**update_data)
+        .returning(Category)
+    )
+    db_category = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_category)
     return db_category
 
 
@@ -91,10 +95,9 @@ async def delete_category(db: AsyncSession, category_id: str) -> bool:
     Returns:
         True if deleted, False if not found.
     """
-    db_category = await get_category(db, category_id)
-    if not db_category:
-        return False
-
-    await db.delete(db_category)
+    result = await db.execute(
+        delete(Category).where(Category.id == category_id).returning(Category.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
+    return deleted
@@ -4,12 +4,38 @@ from datetime import date, timedelta
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Numeric,
+    Uuid,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    update,
+)
+from sqlalchemy import values as sql_values
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.inventory_item import InventoryItem
+from app.models.product_master import ProductMaster
 from app.schemas.inventory_item import InventoryItemCreate, InventoryItemUpdate
 
+# Items with less than this share of their initial quantity left are "partial"
+PARTIAL_RATIO = 0.75
+
+
+class ProductNotFoundError(Exception):
+    """Raised when an inventory item references a product that does not exist."""
+
+    def __init__(self, product_id: UUID):
+        self.product_id = product_id
+        super().__init__(f"Product with ID '{product_id}' not found")
+
 
 async def get_inventory_items(
     db: AsyncSession,
@@ -28,19 +54,25 @@ async def get_inventory_items(
     Returns:
         List of inventory items matching the filters.
     """
-    query = select(InventoryItem)
+    # Lambda statements are cached per combination of filters; the filter
+    # values become bound parameters
+    query = lambda_stmt(
+        lambda: select(InventoryItem).options(
+            selectinload(InventoryItem.product_master)
+        )
+    )
 
     if location:
-        query = query.where(InventoryItem.location == location)
+        query += lambda s: s.where(InventoryItem.location == location)
 
     if status:
-        query = query.where(InventoryItem.status == status)
+        query += lambda s: s.where(InventoryItem.status == status)
 
     if expiring_days is not None:
         expiry_threshold = date.today() + timedelta(days=expiring_days)
-        query = query.where(InventoryItem.expiry_date <= expiry_threshold)
+        query += lambda s: s.where(InventoryItem.expiry_date <= expiry_threshold)
 
-    query = query.order_by(InventoryItem.expiry_date)
+    query += lambda s: s.order_by(InventoryItem.expiry_date)
 
     result = await db.execute(query)
     return list(result.scalars().all())
@@ -54,10 +86,12 @@ async def get_inventory_item(db: AsyncSession, item_id: UUID) -> InventoryItem |
         item_id: Inventory item UUID.
 
     Returns:
-        Inventory item if found, None otherwise.
+        Inventory item (with product_master loaded) if found, None otherwise.
     """
-    result = await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
-    return result.scalar_one_or_none()
+    # session.get checks the identity map before compiling a query
+    return await db.get(
+        InventoryItem, item_id, options=[joinedload(InventoryItem.product_master)]
+    )
 
 
 async def create_inventory_item(
@@ -73,15 +107,71 @@ async def create_inventory_item(
         Created inventory item.
 
     Raises:
-        IntegrityError: If foreign key constraint fails (invalid product_master_id).
+        ProductNotFoundError: If product_master_id does not reference a product.
     """
-    db_item = InventoryItem(**item.model_dump())
-    db.add(db_item)
+    # Check the FK up front: a cheap PK probe instead of an aborted transaction
+    product_exists = await db.scalar(
+        select(1).where(ProductMaster.id == item.product_master_id)
+    )
+    if product_exists is None:
+        raise ProductNotFoundError(item.product_master_id)
+
+    # RETURNING brings back server-side column values with the insert; the
+    # relationship is eager-loaded since lazy-loading it raises under asyncio
+    db_item = await db.scalar(
+        insert(InventoryItem)
+        .values(**item.model_dump())
+        .returning(InventoryItem)
+        .options(selectinload(InventoryItem.product_master))
+    )
     await db.commit()
-    await db.refresh(db_item)
     return db_item
 
 
+async def create_inventory_items(
+    db: AsyncSession, items: list[InventoryItemCreate]
+) -> list[InventoryItem]:
+    """Create many inventory items in one transaction.
+
+    All referenced products are checked with a single query, then every row
+    is written by one ``INSERT ... RETURNING`` instead of a flush and
+    reload per item.
+
+    Args:
+        db: Database session.
+        items: Inventory items to create.
+
+    Returns:
+        Created inventory items (with product_master loaded), in input order.
+
+    Raises:
+        ProductNotFoundError: If any product_master_id does not reference a
+            product.
+    """
+    if not items:
+        return []
+
+    product_ids = {item.product_master_id for item in items}
+    result = await db.execute(
+        select(ProductMaster.id).where(ProductMaster.id.in_(product_ids))
+    )
+    missing = product_ids - set(result.scalars().all())
+    if missing:
+        raise ProductNotFoundError(
+            next(i.product_master_id for i in items if i.product_master_id in missing)
+        )
+
+    result = await db.scalars(
+        insert(InventoryItem)
+        .returning(InventoryItem, sort_by_parameter_order=True)
+        .options(selectinload(InventoryItem.product_master)),
+        [item.model_dump() for item in items],
+    )
+    created = list(result.all())
+    await db.commit()
+    return created
+
+
 async def update_inventory_item(
     db: AsyncSession, item_id: UUID, item_update: InventoryItemUpdate
 ) -> InventoryItem | None:
@@ -95,17 +185,22 @@ async def update_inventory_item(
     Returns:
         Updated inventory item if found, None otherwise.
     """
-    db_item = await get_inventory_item(db, item_id)
-    if not db_item:
-        return None
-
     # Update only provided fields
     update_data = item_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_item, field, value)
-
+    if not update_data:
+        return await get_inventory_item(db, item_id)
+
+    # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh;
+    # product_master is still eager-loaded for the response and broadcast
+    result = await db.execute(
+        update(InventoryItem)
+        .where(InventoryItem.id == item_id)
+        .values(**update_data)
+        .returning(InventoryItem)
+        .options(selectinload(InventoryItem.product_master))
+    )
+    db_item = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_item)
     return db_item
 
 
@@ -119,13 +214,14 @@ async def delete_inventory_item(db: AsyncSession, item_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found.
     """
-    db_item = await get_inventory_item(db, item_id)
-    if not db_item:
-        return False
-
-    await db.delete(db_item)
+    result = await db.execute(
+        delete(InventoryItem)
+        .where(InventoryItem.id == item_id)
+        .returning(InventoryItem.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
+    return deleted
 
 
 async def get_active_items_by_product(
@@ -175,25 +271,120 @@ async def consume_inventory_item(
             f"Cannot consume {quantity} - only {db_item.current_quantity} available"
         )
 
-    # Calculate new quantity
     new_quantity = db_item.current_quantity - quantity
-    db_item.current_quantity = new_quantity
-
-    # Update status based on quantity
-    if new_quantity == 0:
-        db_item.status = "empty"
-    elif new_quantity < db_item.initial_quantity:
-        # If item was sealed and we're consuming from it, mark as opened and set date
-        if db_item.status == "sealed":
-            db_item.opened_date = date.today()
-
-        # Determine if partial or just opened based on remaining percentage
-        remaining_percentage = (new_quantity / db_item.initial_quantity) * 100
-        if remaining_percentage < 75:  # Less than 75% remaining
-            db_item.status = "partial"
-        else:
-            db_item.status = "opened"
-
+    # Decimal stays on the stored value; the status branches only need a float
+    ratio = (
+        float(new_quantity) / float(db_item.initial_quantity)
+        if db_item.initial_quantity
+        else 0.0
+    )
+    changes = {
+        "current_quantity": new_quantity,
+        "status": (
+            "empty"
+            if new_quantity == 0
+            else "partial"
+            if ratio < PARTIAL_RATIO
+            else "opened"
+            if ratio < 1.0
+            else db_item.status
+        ),
+    }
+    # Consuming from a sealed item opens it
+    if db_item.status == "sealed" and 0 < ratio < 1.0:
+        changes["opened_date"] = date.today()
+
+    # UPDATE ... RETURNING reloads the stored row (quantity rounded to
+    # NUMERIC(10, 2)) in the same round trip, instead of a refresh SELECT
+    product = db_item.product_master
+    result = await db.execute(
+        update(InventoryItem)
+        .where(InventoryItem.id == item_id)
+        .values(**changes)
+        .returning(InventoryItem),
+        execution_options={"populate_existing": True},
+    )
+    db_item = result.scalar_one()
+    # populate_existing resets the lazy relationship; the product is unchanged
+    set_committed_value(db_item, "product_master", product)
     await db.commit()
-    await db.refresh(db_item)
     return db_item
+
+
+async def consume_inventory_items_bulk(
+    db: AsyncSession, consumptions: list[tuple[UUID, Decimal]]
+) -> list[InventoryItem]:
+    """Consume from many inventory items in a single UPDATE ... FROM (VALUES ...).
+
+    Applies the same quantity and status rules as ``consume_inventory_item``
+    but in one round trip. The batch is all-or-nothing.
+
+    Args:
+        db: Database session.
+        consumptions: (item_id, quantity) pairs; each item may appear once.
+
+    Returns:
+        Updated inventory items, in the order given.
+
+    Raises:
+        ValueError: If an item is missing, listed twice, or has less than the
+            requested quantity available. Nothing is consumed in that case.
+    """
+    if not consumptions:
+        return []
+
+    item_ids = [item_id for item_id, _ in consumptions]
+    if len(set(item_ids)) != len(item_ids):
+        raise ValueError("Each inventory item may only be consumed once per batch")
+
+    consumed = sql_values(
+        column("item_id", Uuid),
+        column("quantity", Numeric(10, 2)),
+        name="consumed",
+    ).data(consumptions)
+    new_quantity = InventoryItem.current_quantity - consumed.c.quantity
+    is_opening = new_quantity < InventoryItem.initial_quantity
+
+    result = await db.execute(
+        update(InventoryItem)
+        .where(
+            InventoryItem.id == consumed.c.item_id,
+            InventoryItem.current_quantity >= consumed.c.quantity,
+        )
+        .values(
+            current_quantity=new_quantity,
+            status=case(
+                (new_quantity == 0, "empty"),
+                (
+                    new_quantity < InventoryItem.initial_quantity * PARTIAL_RATIO,
+                    "partial",
+                ),
+                (is_opening, "opened"),
+                else_=InventoryItem.status,
+            ),
+            opened_date=case(
+                (
+                    (InventoryItem.status == "sealed")
+                    & is_opening
+                    & (new_quantity > 0),
+                    func.current_date(),
+                ),
+                else_=InventoryItem.opened_date,
+            ),
+        )
+        .returning(InventoryItem)
+        .options(selectinload(InventoryItem.product_master)),
+        execution_options={"populate_existing": True},
+    )
+    updated = {item.id: item for item in result.scalars()}
+
+    rejected = [str(item_id) for item_id in item_ids if item_id not in updated]
+    if rejected:
+        await db.rollback()
+        raise ValueError(
+            "Cannot consume from inventory items (missing or insufficient "
+            f"quantity): {', '.join(rejected)}"
+        )
+
+    await db.commit()
+    return [updated[item_id] for item_id in item_ids]
@@ -1,14 +1,35 @@
 """CRUD operations for ProductMaster model."""
 
-from uuid import UUID
+from datetime import datetime
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete, func, lambda_stmt, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.category import Category
 from app.models.product_master import ProductMaster
+from app.models.shopping_list_item import ShoppingListItem
 from app.schemas.product_master import ProductMasterCreate, ProductMasterUpdate
 
+# Rows per INSERT statement; keeps bulk upserts under Postgres' bind-parameter cap
+BULK_UPSERT_BATCH_SIZE = 500
+
+# Storage type for products created from OFF data, by category
+STORAGE_TYPE_BY_CATEGORY = {
+    "dairy": "refrigerator",
+    "meat": "refrigerator",
+    "seafood": "refrigerator",
+    "produce": "refrigerator",
+    "frozen": "freezer",
+    "bakery": "pantry",
+    "beverages": "refrigerator",
+    "snacks": "pantry",
+    "condiments": "pantry",
+    "grains": "pantry",
+    "pantry": "pantry",
+}
+
 
 def _unit_type(unit: str) -> str:
     """Derive SQLAlchemy unit_type from a unit string."""
@@ -33,17 +54,38 @@ async def get_products(
     Returns:
         List of products matching the filter.
     """
-    query = select(ProductMaster)
+    query = lambda_stmt(lambda: select(ProductMaster))
 
     if search:
-        query = query.where(ProductMaster.canonical_name.ilike(f"%{search}%"))
+        # Closure values are extracted as bound parameters on each call
+        pattern = f"%{search}%"
+        query += lambda s: s.where(ProductMaster.canonical_name.ilike(pattern))
 
-    query = query.order_by(ProductMaster.canonical_name)
+    query += lambda s: s.order_by(ProductMaster.canonical_name)
 
     result = await db.execute(query)
     return list(result.scalars().all())
 
 
+async def get_products_version(db: AsyncSession) -> tuple[datetime | None, int]:
+    """Get a cheap version stamp for the product table.
+
+    Any insert, update or delete changes the latest ``updated_at`` or the row
+    count, so the pair identifies the current state of every product list.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Tuple of (latest updated_at or None if empty, row count).
+    """
+    result = await db.execute(
+        select(func.max(ProductMaster.updated_at), func.count(ProductMaster.id))
+    )
+    last_modified, count = result.one()
+    return last_modified, count
+
+
 async def get_product(db: AsyncSession, product_id: UUID) -> ProductMaster | None:
     """Get a product by ID.
 
@@ -54,10 +96,7 @@ async def get_product(db: AsyncSession, product_id: UUID) -> ProductMaster | Non
     Returns:
         Product if found, None otherwise.
     """
-    result = await db.execute(
-        select(ProductMaster).where(ProductMaster.id == product_id)
-    )
-    return result.scalar_one_or_none()
+    return await db.get(ProductMaster, product_id)
 
 
 async def get_product_by_barcode(
@@ -93,13 +132,77 @@ async def create_product(
     Raises:
         IntegrityError: If foreign key constraint fails (invalid category).
     """
-    db_product = ProductMaster(**product.model_dump())
-    db.add(db_product)
+    # INSERT ... RETURNING hands back the stored row (e.g. quantities rounded
+    # to NUMERIC(10, 2)) without a refresh SELECT after the commit
+    db_product = await db.scalar(
+        insert(ProductMaster).values(**product.model_dump()).returning(ProductMaster)
+    )
     await db.commit()
-    await db.refresh(db_product)
     return db_product
 
 
+async def bulk_upsert_products(
+    db: AsyncSession, products: list[ProductMasterCreate]
+) -> list[ProductMaster]:
+    """Insert many products, updating existing ones that share a barcode.
+
+    Rows are written with one multi-row ``INSERT ... ON CONFLICT DO UPDATE``
+    per batch, all inside a single transaction. Products without a barcode are
+    always inserted. If a barcode repeats within the payload, the last row wins.
+
+    Args:
+        db: Database session.
+        products: Products to create or update.
+
+    Returns:
+        Created and updated products, in payload order (duplicates collapsed).
+
+    Raises:
+        IntegrityError: If a product references an unknown category.
+    """
+    rows: list[dict] = []
+    row_index_by_barcode: dict[str, int] = {}
+    for product in products:
+        # Explicit ids let rows without a barcode be matched back to the payload
+        row = {"id": uuid4(), **product.model_dump()}
+        barcode = row["off_product_id"]
+        if barcode is not None and barcode in row_index_by_barcode:
+            rows[row_index_by_barcode[barcode]] = row
+            continue
+        if barcode is not None:
+            row_index_by_barcode[barcode] = len(rows)
+        rows.append(row)
+
+    upserted: list[ProductMaster] = []
+    for start in range(0, len(rows), BULK_UPSERT_BATCH_SIZE):
+        stmt = insert(ProductMaster).values(
+            rows[start : start + BULK_UPSERT_BATCH_SIZE]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_product_master_off_product_id",
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in ProductMasterCreate.model_fields
+                    if column != "off_product_id"
+                },
+                "updated_at": func.clock_timestamp(),
+            },
+        ).returning(ProductMaster)
+        result = await db.scalars(stmt, execution_options={"populate_existing": True})
+        upserted.extend(result.all())
+
+    await db.commit()
+
+    # RETURNING order is not guaranteed for a multi-row INSERT, so restore the
+    # payload order: updated rows keep their existing id but match by barcode
+    position = {
+        row["off_product_id"] or row["id"]: index for index, row in enumerate(rows)
+    }
+    upserted.sort(key=lambda product: position[product.off_product_id or product.id])
+    return upserted
+
+
 async def update_product(
     db: AsyncSession, product_id: UUID, product_update: ProductMasterUpdate
 ) -> ProductMaster | None:
@@ -113,17 +216,20 @@ async def update_product(
     Returns:
         Updated product if found, None otherwise.
     """
-    db_product = await get_product(db, product_id)
-    if not db_product:
-        return None
-
     # Update only provided fields
     update_data = product_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_product, field, value)
+    if not update_data:
+        return await get_product(db, product_id)
 
+    # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+    result = await db.execute(
+        update(ProductMaster)
+        .where(ProductMaster.id == product_id)
+        .values(**update_data)
+        .returning(ProductMaster)
+    )
+    db_product = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_product)
     return db_product
 
 
@@ -137,13 +243,21 @@ async def delete_product(db: AsyncSession, product_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found.
     """
-    db_product = await get_product(db, product_id)
-    if not db_product:
-        return False
-
-    await db.delete(db_product)
+    # Shopping list entries outlive the product as free-text items, as they
+    # did when the ORM nulled the relationship on delete
+    await db.execute(
+        update(ShoppingListItem)
+        .where(ShoppingListItem.product_master_id == product_id)
+        .values(product_master_id=None)
+    )
+    result = await db.execute(
+        delete(ProductMaster)
+        .where(ProductMaster.id == product_id)
+        .returning(ProductMaster.id)
+    )
+    deleted = result.scalar_one_or_none() is not None
     await db.commit()
-    return True
+    return deleted
 
 
 async def enrich_product_from_off_data(
@@ -151,6 +265,13 @@ async def enrich_product_from_off_data(
 ) -> tuple[ProductMaster, bool]:
     """Create or update product from OFF enrichment data.
 
+    Runs as one ``INSERT ... ON CONFLICT (off_product_id) DO UPDATE ...
+    RETURNING``, so there is no separate barcode lookup and no race between
+    concurrent enrichments of the same barcode. New products get their shelf
+    life from the category's default, via a subquery in the same statement.
+    An existing product keeps its other fields; only the name, category and
+    OFF data are updated.
+
     Args:
         db: Database session.
         enriched_data: Enriched data from OFF service containing:
@@ -158,71 +279,44 @@ async def enrich_product_from_off_data(
 
     Returns:
         Tuple of (product, created) where created is True if new, False if updated.
+
+    Raises:
+        IntegrityError: If the category does not exist.
     """
-    barcode = enriched_data["off_product_id"]
-
-    # Check if product with this barcode already exists
-    existing_product = await get_product_by_barcode(db, barcode)
-
-    if existing_product:
-        # Update existing product
-        existing_product.canonical_name = enriched_data["canonical_name"]
-        existing_product.category = enriched_data["category"]
-        existing_product.off_product_id = enriched_data["off_product_id"]
-        existing_product.off_data = enriched_data["off_data"]
-
-        await db.commit()
-        await db.refresh(existing_product)
-        return existing_product, False
-    else:
-        # Create new product with sensible defaults
-        # Use category defaults from seed data
-        from app.crud.category import get_category
-
-        category_defaults = await get_category(db, enriched_data["category"])
-
-        # Determine storage type based on category
-        storage_type_map = {
-            "dairy": "refrigerator",
-            "meat": "refrigerator",
-            "seafood": "refrigerator",
-            "produce": "refrigerator",
-            "frozen": "freezer",
-            "bakery": "pantry",
-            "beverages": "refrigerator",
-            "snacks": "pantry",
-            "condiments": "pantry",
-            "grains": "pantry",
-            "pantry": "pantry",
-        }
-
-        storage_type = storage_type_map.get(enriched_data["category"], "pantry")
-
-        default_unit = enriched_data.get("default_unit", "pcs")
-
-        new_product = ProductMaster(
-            canonical_name=enriched_data["canonical_name"],
-            category=enriched_data["category"],
-            storage_type=storage_type,
-            default_shelf_life_days=category_defaults.default_shelf_life_days
-            if category_defaults
-            else 365,
-            unit_type=_unit_type(default_unit),
-            default_unit=default_unit,
-            default_quantity=enriched_data.get("default_quantity"),
-            off_product_id=enriched_data["off_product_id"],
-            off_data=enriched_data["off_data"],
-        )
+    category = enriched_data["category"]
+    default_unit = enriched_data.get("default_unit", "pcs")
+    category_shelf_life = (
+        select(Category.default_shelf_life_days)
+        .where(Category.id == category)
+        .scalar_subquery()
+    )
+
+    stmt = insert(ProductMaster).values(
+        canonical_name=enriched_data["canonical_name"],
+        category=category,
+        storage_type=STORAGE_TYPE_BY_CATEGORY.get(category, "pantry"),
+        default_shelf_life_days=func.coalesce(category_shelf_life, 365),
+        unit_type=_unit_type(default_unit),
+        default_unit=default_unit,
+        default_quantity=enriched_data.get("default_quantity"),
+        off_product_id=enriched_data["off_product_id"],
+        off_data=enriched_data["off_data"],
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_product_master_off_product_id",
+        set_={
+            "canonical_name": stmt.excluded.canonical_name,
+            "category": stmt.excluded.category,
+            "off_data": stmt.excluded.off_data,
+            "updated_at": func.clock_timestamp(),
+        },
+    ).returning(
+        # xmax is 0 only for a row version created by a plain INSERT
+        ProductMaster,
+        literal_column("xmax = 0").label("created"),
+    )
 
-        try:
-            db.add(new_product)
-            await db.commit()
-            await db.refresh(new_product)
-            return new_product, True
-        except IntegrityError:
-            # Concurrent request already created this product — fetch and return it
-            await db.rollback()
-            existing = await get_product_by_barcode(db, barcode)
-            if existing:
-                return existing, False
-            raise
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    product, created = result.one()
+    await db.commit()
+    return product, created
@@ -1,24 +1,60 @@
 """CRUD operations for Receipt model."""
 
+import asyncio
+import hashlib
+import os
 import uuid
-from datetime import date
-from pathlib import Path
+from collections.abc import AsyncIterable
+from datetime import UTC, date, datetime, timedelta
+from typing import BinaryIO
 from uuid import UUID
 
-import aiofiles
 import anyio
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.models.inventory_item import InventoryItem
 from app.models.receipt import Receipt
 from app.schemas.receipt import ReceiptUpdate
 
 
+class DuplicateUploadError(Exception):
+    """Raised when a duplicate upload's existing receipt keeps disappearing."""
+
+    def __init__(self, file_sha256: str):
+        self.file_sha256 = file_sha256
+        super().__init__(
+            f"Receipt file '{file_sha256}' is being uploaded and removed "
+            "concurrently; retry the upload"
+        )
+
+
+def _open_for_write(path: os.PathLike) -> BinaryIO:
+    """Open a new receipt file, with O_DSYNC when durable writes are enabled."""
+    if not settings.RECEIPT_DURABLE_WRITE:
+        return open(path, "wb")
+    # O_DSYNC makes each write(2) durable on return, saving the fsync call;
+    # platforms without it fall back to a plain write
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_DSYNC", 0)
+    return os.fdopen(os.open(path, flags, 0o644), "wb")
+
+
+def _write_chunk(f: BinaryIO, hasher: "hashlib._Hash", chunk: bytes) -> None:
+    """Write a chunk to the open file and feed it to the digest."""
+    f.write(chunk)
+    hasher.update(chunk)
+
+
 async def get_receipts(
     db: AsyncSession,
     *,
     status: str | None = None,
     store_chain: str | None = None,
+    batch_id: UUID | None = None,
+    limit: int | None = None,
+    before: tuple[datetime, UUID] | None = None,
 ) -> list[Receipt]:
     """Get all receipts with optional filtering.
 
@@ -26,20 +62,37 @@ async def get_receipts(
         db: Database session.
         status: Optional filter by processing_status.
         store_chain: Optional filter by store_chain.
+        batch_id: Optional filter by upload batch.
+        limit: Optional maximum number of receipts to return.
+        before: Keyset cursor (created_at, id) of the last receipt on the
+            previous page; only older receipts are returned.
 
     Returns:
         List of receipts sorted by created_at descending (most recent first).
     """
-    query = select(Receipt)
+    # Each optional clause is its own lambda, so every filter combination
+    # is built and cached once
+    query = lambda_stmt(lambda: select(Receipt))
 
     # Apply filters
     if status:
-        query = query.where(Receipt.processing_status == status)
+        query += lambda s: s.where(Receipt.processing_status == status)
     if store_chain:
-        query = query.where(Receipt.store_chain == store_chain)
-
-    # Sort by most recent first
-    query = query.order_by(Receipt.created_at.desc())
+        query += lambda s: s.where(Receipt.store_chain == store_chain)
+    if batch_id:
+        query += lambda s: s.where(Receipt.batch_id == batch_id)
+
+    if before is not None:
+        before_created_at, before_id = before
+        query += lambda s: s.where(
+            tuple_(Receipt.created_at, Receipt.id)
+            < tuple_(before_created_at, before_id)
+        )
+
+    # Sort by most recent first (id breaks ties so the keyset is unique)
+    query += lambda s: s.order_by(Receipt.created_at.desc(), Receipt.id.desc())
+    if limit is not None:
+        query += lambda s: s.limit(limit)
 
     result = await db.execute(query)
     return list(result.scalars().all())
@@ -55,62 +108,198 @@ async def get_receipt(db: AsyncSession, receipt_id: UUID) -> Receipt | None:
     Returns:
         Receipt if found, None otherwise.
     """
-    result = await db.execute(select(Receipt).where(Receipt.id == receipt_id))
+    return await db.get(Receipt, receipt_id)
+
+
+async def get_receipt_by_sha256(
+    db: AsyncSession, file_sha256: str, *, batch_id: UUID | None = None
+) -> Receipt | None:
+    """Get the earliest receipt uploaded with the given file digest.
+
+    Args:
+        db: Database session.
+        file_sha256: Hex SHA-256 of the uploaded file.
+        batch_id: Batch the upload belongs to (None matches unbatched uploads).
+
+    Returns:
+        Receipt if found, None otherwise.
+    """
+    result = await db.execute(
+        select(Receipt)
+        .where(
+            Receipt.file_sha256 == file_sha256,
+            Receipt.batch_id.is_not_distinct_from(batch_id),
+        )
+        .order_by(Receipt.created_at)
+        .limit(1)
+    )
     return result.scalar_one_or_none()
 
 
+async def claim_receipts(db: AsyncSession, receipts: list[Receipt]) -> list[Receipt]:
+    """Mark receipts as processing, skipping any another worker already owns.
+
+    Rows are selected ``FOR UPDATE SKIP LOCKED`` and must not already be in
+    "processing", so a double-clicked or retried request cannot run the
+    OCR/LLM pipeline twice for the same receipt. Confirmed receipts are never
+    claimed: their items are already in inventory, and reprocessing would
+    let them be confirmed again. A "processing" claim older
+    than RECEIPT_PROCESSING_TIMEOUT is treated as abandoned (e.g. the worker
+    died) and can be taken over. The lock is held only until the status
+    change is committed.
+
+    Args:
+        db: Database session.
+        receipts: Receipts to claim.
+
+    Returns:
+        The receipts this caller now owns, in input order.
+    """
+    if not receipts:
+        return []
+
+    now = datetime.now(UTC)
+    stale_before = now - timedelta(seconds=settings.RECEIPT_PROCESSING_TIMEOUT)
+    result = await db.execute(
+        select(Receipt.id)
+        .where(
+            Receipt.id.in_([receipt.id for receipt in receipts]),
+            Receipt.processing_status != "confirmed",
+            or_(
+                Receipt.processing_status != "processing",
+                Receipt.processing_started_at.is_(None),
+                Receipt.processing_started_at < stale_before,
+            ),
+        )
+        .with_for_update(skip_locked=True)
+    )
+    claimed_ids = set(result.scalars().all())
+
+    claimed = [receipt for receipt in receipts if receipt.id in claimed_ids]
+    for receipt in claimed:
+        receipt.processing_status = "processing"
+        receipt.processing_started_at = now
+    await db.commit()
+    return claimed
+
+
+async def release_claims(db: AsyncSession, receipt_ids: list[UUID]) -> None:
+    """Mark claimed receipts as failed after processing was aborted.
+
+    Rolls back whatever the session had in flight first, so this works after
+    an error or cancellation part-way through a transaction.
+
+    Args:
+        db: Database session.
+        receipt_ids: Receipts still held in "processing" by this caller.
+    """
+    await db.rollback()
+    if not receipt_ids:
+        return
+    await db.execute(
+        update(Receipt)
+        .where(
+            Receipt.id.in_(receipt_ids),
+            Receipt.processing_status == "processing",
+        )
+        .values(processing_status="failed")
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
 async def create_receipt(
     db: AsyncSession,
     *,
-    file_content: bytes,
-    filename: str,
+    file_chunks: AsyncIterable[bytes],
+    file_extension: str,
     store_chain: str | None = None,
     purchase_date: date | None = None,
     batch_id: UUID | None = None,
-) -> Receipt:
-    """Create a new receipt with file storage.
+) -> tuple[Receipt, bool]:
+    """Create a new receipt with file storage and a SHA-256 of the upload.
+
+    Uploads are idempotent: if the same file was already uploaded in the same
+    batch (e.g. a client retrying a flaky upload), the stored copy is
+    discarded and the existing receipt is returned unchanged instead, so the
+    OCR/LLM pipeline never runs twice for one file. The unique index on
+    (batch_id, file_sha256) makes this hold for concurrent uploads too. A
+    duplicate's store_chain and purchase_date are discarded with it.
 
     Args:
         db: Database session.
-        file_content: The uploaded file bytes.
-        filename: Original filename (used for extension).
+        file_chunks: The uploaded file bytes, streamed in chunks.
+        file_extension: Extension for the stored file, including the dot.
         store_chain: Optional store chain name.
         purchase_date: Optional purchase date.
         batch_id: Optional batch ID for multi-receipt processing.
 
     Returns:
-        Created receipt.
+        Tuple of (receipt, created); created is False for a duplicate upload.
     """
     # Generate unique filename
     receipt_id = uuid.uuid4()
-    file_extension = Path(filename).suffix
     stored_filename = f"{receipt_id}{file_extension}"
 
     # Ensure receipts directory exists
     receipts_dir = anyio.Path("data/receipts")
     await receipts_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save file to disk
+    # Stream file to disk chunk by chunk (bounded memory for large uploads).
+    # Each chunk is written and hashed with plain blocking calls in a single
+    # worker-thread hop, instead of one hop for the write and one for the hash
     file_path = receipts_dir / stored_filename
-    async with aiofiles.open(str(file_path), "wb") as f:
-        await f.write(file_content)
-
-    # Create database record
-    db_receipt = Receipt(
-        id=receipt_id,
-        store_chain=store_chain,
-        purchase_date=purchase_date,
-        image_path=str(file_path),
-        processing_status="uploaded",
-        batch_id=batch_id,
-        items_extracted=0,
-        items_matched=0,
+    hasher = hashlib.sha256()
+    f = await asyncio.to_thread(_open_for_write, file_path)
+    try:
+        try:
+            async for chunk in file_chunks:
+                await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+    except BaseException:
+        # Don't leave a truncated upload behind
+        await file_path.unlink(missing_ok=True)
+        raise
+    file_sha256 = hasher.hexdigest()
+
+    # Create database record; a row with the same digest in this batch wins
+    stmt = (
+        insert(Receipt)
+        .values(
+            id=receipt_id,
+            store_chain=store_chain,
+            purchase_date=purchase_date,
+            image_path=str(file_path),
+            file_sha256=file_sha256,
+            processing_status="uploaded",
+            batch_id=batch_id,
+            items_extracted=0,
+            items_matched=0,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["batch_id", "file_sha256"],
+            index_where=Receipt.file_sha256.is_not(None),
+        )
+        .returning(Receipt)
     )
-
-    db.add(db_receipt)
-    await db.commit()
-    await db.refresh(db_receipt)
-    return db_receipt
+    try:
+        # The conflicting row can be deleted before it is read back; the
+        # insert is then retried once
+        for _ in range(2):
+            db_receipt = await db.scalar(stmt)
+            if db_receipt is not None:
+                await db.commit()
+                return db_receipt, True
+            existing = await get_receipt_by_sha256(db, file_sha256, batch_id=batch_id)
+            if existing is not None:
+                await file_path.unlink()
+                return existing, False
+        raise DuplicateUploadError(file_sha256)
+    except BaseException:
+        # The stored copy belongs to no receipt
+        await file_path.unlink(missing_ok=True)
+        raise
 
 
 async def update_receipt(
@@ -128,16 +317,19 @@ async def update_receipt(
     Returns:
         Updated receipt if found, None otherwise.
     """
-    db_receipt = await get_receipt(db, receipt_id)
-    if not db_receipt:
-        return None
-
     update_data = receipt_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_receipt, field, value)
-
+    if not update_data:
+        return await get_receipt(db, receipt_id)
+
+    # One UPDATE ... RETURNING instead of SELECT then UPDATE
+    result = await db.execute(
+        update(Receipt)
+        .where(Receipt.id == receipt_id)
+        .values(**update_data)
+        .returning(Receipt)
+    )
+    db_receipt = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(db_receipt)
     return db_receipt
 
 
@@ -151,16 +343,24 @@ async def delete_receipt(db: AsyncSession, receipt_id: UUID) -> bool:
     Returns:
         True if deleted, False if not found.
     """
-    db_receipt = await get_receipt(db, receipt_id)
-    if not db_receipt:
-        return False
-
-    # Delete file from disk
-    file_path = anyio.Path(db_receipt.image_path)
-    if await file_path.exists():
-        await file_path.unlink()
+    # Inventory items keep their data but lose the receipt link, as they did
+    # when the ORM nulled the relationship on delete
+    await db.execute(
+        update(InventoryItem)
+        .where(InventoryItem.receipt_id == receipt_id)
+        .values(receipt_id=None)
+    )
 
-    # Delete database record
-    await db.delete(db_receipt)
+    # Delete database record, getting the file path back in the same statement
+    result = await db.execute(
+        delete(Receipt).where(Receipt.id == receipt_id).returning(Receipt.image_path)
+    )
+    image_path = result.scalar_one_or_none()
     await db.commit()
+    if image_path is None:
+        return False
+
+    # Delete file from disk: one worker-thread hop and a single unlink(2),
+    # with no separate exists() check to race against
+    await anyio.Path(image_path).unlink(missing_ok=True)
     return True
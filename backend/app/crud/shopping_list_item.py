@@ -1,9 +1,9 @@
-from datetime import UTC
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, lambda_stmt, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.crud.base import CRUDBase
 from app.models.shopping_list_item import ShoppingListItem
@@ -12,12 +12,48 @@ from app.schemas.shopping_list_item import (
     ShoppingListItemUpdate,
 )
 
+# Eager-load the product; any other relationship access raises instead of
+# issuing a lazy load per row
+_LIST_LOAD_OPTIONS = (
+    selectinload(ShoppingListItem.product_master),
+    raiseload("*"),
+)
+
 
 class CRUDShoppingListItem(
     CRUDBase[ShoppingListItem, ShoppingListItemCreate, ShoppingListItemUpdate]
 ):
     """CRUD operations for shopping list items."""
 
+    async def bulk_create(
+        self, db: AsyncSession, objs_in: list[ShoppingListItemCreate]
+    ) -> list[ShoppingListItem]:
+        """Create many shopping list items in one transaction.
+
+        The rows go out as a single ``INSERT ... RETURNING`` batched by
+        insertmanyvalues, so N items cost one roundtrip rather than N.
+
+        Args:
+            db: Database session
+            objs_in: Shopping list items to create
+
+        Returns:
+            Created shopping list items (with product_master loaded), in
+            input order
+        """
+        if not objs_in:
+            return []
+
+        result = await db.scalars(
+            insert(ShoppingListItem)
+            .returning(ShoppingListItem, sort_by_parameter_order=True)
+            .options(*_LIST_LOAD_OPTIONS),
+            [obj_in.model_dump() for obj_in in objs_in],
+        )
+        created = list(result.all())
+        await db.commit()
+        return created
+
     async def get_all(
         self,
         db: AsyncSession,
@@ -27,53 +63,67 @@ class CRUDShoppingListItem(
         priority: str | None = None,
         is_purchased: bool | None = None,
         include_purchased: bool = False,
+        after: tuple[int, datetime, UUID] | None = None,
     ) -> list[ShoppingListItem]:
         """Get all shopping list items with optional filtering.
 
         Args:
             db: Database session
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when ``after`` is given)
             limit: Maximum number of records to return
             priority: Filter by priority (urgent, normal, low)
             is_purchased: Filter by purchase status
             include_purchased: Whether to include purchased items (default: False)
+            after: Keyset cursor (priority rank, added_at, id) of the last item
+                on the previous page; only items sorting after it are returned
 
         Returns:
             List of shopping list items
         """
-        query = select(ShoppingListItem).options(
-            joinedload(ShoppingListItem.product_master)
+        # Built as a lambda statement: each filter combination is constructed
+        # and compiled once, with filter values, skip and limit bound per call
+        query = lambda_stmt(
+            lambda: select(ShoppingListItem).options(
+                selectinload(ShoppingListItem.product_master), raiseload("*")
+            )
         )
 
-        # Default: exclude purchased items unless explicitly requested
+        # Default: exclude purchased items unless explicitly requested.
+        # IS false stays a literal so the partial index applies
         if not include_purchased and is_purchased is None:
-            query = query.where(ShoppingListItem.is_purchased.is_(False))
+            query += lambda s: s.where(ShoppingListItem.is_purchased.is_(False))
         elif is_purchased is not None:
-            query = query.where(ShoppingListItem.is_purchased == is_purchased)
+            query += lambda s: s.where(ShoppingListItem.is_purchased == is_purchased)
 
         if priority:
-            query = query.where(ShoppingListItem.priority == priority)
+            query += lambda s: s.where(ShoppingListItem.priority == priority)
 
         # Order by priority (urgent first), then by added date
-        # Use CASE to map priority to numeric values for proper sorting
-        from sqlalchemy import case
-
-        priority_order = case(
-            (ShoppingListItem.priority == "urgent", 1),
-            (ShoppingListItem.priority == "normal", 2),
-            (ShoppingListItem.priority == "low", 3),
-            else_=4,
-        )
-
-        query = query.order_by(
-            priority_order.asc(),  # 1=urgent, 2=normal, 3=low
+        if after is not None:
+            after_rank, after_added_at, after_id = after
+            query += lambda s: s.where(
+                tuple_(
+                    ShoppingListItem.priority_rank,
+                    ShoppingListItem.added_at,
+                    ShoppingListItem.id,
+                )
+                > tuple_(after_rank, after_added_at, after_id)
+            )
+
+        query += lambda s: s.order_by(
+            ShoppingListItem.priority_rank.asc(),  # 1=urgent, 2=normal, 3=low
             ShoppingListItem.added_at.asc(),  # oldest first within same priority
+            ShoppingListItem.id.asc(),  # tiebreaker so the keyset is unique
         )
 
-        query = query.offset(skip).limit(limit)
+        # A cursor replaces OFFSET: the keyset filter already positions the page
+        if after is None:
+            query += lambda s: s.offset(skip).limit(limit)
+        else:
+            query += lambda s: s.limit(limit)
 
         result = await db.execute(query)
-        return list(result.scalars().unique().all())
+        return list(result.scalars().all())
 
     async def get_urgent_items(self, db: AsyncSession) -> list[ShoppingListItem]:
         """Get all urgent items that are not yet purchased.
@@ -82,9 +132,20 @@ class CRUDShoppingListItem(
             db: Database session
 
         Returns:
-            List of urgent shopping list items
+            List of urgent shopping list items, oldest first
         """
-        return await self.get_all(db, priority="urgent", is_purchased=False)
+        # Fixed filter: no rank ordering, pagination or filter branching needed
+        query = (
+            select(ShoppingListItem)
+            .where(
+                ShoppingListItem.priority == "urgent",
+                ShoppingListItem.is_purchased.is_(False),
+            )
+            .options(*_LIST_LOAD_OPTIONS)
+            .order_by(ShoppingListItem.added_at.asc(), ShoppingListItem.id.asc())
+        )
+        result = await db.execute(query)
+        return list(result.scalars().all())
 
     async def mark_purchased(
         self, db: AsyncSession, *, item_id: UUID, purchased: bool = True
@@ -99,17 +160,19 @@ class CRUDShoppingListItem(
         Returns:
             Updated shopping list item or None if not found
         """
-        from datetime import datetime
-
-        item = await self.get(db, id=item_id)
-        if not item:
-            return None
-
-        item.is_purchased = purchased
-        item.purchased_at = datetime.now(UTC) if purchased else None
-
+        # One UPDATE ... RETURNING instead of a SELECT, flush and commit
+        result = await db.execute(
+            update(ShoppingListItem)
+            .where(ShoppingListItem.id == item_id)
+            .values(
+                is_purchased=purchased,
+                purchased_at=datetime.now(UTC) if purchased else None,
+            )
+            .returning(ShoppingListItem),
+            execution_options={"populate_existing": True},
+        )
+        item = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(item)
         return item
 
     async def delete_purchased(self, db: AsyncSession) -> int:
@@ -121,10 +184,18 @@ class CRUDShoppingListItem(
         Returns:
             Number of items deleted
         """
-        stmt = delete(ShoppingListItem).where(ShoppingListItem.is_purchased.is_(True))
+        # Count via RETURNING rather than the driver's rowcount; nothing in the
+        # session needs syncing since the rows are gone after commit
+        stmt = (
+            delete(ShoppingListItem)
+            .where(ShoppingListItem.is_purchased.is_(True))
+            .returning(ShoppingListItem.id)
+            .execution_options(synchronize_session=False)
+        )
         result = await db.execute(stmt)
+        deleted = len(result.all())
         await db.commit()
-        return result.rowcount
+        return deleted
 
     async def get_by_product(
         self, db: AsyncSession, *, product_master_id: UUID
@@ -142,10 +213,10 @@ class CRUDShoppingListItem(
             select(ShoppingListItem)
             .where(ShoppingListItem.product_master_id == product_master_id)
             .where(ShoppingListItem.is_purchased.is_(False))
-            .options(joinedload(ShoppingListItem.product_master))
+            .options(*_LIST_LOAD_OPTIONS)
         )
         result = await db.execute(query)
-        return list(result.scalars().unique().all())
+        return list(result.scalars().all())
 
 
 shopping_list_item = CRUDShoppingListItem(ShoppingListItem)
@@ -1,5 +1,12 @@
 # Import all the models, so that Base has them registered before being
 # imported by other modules
+from sqlalchemy.orm import configure_mappers
+
+import app.models  # noqa: F401
+
 from .base_class import Base
 
+# Resolve every relationship once at import instead of on the first query
+configure_mappers()
+
 __all__ = ["Base"]
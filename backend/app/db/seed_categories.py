@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.category import Category
 
 # Seed data based on common food categories and their typical shelf lives
-SEED_CATEGORIES = [
+SEED_CATEGORIES = (
     {
         "id": "meat",
         "display_name": "Meat & Poultry",
@@ -103,7 +103,15 @@ SEED_CATEGORIES = [
         "meal_contexts": ["snack"],
         "sort_order": 120,
     },
-]
+)
+
+# Built once: a single multi-row INSERT ... ON CONFLICT DO NOTHING. Existing
+# categories are left alone so manual edits are not overwritten.
+_SEED_STMT = (
+    insert(Category)
+    .values(list(SEED_CATEGORIES))
+    .on_conflict_do_nothing(index_elements=["id"])
+)
 
 
 async def seed_categories(session: AsyncSession) -> None:
@@ -115,12 +123,4 @@ async def seed_categories(session: AsyncSession) -> None:
     Args:
         session: Async database session.
     """
-    # Use PostgreSQL's INSERT ... ON CONFLICT DO NOTHING for idempotency
-    # This ensures we don't overwrite any manual updates to existing categories
-    stmt = (
-        insert(Category)
-        .values(SEED_CATEGORIES)
-        .on_conflict_do_nothing(index_elements=["id"])
-    )
-
-    await session.execute(stmt)
+    await session.execute(_SEED_STMT)
@@ -1,16 +1,54 @@
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+def json_dumps(value: Any) -> str:
+    """Serialize a JSON/JSONB bind value (e.g. receipt.ocr_structured) with orjson.
+
+    Non-string dict keys are stringified, matching the stdlib encoder.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    # Reuse the most recently returned connection: its prepared-statement
+    # cache is warm, and surplus connections sit idle until pool_recycle
+    pool_use_lifo=True,
+    json_serializer=json_dumps,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
+)
+# Writes are flushed by commit() or go straight through Core statements, so
+# autoflush would only add flushes before unrelated queries
 AsyncSessionLocal = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
 )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database sessions."""
+    """Dependency for getting async database sessions.
+
+    Commits anything still pending when the request succeeds and rolls back
+    when it raises, so no connection goes back to the pool mid-transaction.
+    """
     async with AsyncSessionLocal() as session:
-        yield session
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
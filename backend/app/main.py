@@ -6,10 +6,12 @@ import redis.asyncio as redis
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.pagination import NEXT_CURSOR_HEADER
 from .api.router import api_router
 from .core.config import settings
 from .core.logging import get_logger, setup_logging
 from .services.broadcast_helpers import close_redis_client
+from .services.http_client import close_http_client
 from .services.websockets import manager
 
 # from .middleware.logging import LoggingMiddleware  # TODO: Create if needed
@@ -27,25 +29,26 @@ async def redis_listener(app: FastAPI):
         redis_client = None
         pubsub = None
         try:
+            # listen() blocks on the socket between messages, so keepalive is
+            # what surfaces a dead connection and triggers the reconnect below
             redis_client = redis.from_url(
-                f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}"
+                f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+                socket_keepalive=True,
             )
             pubsub = redis_client.pubsub()
             await pubsub.subscribe("updates")
             backoff = 1  # reset on successful connect
             logger.info("redis_listener_connected")
 
-            while True:
-                message = await pubsub.get_message(
-                    ignore_subscribe_messages=True, timeout=1.0
-                )
-                if message and message.get("type") == "message":
+            # Each message is broadcast as soon as it arrives; no polling
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    payload = message["data"].decode("utf-8")
                     logger.info(
-                        "redis_message_received",
-                        extra={"message_data": message["data"].decode("utf-8")},
+                        "redis_message_received", extra={"message_data": payload}
                     )
-                    await manager.broadcast(message["data"].decode("utf-8"))
-                await asyncio.sleep(0.1)
+                    # Only enqueues per-client; sends never block this loop
+                    await manager.broadcast(payload)
 
         except asyncio.CancelledError:
             logger.info("redis_listener_cancelled")
@@ -83,6 +86,7 @@ async def lifespan(app: FastAPI):
     listener_task.cancel()
     await listener_task
     await close_redis_client()
+    await close_http_client()
 
 
 app = FastAPI(title="Kyokki API", lifespan=lifespan)
@@ -97,6 +101,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix="/api")
@@ -1,4 +1,4 @@
-from sqlalchemy import ARRAY, Column, Integer, String
+from sqlalchemy import ARRAY, Column, Index, Integer, String
 
 from app.db.base_class import Base
 
@@ -11,9 +11,15 @@ class Category(Base):
     """
 
     __tablename__ = "category"
+    __table_args__ = (
+        # Serves containment/overlap filters (@>, &&) on meal_contexts
+        Index("ix_category_meal_contexts", "meal_contexts", postgresql_using="gin"),
+    )
 
+    # ASCII slug, only ever compared for equality: the "C" collation makes
+    # key comparisons a plain memcmp instead of a locale-aware strcoll
     id = Column(
-        String, primary_key=True, index=True
+        String(collation="C"), primary_key=True, index=True
     )  # e.g., "dairy", "meat", "produce"
     display_name = Column(String, nullable=False)
     icon = Column(String, nullable=True)  # emoji representation
@@ -1,7 +1,6 @@
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -36,7 +35,7 @@ class ConsumptionLog(Base):
 
     logged_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
         nullable=False,
         index=True,
     )
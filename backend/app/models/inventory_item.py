@@ -1,7 +1,17 @@
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -16,6 +26,24 @@ class InventoryItem(Base):
     """
 
     __tablename__ = "inventory_item"
+    __table_args__ = (
+        # Partial index for "active" items (not empty/discarded), oldest expiry
+        # first — serves get_active_items_by_product without touching dead rows.
+        Index(
+            "ix_inventory_item_active_product_expiry",
+            "product_master_id",
+            "expiry_date",
+            postgresql_where=text("status NOT IN ('empty', 'discarded')"),
+        ),
+        # Matches get_inventory_items: equality on location (and status),
+        # rows returned in expiry order without a separate sort
+        Index(
+            "ix_inventory_item_location_status_expiry",
+            "location",
+            "status",
+            "expiry_date",
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     product_master_id = Column(
@@ -50,7 +78,7 @@ class InventoryItem(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC), nullable=False
+        DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False
     )
     consumed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -1,5 +1,4 @@
 import uuid
-from datetime import UTC, datetime
 
 from sqlalchemy import (
     Column,
@@ -9,6 +8,7 @@ from sqlalchemy import (
     Numeric,
     String,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
@@ -27,10 +27,18 @@ class ProductMaster(Base):
     __table_args__ = (
         UniqueConstraint("off_product_id", name="uq_product_master_off_product_id"),
     )
+    # updated_at is set by the database on UPDATE; fetch it back via RETURNING
+    # so callers can serialize the row without a lazy refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    # ILIKE '%term%' search uses a pg_trgm GIN index; it needs the extension,
+    # so only migration e91b3f6c0d48 creates it (not metadata.create_all) and
+    # alembic/env.py keeps autogenerate from dropping it
     canonical_name = Column(String, nullable=False, index=True)  # "Valio Whole Milk 1L"
-    category = Column(String, ForeignKey("category.id"), nullable=False, index=True)
+    category = Column(
+        String(collation="C"), ForeignKey("category.id"), nullable=False, index=True
+    )  # same collation as category.id so joins compare without a conflict
     storage_type = Column(String, nullable=False)  # refrigerator, freezer, pantry
 
     # Shelf life
@@ -55,13 +63,13 @@ class ProductMaster(Base):
     # Timestamps
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
         nullable=False,
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
+        onupdate=func.clock_timestamp(),
         nullable=False,
     )
 
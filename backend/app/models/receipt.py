@@ -1,7 +1,16 @@
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import Column, Date, DateTime, Integer, String, Text
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -16,6 +25,19 @@ class Receipt(Base):
     """
 
     __tablename__ = "receipt"
+    __table_args__ = (
+        # Serves list_receipts' keyset pagination (newest first)
+        Index("ix_receipt_created_at_id", "created_at", "id"),
+        # One stored copy per file and batch; unbatched uploads share NULL
+        Index(
+            "ix_receipt_batch_id_file_sha256",
+            "batch_id",
+            "file_sha256",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+            postgresql_where=text("file_sha256 IS NOT NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     store_chain = Column(String, nullable=True, index=True)  # Detected or manual
@@ -23,6 +45,7 @@ class Receipt(Base):
 
     # OCR processing
     image_path = Column(String, nullable=False)  # Path to receipt image
+    file_sha256 = Column(String(64), nullable=True)  # Upload digest
     ocr_raw_text = Column(Text, nullable=True)  # Raw OCR output
     ocr_structured = Column(JSONB, nullable=True)  # Parsed items and metadata
 
@@ -30,6 +53,9 @@ class Receipt(Base):
     processing_status = Column(
         String, nullable=False, default="queued", index=True
     )  # queued, processing, completed, failed
+    processing_started_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # When the current "processing" claim was taken
     batch_id = Column(
         UUID(as_uuid=True), nullable=True, index=True
     )  # Multi-receipt batch
@@ -40,7 +66,7 @@ class Receipt(Base):
 
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
         nullable=False,
     )
 
@@ -1,7 +1,18 @@
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    SmallInteger,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -16,6 +27,16 @@ class ShoppingListItem(Base):
     """
 
     __tablename__ = "shopping_list_item"
+    __table_args__ = (
+        # Unpurchased items in get_all's order (priority, oldest first)
+        Index(
+            "ix_shopping_list_item_active_priority",
+            "priority_rank",
+            "added_at",
+            "id",
+            postgresql_where=text("is_purchased IS false"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     product_master_id = Column(
@@ -31,6 +52,17 @@ class ShoppingListItem(Base):
     priority = Column(
         String, nullable=False, default="normal", index=True
     )  # urgent, normal, low
+    # Sort rank of priority (urgent first, unknown values last). Generated by
+    # Postgres, so every insert/update path keeps it in step with priority
+    priority_rank = Column(
+        SmallInteger,
+        Computed(
+            "CASE priority WHEN 'urgent' THEN 1 WHEN 'normal' THEN 2 "
+            "WHEN 'low' THEN 3 ELSE 4 END",
+            persisted=True,
+        ),
+        nullable=False,
+    )
     source = Column(
         String, nullable=False, default="manual", index=True
     )  # manual, auto_restock, recipe
@@ -39,7 +71,7 @@ class ShoppingListItem(Base):
     is_purchased = Column(Boolean, nullable=False, default=False, index=True)
     added_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
         nullable=False,
     )
     purchased_at = Column(DateTime(timezone=True), nullable=True)
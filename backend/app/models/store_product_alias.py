@@ -1,7 +1,16 @@
 import uuid
-from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -16,6 +25,13 @@ class StoreProductAlias(Base):
     """
 
     __tablename__ = "store_product_alias"
+    __table_args__ = (
+        # Receipt lines are resolved per store: one btree probe on the pair
+        # instead of combining single-column indexes. store_chain leads both,
+        # so chain-only filters use them too.
+        Index("ix_store_product_alias_chain_name", "store_chain", "receipt_name"),
+        Index("ix_store_product_alias_chain_barcode", "store_chain", "barcode"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     product_master_id = Column(
@@ -23,11 +39,9 @@ class StoreProductAlias(Base):
     )
 
     # Store-specific identifiers
-    store_chain = Column(
-        String, nullable=False, index=True
-    )  # s-market, prisma, k-citymarket, lidl
-    receipt_name = Column(String, nullable=False, index=True)  # "VALIO MAITO 1L"
-    barcode = Column(String, nullable=True, index=True)  # EAN-13, UPC, GS1 GTIN
+    store_chain = Column(String, nullable=False)  # s-market, prisma, k-citymarket, lidl
+    receipt_name = Column(String, nullable=False)  # "VALIO MAITO 1L"
+    barcode = Column(String, nullable=True)  # EAN-13, UPC, GS1 GTIN
 
     # Learning & verification
     confidence_score = Column(Float, nullable=False, default=0.0)  # 0.0-1.0
@@ -35,7 +49,7 @@ class StoreProductAlias(Base):
     occurrence_count = Column(Integer, nullable=False, default=1)
     last_seen = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(UTC),
+        server_default=func.clock_timestamp(),
         nullable=False,
     )
 
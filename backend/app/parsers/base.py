@@ -4,8 +4,9 @@ Pydantic models for LLM extraction with Ollama JSON mode.
 """
 
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class StoreChain(StrEnum):
@@ -43,15 +44,9 @@ class ParsedProduct(BaseModel):
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage in receipt.ocr_structured."""
-        return {
-            "name": self.name,
-            "name_en": self.name_en,
-            "quantity": self.quantity,
-            "weight_kg": self.weight_kg,
-            "volume_l": self.volume_l,
-            "unit": self.unit,
-            "price": self.price,
-        }
+        # The instance dict holds exactly the declared fields, in order, so a
+        # shallow copy equals model_dump() at a fraction of the cost
+        return dict(self.__dict__)
 
 
 class StoreInfo(BaseModel):
@@ -66,6 +61,16 @@ class StoreInfo(BaseModel):
     currency: str | None = Field(None, description="Currency code (ISO 4217)")
 
 
+# Flat top-level keys of the older extraction schema -> StoreInfo field
+LEGACY_STORE_FIELDS = {
+    "store_name": "name",
+    "store_chain": "chain",
+    "country": "country",
+    "language": "language",
+    "currency": "currency",
+}
+
+
 class ReceiptExtraction(BaseModel):
     """Complete receipt extraction result from LLM.
 
@@ -80,41 +85,26 @@ class ReceiptExtraction(BaseModel):
         None, description="Overall extraction confidence (0-1)", ge=0, le=1
     )
 
-    # Backward compatibility with simpler schema
-    store_name: str | None = Field(
-        None, description="DEPRECATED: Use store.name instead"
-    )
-    store_chain: str | None = Field(
-        None, description="DEPRECATED: Use store.chain instead"
-    )
-    country: str | None = Field(
-        None, description="DEPRECATED: Use store.country instead"
-    )
-    language: str | None = Field(
-        None, description="DEPRECATED: Use store.language instead"
-    )
-    currency: str | None = Field(
-        None, description="DEPRECATED: Use store.currency instead"
-    )
-
-    def get_store_info(self) -> StoreInfo:
-        """Get store info, merging deprecated fields if needed."""
-        if (
-            self.store_name
-            or self.store_chain
-            or self.country
-            or self.language
-            or self.currency
-        ):
-            # Use deprecated fields if present
-            return StoreInfo(
-                name=self.store_name or self.store.name,
-                chain=self.store_chain or self.store.chain,
-                country=self.country or self.store.country,
-                language=self.language or self.store.language,
-                currency=self.currency or self.store.currency,
-            )
-        return self.store
+    @model_validator(mode="before")
+    @classmethod
+    def _fold_legacy_store_fields(cls, data: Any) -> Any:
+        """Move top-level store fields from the older flat schema into ``store``.
+
+        LLM output may still use ``store_name``/``store_chain``/``country``/
+        ``language``/``currency``; non-empty values win over ``store``.
+        """
+        if not isinstance(data, dict) or not LEGACY_STORE_FIELDS.keys() & data:
+            return data
+
+        data = dict(data)
+        store = data.get("store") or {}
+        store = store.model_dump() if isinstance(store, StoreInfo) else dict(store)
+        for legacy_key, store_key in LEGACY_STORE_FIELDS.items():
+            value = data.pop(legacy_key, None)
+            if value:
+                store[store_key] = value
+        data["store"] = store
+        return data
 
 
 class ParseResult(BaseModel):
@@ -35,6 +35,8 @@ from app.schemas.shopping_list_item import (
     ShoppingListItemCreate,
     ShoppingListItemResponse,
     ShoppingListItemUpdate,
+    ShoppingPriority,
+    ShoppingSource,
 )
 from app.schemas.store_product_alias import (
     StoreProductAliasBase,
@@ -79,4 +81,6 @@ __all__ = [
     "ShoppingListItemCreate",
     "ShoppingListItemUpdate",
     "ShoppingListItemResponse",
+    "ShoppingPriority",
+    "ShoppingSource",
 ]
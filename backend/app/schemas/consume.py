@@ -1,6 +1,7 @@
 """Schema for consume operation."""
 
 from decimal import Decimal
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -9,3 +10,9 @@ class ConsumeRequest(BaseModel):
     """Schema for consuming inventory items."""
 
     quantity: Decimal = Field(..., gt=0, description="Quantity to consume")
+
+
+class BulkConsumeItem(ConsumeRequest):
+    """Schema for one entry of a bulk consume request."""
+
+    item_id: UUID = Field(..., description="Inventory item to consume from")
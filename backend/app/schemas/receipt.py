@@ -35,6 +35,7 @@ class ReceiptResponse(ReceiptBase):
     """Schema for receipt API responses."""
 
     id: UUID
+    file_sha256: str | None = Field(None, description="SHA-256 of the uploaded file")
     ocr_raw_text: str | None = Field(None, description="Raw OCR output")
     ocr_structured: dict | None = Field(None, description="Parsed items and metadata")
     processing_status: str = Field(..., description="Processing status")
@@ -54,6 +55,41 @@ class ReceiptProcessingResponse(BaseModel):
     error: str | None = Field(None, description="Error message if processing failed")
 
 
+class ReceiptBatchItemResult(ReceiptProcessingResponse):
+    """Schema for one receipt's result within a batch."""
+
+    receipt_id: UUID = Field(..., description="Processed receipt ID")
+
+
+class ReceiptBatchProcessingResponse(BaseModel):
+    """Schema for batch receipt processing results."""
+
+    batch_id: UUID = Field(..., description="Processed batch ID")
+    results: list[ReceiptBatchItemResult] = Field(
+        default_factory=list, description="Per-receipt results, oldest first"
+    )
+
+
+class ReceiptTaskResponse(BaseModel):
+    """Schema for a queued background processing task."""
+
+    task_id: str = Field(..., description="Celery task ID for status polling")
+    status: str = Field("queued", description="Task status")
+
+
+class ReceiptTaskStatusResponse(BaseModel):
+    """Schema for background processing task status."""
+
+    task_id: str = Field(..., description="Celery task ID")
+    state: str = Field(
+        ..., description="Celery state: PENDING, STARTED, SUCCESS, FAILURE"
+    )
+    result: ReceiptProcessingResponse | ReceiptBatchProcessingResponse | None = Field(
+        None, description="Processing result once the task has succeeded"
+    )
+    error: str | None = Field(None, description="Error message if the task failed")
+
+
 class ConfirmedItemCreate(BaseModel):
     """Schema for a confirmed receipt item to add to inventory."""
 
@@ -1,10 +1,27 @@
 from datetime import datetime
 from decimal import Decimal
+from enum import StrEnum
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 
+class ShoppingPriority(StrEnum):
+    """Shopping list item priority (sort order: urgent first)."""
+
+    URGENT = "urgent"
+    NORMAL = "normal"
+    LOW = "low"
+
+
+class ShoppingSource(StrEnum):
+    """How a shopping list item was added."""
+
+    MANUAL = "manual"
+    AUTO_RESTOCK = "auto_restock"
+    RECIPE = "recipe"
+
+
 class ShoppingListItemBase(BaseModel):
     """Base shopping list item schema with common fields."""
 
@@ -14,8 +31,12 @@ class ShoppingListItemBase(BaseModel):
     name: str = Field(..., description="Display name")
     quantity: Decimal = Field(..., gt=0, description="Quantity to purchase")
     unit: str = Field(..., description="Unit: ml, g, pcs, unit")
-    priority: str = Field("normal", description="Priority: urgent, normal, low")
-    source: str = Field("manual", description="Source: manual, auto_restock, recipe")
+    priority: ShoppingPriority = Field(
+        ShoppingPriority.NORMAL, description="Priority: urgent, normal, low"
+    )
+    source: ShoppingSource = Field(
+        ShoppingSource.MANUAL, description="Source: manual, auto_restock, recipe"
+    )
 
 
 class ShoppingListItemCreate(ShoppingListItemBase):
@@ -31,7 +52,7 @@ class ShoppingListItemUpdate(BaseModel):
     name: str | None = None
     quantity: Decimal | None = Field(None, gt=0)
     unit: str | None = None
-    priority: str | None = None
+    priority: ShoppingPriority | None = None
     is_purchased: bool | None = None
 
 
@@ -1,11 +1,12 @@
 """Helper functions for broadcasting real-time updates via Redis."""
 
-import json
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any, Literal
 from uuid import UUID
 
+import orjson
 import redis.asyncio as redis
 
 from app.core.config import settings
@@ -35,20 +36,29 @@ async def close_redis_client() -> None:
         _redis_client = None
 
 
-def _serialize_value(value: Any) -> Any:
+def _serialize_value(value: Any) -> str:
     """Serialize values for JSON encoding.
 
+    Used as orjson's ``default`` hook, so it only sees types orjson cannot
+    encode itself (in practice Decimal; UUIDs and datetimes are native).
+
     Args:
         value: Value to serialize.
 
     Returns:
         JSON-serializable value.
+
+    Raises:
+        TypeError: If the value is not a Decimal.
     """
-    if isinstance(value, (UUID, Decimal)):
+    if isinstance(value, Decimal):
         return str(value)
-    if isinstance(value, datetime):
-        return value.isoformat()
-    return value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    """Encode a message for PUBLISH in a single orjson pass."""
+    return orjson.dumps(message, default=_serialize_value)
 
 
 def _build_message(
@@ -68,9 +78,10 @@ def _build_message(
     """
     return {
         "type": message_type,
-        "timestamp": datetime.now(UTC).isoformat(),
+        # Left as a datetime: orjson formats it to ISO 8601 in C when encoding
+        "timestamp": datetime.now(UTC),
         "entity_id": str(entity_id),
-        "data": {k: _serialize_value(v) for k, v in data.items()},
+        "data": data,
     }
 
 
@@ -82,8 +93,7 @@ async def publish_message(message: dict[str, Any]) -> None:
     """
     try:
         redis_client = await get_redis_client()
-        message_json = json.dumps(message)
-        await redis_client.publish("updates", message_json)
+        await redis_client.publish("updates", _encode(message))
 
         logger.info(
             "message_published",
@@ -100,6 +110,41 @@ async def publish_message(message: dict[str, Any]) -> None:
         )
 
 
+async def publish_messages(messages: Iterable[dict[str, Any]]) -> None:
+    """Publish several messages to the Redis updates channel in one roundtrip.
+
+    The PUBLISH commands are pipelined (no MULTI/EXEC), so a burst of updates
+    from a bulk operation costs one network roundtrip instead of one each.
+
+    Args:
+        messages: Message dictionaries to publish, in order.
+    """
+    messages = list(messages)
+    if not messages:
+        return
+
+    try:
+        redis_client = await get_redis_client()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.publish("updates", _encode(message))
+            await pipe.execute()
+
+        logger.info(
+            "messages_published",
+            extra={
+                "message_type": messages[0].get("type"),
+                "count": len(messages),
+            },
+        )
+    except Exception as e:
+        logger.error(
+            "message_publish_failed",
+            extra={"error": str(e), "message_type": messages[0].get("type")},
+            exc_info=True,
+        )
+
+
 async def broadcast_receipt_status(
     receipt_id: UUID,
     status: Literal["processing", "completed", "failed", "confirmed"],
@@ -116,7 +161,32 @@ async def broadcast_receipt_status(
         items_matched: Number of items matched to products.
         error: Error message if status is "failed".
     """
-    message = _build_message(
+    await publish_message(
+        _receipt_status_message(
+            receipt_id, status, items_extracted, items_matched, error
+        )
+    )
+
+
+async def broadcast_receipt_statuses(updates: Iterable[dict[str, Any]]) -> None:
+    """Broadcast status updates for many receipts in one pipelined publish.
+
+    Args:
+        updates: One dict per receipt holding broadcast_receipt_status's
+            keyword arguments.
+    """
+    await publish_messages(_receipt_status_message(**update) for update in updates)
+
+
+def _receipt_status_message(
+    receipt_id: UUID,
+    status: Literal["processing", "completed", "failed", "confirmed"],
+    items_extracted: int = 0,
+    items_matched: int = 0,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """Build a receipt_status message."""
+    return _build_message(
         message_type="receipt_status",
         entity_id=receipt_id,
         data={
@@ -127,7 +197,6 @@ async def broadcast_receipt_status(
             "error": error,
         },
     )
-    await publish_message(message)
 
 
 async def broadcast_inventory_update(
@@ -146,7 +215,32 @@ async def broadcast_inventory_update(
         status: Item status (if applicable).
         product_name: Product name for display purposes.
     """
-    message = _build_message(
+    await publish_message(
+        _inventory_update_message(
+            inventory_item_id, action, current_quantity, status, product_name
+        )
+    )
+
+
+async def broadcast_inventory_updates(updates: Iterable[dict[str, Any]]) -> None:
+    """Broadcast updates for many inventory items in one pipelined publish.
+
+    Args:
+        updates: One dict per item holding broadcast_inventory_update's
+            keyword arguments.
+    """
+    await publish_messages(_inventory_update_message(**update) for update in updates)
+
+
+def _inventory_update_message(
+    inventory_item_id: UUID,
+    action: Literal["created", "updated", "consumed", "deleted"],
+    current_quantity: Decimal | None = None,
+    status: str | None = None,
+    product_name: str | None = None,
+) -> dict[str, Any]:
+    """Build an inventory_update message."""
+    return _build_message(
         message_type="inventory_update",
         entity_id=inventory_item_id,
         data={
@@ -157,7 +251,6 @@ async def broadcast_inventory_update(
             "product_name": product_name,
         },
     )
-    await publish_message(message)
 
 
 async def broadcast_scanner_action(
@@ -186,19 +279,16 @@ async def broadcast_scanner_action(
     """
     message = {
         "type": "scanner_action",
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": datetime.now(UTC),
         "entity_id": str(entity_id) if entity_id else None,
         "data": {
-            k: _serialize_value(v)
-            for k, v in {
-                "action": action,
-                "barcode": barcode,
-                "product_name": product_name,
-                "station_id": station_id,
-                "mode": mode,
-                "quantity": quantity,
-                "unit": unit,
-            }.items()
+            "action": action,
+            "barcode": barcode,
+            "product_name": product_name,
+            "station_id": station_id,
+            "mode": mode,
+            "quantity": quantity,
+            "unit": unit,
         },
     }
     await publish_message(message)
@@ -0,0 +1,36 @@
+"""Shared HTTP client for the OCR (MinerU) and LLM (vLLM) services.
+
+Each receipt hits both services; reusing one pooled client keeps TCP
+connections alive between calls instead of reconnecting per request.
+Callers pass their own per-request timeout.
+"""
+
+import httpx
+
+# Enough for LLM_MAX_CONCURRENCY extractions plus their OCR calls
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 50
+
+_http_client: httpx.AsyncClient | None = None
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Called during app shutdown and after
+    each Celery task, whose event loop the pooled connections are bound to."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
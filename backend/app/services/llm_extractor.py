@@ -4,14 +4,38 @@ Language-agnostic extraction that works with any receipt format.
 vLLM server provides OpenAI-compatible API with JSON schema support.
 """
 
+import re
+
 import httpx
 
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.parsers.base import ReceiptExtraction
+from app.services.http_client import get_http_client
 
 logger = get_logger(__name__)
 
+# JSON schema for vLLM guided decoding (built once, reused for every request)
+RECEIPT_JSON_SCHEMA = ReceiptExtraction.model_json_schema()
+
+
+def _guided_decoding_params() -> dict:
+    """Return vLLM guided decoding fields for the chat completion payload.
+
+    Grammar-constrained decoding makes the model emit only schema-valid JSON,
+    so no prose or markdown fences need stripping. Disabled unless
+    settings.LLM_GUIDED_JSON is set.
+
+    Returns:
+        Extra payload fields (empty when guided decoding is off).
+    """
+    if not settings.LLM_GUIDED_JSON:
+        return {}
+    return {
+        "guided_json": RECEIPT_JSON_SCHEMA,
+        "guided_decoding_backend": settings.LLM_GUIDED_DECODING_BACKEND,
+    }
+
 
 def _extract_json_from_response(content: str) -> str:
     """Extract JSON from LLM response that may include markdown or explanatory text.
@@ -30,8 +54,6 @@ def _extract_json_from_response(content: str) -> str:
     Raises:
         ValueError: If no valid JSON found in response.
     """
-    import re
-
     # Debug: Log first 200 chars of content
     logger.debug(f"Raw LLM response (first 200 chars): {content[:200]}")
 
@@ -53,15 +75,13 @@ def _extract_json_from_response(content: str) -> str:
     return content
 
 
-# Language-agnostic extraction prompt from adaptive parser spec
-EXTRACTION_PROMPT_TEMPLATE = """Analyze this grocery store receipt and extract the products.
-
-Receipt text:
-```
-{receipt_text}
-```
+# Language-agnostic extraction prompt from adaptive parser spec. The
+# instructions are a fixed system message and the receipt follows as the user
+# turn, so every request shares one prompt prefix that the server's prefix
+# cache can reuse instead of re-evaluating it per receipt.
+EXTRACTION_SYSTEM_PROMPT = """Analyze the grocery store receipt in the user message and extract the products.
 
-This receipt may be in any language. Extract each product with:
+The receipt may be in any language. Extract each product with:
 - name: Product name as written (preserve original language)
 - name_en: English translation if not already English (optional)
 - quantity: Number of items (default 1)
@@ -89,19 +109,19 @@ Focus on extracting the products accurately. Be conservative - if you're not sur
 
 OUTPUT INSTRUCTIONS:
 Return ONLY valid JSON with no explanations, no markdown formatting, no code blocks.
-Start your response directly with the opening brace {{.
+Start your response directly with the opening brace {.
 
 Use this exact JSON structure:
-{{
-  "store": {{
+{
+  "store": {
     "name": "string or null",
     "chain": "string or null",
     "country": "string or null",
     "language": "string or null",
     "currency": "string or null"
-  }},
+  },
   "products": [
-    {{
+    {
       "name": "string (required)",
       "name_en": "string or null",
       "quantity": 1.0,
@@ -109,12 +129,17 @@ Use this exact JSON structure:
       "volume_l": "number or null",
       "unit": "pcs",
       "price": "number or null"
-    }}
+    }
   ],
   "confidence": 0.95
-}}
+}
 """
 
+RECEIPT_MESSAGE_TEMPLATE = """Receipt text:
+```
+{receipt_text}
+```"""
+
 
 async def extract_products_from_receipt(ocr_text: str) -> ReceiptExtraction:
     """Extract structured product data from receipt OCR text using LLM.
@@ -132,52 +157,51 @@ async def extract_products_from_receipt(ocr_text: str) -> ReceiptExtraction:
     """
     logger.info("Extracting products from receipt using vLLM")
 
-    # Build prompt
-    prompt = EXTRACTION_PROMPT_TEMPLATE.format(
-        receipt_text=ocr_text[:4000]
-    )  # Limit to 4000 chars
+    prompt = build_prompt_for_store(ocr_text)
 
     try:
         # Call vLLM with structured output (OpenAI-compatible API)
         logger.debug(f"Calling vLLM model: {settings.LLM_MODEL}")
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            headers = {
-                "Authorization": f"Bearer {settings.LLM_API_KEY}",
-                "Content-Type": "application/json",
-            }
-
-            payload = {
-                "model": settings.LLM_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": settings.LLM_TEMPERATURE,
-                "max_tokens": 16384,  # Increased for large receipts (context window: 40k)
-                # Note: response_format with json_schema causes thinking loops in vLLM
-                # The prompt itself instructs the model to output JSON
-            }
-
-            response = await client.post(
-                f"{settings.LLM_BASE_URL}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
-
-            # Extract JSON from response (may be wrapped in markdown code blocks or text)
-            json_content = _extract_json_from_response(content)
-
-            # Parse and validate response
-            result = ReceiptExtraction.model_validate_json(json_content)
-
-            logger.info(
-                f"vLLM extraction complete: {len(result.products)} products, "
-                f"store: {result.get_store_info().name or 'unknown'}"
-            )
-
-            return result
+        client = await get_http_client()
+        headers = {
+            "Authorization": f"Bearer {settings.LLM_API_KEY}",
+            "Content-Type": "application/json",
+        }
+
+        payload = {
+            "model": settings.LLM_MODEL,
+            "messages": _build_messages(prompt),
+            "temperature": settings.LLM_TEMPERATURE,
+            "max_tokens": 16384,  # Increased for large receipts (context window: 40k)
+            # Note: response_format with json_schema causes thinking loops in vLLM
+            # The prompt itself instructs the model to output JSON
+            **_guided_decoding_params(),
+        }
+
+        response = await client.post(
+            f"{settings.LLM_BASE_URL}/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=settings.LLM_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        content = data["choices"][0]["message"]["content"]
+
+        # Extract JSON from response (may be wrapped in markdown code blocks or text)
+        json_content = _extract_json_from_response(content)
+
+        # Parse and validate response
+        result = ReceiptExtraction.model_validate_json(json_content)
+
+        logger.info(
+            f"vLLM extraction complete: {len(result.products)} products, "
+            f"store: {result.store.name or 'unknown'}"
+        )
+
+        return result
 
     except httpx.HTTPError as e:
         logger.error(f"vLLM API request failed: {e}")
@@ -187,17 +211,32 @@ async def extract_products_from_receipt(ocr_text: str) -> ReceiptExtraction:
         raise
 
 
+def _build_messages(prompt: str) -> list[dict]:
+    """Wrap a receipt prompt in the chat messages for an extraction request.
+
+    Args:
+        prompt: User message from build_prompt_for_store.
+
+    Returns:
+        System instructions followed by the receipt as the user turn.
+    """
+    return [
+        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
+
 def build_prompt_for_store(ocr_text: str, store_hint: str | None = None) -> str:
-    """Build extraction prompt with optional store hint.
+    """Build the extraction user message with optional store hint.
 
     Args:
-        ocr_text: OCR text from receipt.
+        ocr_text: OCR text from receipt (truncated to 4000 chars).
         store_hint: Optional known store name to guide extraction.
 
     Returns:
-        Formatted prompt string.
+        Formatted user message; the instructions are EXTRACTION_SYSTEM_PROMPT.
     """
-    prompt = EXTRACTION_PROMPT_TEMPLATE.format(receipt_text=ocr_text[:4000])
+    prompt = RECEIPT_MESSAGE_TEMPLATE.format(receipt_text=ocr_text[:4000])
 
     if store_hint:
         prompt += f"\n\nNote: This receipt appears to be from {store_hint}. Use this to help identify the store chain and format."
@@ -222,41 +261,41 @@ async def extract_with_store_hint(ocr_text: str, store_hint: str) -> ReceiptExtr
     logger.info(f"Extracting with store hint: {store_hint}")
 
     try:
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            headers = {
-                "Authorization": f"Bearer {settings.LLM_API_KEY}",
-                "Content-Type": "application/json",
-            }
-
-            payload = {
-                "model": settings.LLM_MODEL,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": settings.LLM_TEMPERATURE,
-                "max_tokens": 16384,  # Increased for large receipts (context window: 40k)
-                # Note: response_format with json_schema causes thinking loops in vLLM
-                # The prompt itself instructs the model to output JSON
-            }
-
-            response = await client.post(
-                f"{settings.LLM_BASE_URL}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
-
-            # Extract JSON from response (may be wrapped in markdown code blocks or text)
-            json_content = _extract_json_from_response(content)
-
-            result = ReceiptExtraction.model_validate_json(json_content)
-
-            logger.info(
-                f"Extraction with hint complete: {len(result.products)} products"
-            )
-
-            return result
+        client = await get_http_client()
+        headers = {
+            "Authorization": f"Bearer {settings.LLM_API_KEY}",
+            "Content-Type": "application/json",
+        }
+
+        payload = {
+            "model": settings.LLM_MODEL,
+            "messages": _build_messages(prompt),
+            "temperature": settings.LLM_TEMPERATURE,
+            "max_tokens": 16384,  # Increased for large receipts (context window: 40k)
+            # Note: response_format with json_schema causes thinking loops in vLLM
+            # The prompt itself instructs the model to output JSON
+            **_guided_decoding_params(),
+        }
+
+        response = await client.post(
+            f"{settings.LLM_BASE_URL}/chat/completions",
+            json=payload,
+            headers=headers,
+            timeout=settings.LLM_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        content = data["choices"][0]["message"]["content"]
+
+        # Extract JSON from response (may be wrapped in markdown code blocks or text)
+        json_content = _extract_json_from_response(content)
+
+        result = ReceiptExtraction.model_validate_json(json_content)
+
+        logger.info(f"Extraction with hint complete: {len(result.products)} products")
+
+        return result
 
     except httpx.HTTPError as e:
         logger.error(f"vLLM API request failed: {e}")
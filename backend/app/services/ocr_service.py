@@ -4,6 +4,7 @@ Routes between pdfplumber (digital PDFs) and MinerU (photo receipts).
 Based on reference implementation in samples/mineru_selfhosted.py.
 """
 
+import asyncio
 from pathlib import Path
 
 import httpx
@@ -11,6 +12,7 @@ import pdfplumber
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.services.http_client import get_http_client
 
 logger = get_logger(__name__)
 
@@ -36,7 +38,8 @@ async def extract_text_from_receipt(file_path: str) -> str:
 
     if path.suffix.lower() == ".pdf":
         logger.info(f"Extracting text from PDF: {path.name}")
-        return _extract_from_pdf(path)
+        # pdfplumber is synchronous and CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(_extract_from_pdf, path)
     elif path.suffix.lower() in [".jpg", ".jpeg", ".png", ".webp"]:
         logger.info(f"Extracting text from image via MinerU: {path.name}")
         return await _extract_from_image(path)
@@ -98,33 +101,35 @@ async def _extract_from_image(image_path: Path) -> str:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=settings.MINERU_TIMEOUT) as client:
-            # Open file and send to MinerU
-            with open(image_path, "rb") as f:  # noqa: ASYNC230
-                files = {"files": (image_path.name, f, "image/jpeg")}
-
-                logger.debug(f"Sending {image_path.name} to MinerU at {url}")
-                response = await client.post(url, data=form_data, files=files)
-                response.raise_for_status()
-
-            # Parse JSON response
-            json_resp = response.json()
-            logger.debug(f"Received MinerU response: {len(json_resp)} bytes")
-
-            # Extract markdown content from response
-            # Response structure: {"results": {"<filename>": {"md_content": "..."}}}
-            results = json_resp.get("results", {})
-            if not results:
-                logger.warning("MinerU returned empty results")
-                return ""
-
-            # Get first document result
-            doc_key = list(results.keys())[0]
-            doc_data = results[doc_key]
-            markdown_text = doc_data.get("md_content", "")
-
-            logger.info(f"Extracted {len(markdown_text)} chars from MinerU OCR")
-            return markdown_text
+        client = await get_http_client()
+        # Open file and send to MinerU
+        with open(image_path, "rb") as f:  # noqa: ASYNC230
+            files = {"files": (image_path.name, f, "image/jpeg")}
+
+            logger.debug(f"Sending {image_path.name} to MinerU at {url}")
+            response = await client.post(
+                url, data=form_data, files=files, timeout=settings.MINERU_TIMEOUT
+            )
+            response.raise_for_status()
+
+        # Parse JSON response
+        json_resp = response.json()
+        logger.debug(f"Received MinerU response: {len(json_resp)} bytes")
+
+        # Extract markdown content from response
+        # Response structure: {"results": {"<filename>": {"md_content": "..."}}}
+        results = json_resp.get("results", {})
+        if not results:
+            logger.warning("MinerU returned empty results")
+            return ""
+
+        # Get first document result
+        doc_key = list(results.keys())[0]
+        doc_data = results[doc_key]
+        markdown_text = doc_data.get("md_content", "")
+
+        logger.info(f"Extracted {len(markdown_text)} chars from MinerU OCR")
+        return markdown_text
 
     except httpx.HTTPError as e:
         logger.error(f"MinerU API request failed for {image_path}: {e}")
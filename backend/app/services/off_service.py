@@ -46,7 +46,10 @@ async def fetch_product_from_off(barcode: str) -> dict[str, Any]:
     url = f"{settings.OPENFOODFACTS_API_URL}/product/{barcode}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        timeout = httpx.Timeout(
+            settings.OFF_TIMEOUT, connect=settings.OFF_CONNECT_TIMEOUT
+        )
+        async with httpx.AsyncClient(timeout=timeout) as client:
             response = await client.get(url)
             response.raise_for_status()
             data = response.json()
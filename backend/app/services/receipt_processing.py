@@ -7,14 +7,22 @@ Coordinates the full receipt processing pipeline:
 4. Database updates
 """
 
+import asyncio
 from dataclasses import dataclass
+from uuid import UUID
 
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.crud import receipt as crud_receipt
 from app.models.receipt import Receipt
 from app.parsers.base import ReceiptExtraction
-from app.services.broadcast_helpers import broadcast_receipt_status
+from app.services.broadcast_helpers import (
+    broadcast_receipt_status,
+    broadcast_receipt_statuses,
+)
 from app.services.llm_extractor import extract_products_from_receipt
 from app.services.matching_service import MatchingService, MatchResult
 from app.services.ocr_service import extract_text_from_receipt
@@ -45,7 +53,7 @@ class ReceiptProcessingService:
         self.db = db
         self.matching_service = MatchingService(db)
 
-    async def process_receipt(self, receipt: Receipt) -> ProcessingResult:
+    async def process_receipt(self, receipt: Receipt) -> ProcessingResult | None:
         """Process a receipt through the full pipeline.
 
         Pipeline:
@@ -58,17 +66,127 @@ class ReceiptProcessingService:
             receipt: Receipt database record to process.
 
         Returns:
-            ProcessingResult with extraction results and any errors.
+            ProcessingResult with extraction results and any errors, or None
+            if the receipt is already being processed elsewhere.
         """
+        processed = await self.process_receipts([receipt])
+        return processed[0][1] if processed else None
+
+    async def process_receipts(
+        self, receipts: list[Receipt]
+    ) -> list[tuple[Receipt, ProcessingResult]]:
+        """Process several receipts, running their OCR and LLM steps concurrently.
+
+        OCR and LLM extraction don't touch the database session, so all
+        receipts are submitted at once (bounded by LLM_MAX_CONCURRENCY) and
+        vLLM's continuous batching packs the prompts together. Matching and
+        database updates then run one receipt at a time on the shared session.
+
+        Each receipt is claimed first; receipts another request or worker is
+        already processing are skipped rather than run twice. If processing is
+        aborted (cancelled request, unexpected error), every receipt not yet
+        finished is marked failed before the exception propagates, so none
+        stays claimed.
+
+        Args:
+            receipts: Receipt database records to process.
+
+        Returns:
+            (receipt, result) pairs for the claimed receipts, in input order.
+        """
+        receipts = await crud_receipt.claim_receipts(self.db, receipts)
+        unfinished = [receipt.id for receipt in receipts]
+
         try:
-            # Update status to processing
-            receipt.processing_status = "processing"
-            await self.db.commit()
-            logger.info(f"Starting processing for receipt {receipt.id}")
+            for receipt in receipts:
+                logger.info(f"Starting processing for receipt {receipt.id}")
+            await broadcast_receipt_statuses(
+                {"receipt_id": receipt.id, "status": "processing"}
+                for receipt in receipts
+            )
+
+            semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+            extractions = await asyncio.gather(
+                *(self._extract(receipt, semaphore) for receipt in receipts),
+                return_exceptions=True,
+            )
+
+            # Record every outcome before acting on any one of them, so a
+            # failed commit or an aborted extraction cannot drop later results
+            results = []
+            aborted: BaseException | None = None
+            for receipt_id, receipt, outcome in zip(
+                list(unfinished), receipts, extractions, strict=True
+            ):
+                if not isinstance(outcome, Exception | tuple):
+                    aborted = aborted or outcome
+                    continue
+                try:
+                    results.append(await self._record(receipt, outcome))
+                    unfinished.remove(receipt_id)
+                except Exception as e:
+                    logger.exception(
+                        f"Failed to record result for receipt {receipt_id}"
+                    )
+                    await self.db.rollback()
+                    results.append(
+                        ProcessingResult(
+                            success=False,
+                            ocr_text=None,
+                            extraction=None,
+                            matched_products=[],
+                            error=f"Receipt processing failed: {str(e)}",
+                        )
+                    )
+            if aborted is not None:
+                raise aborted
+            if unfinished:
+                await crud_receipt.release_claims(self.db, unfinished)
+                for receipt in receipts:
+                    await self.db.refresh(receipt)
+        except BaseException:
+            try:
+                await crud_receipt.release_claims(self.db, unfinished)
+            except Exception:
+                logger.exception(
+                    "Failed to release receipt claims",
+                    extra={"receipt_ids": [str(i) for i in unfinished]},
+                )
+            raise
+        return list(zip(receipts, results, strict=True))
+
+    async def process_batch(
+        self, batch_id: UUID
+    ) -> list[tuple[Receipt, ProcessingResult]] | None:
+        """Process every pending receipt in an upload batch, oldest first.
 
-            # Broadcast status update
-            await broadcast_receipt_status(receipt_id=receipt.id, status="processing")
+        Receipts that are already completed, confirmed or in progress
+        (including ones claimed concurrently by another worker) are skipped; a
+        stale "processing" claim is retried.
 
+        Args:
+            batch_id: Batch ID the receipts were uploaded with.
+
+        Returns:
+            (receipt, result) pairs for the processed receipts, or None if the
+            batch has no receipts at all.
+        """
+        receipts = await crud_receipt.get_receipts(self.db, batch_id=batch_id)
+        if not receipts:
+            return None
+
+        pending = [
+            receipt
+            for receipt in reversed(receipts)
+            if receipt.processing_status not in ("completed", "confirmed")
+        ]
+        return await self.process_receipts(pending)
+
+    async def _extract(
+        self, receipt: Receipt, semaphore: asyncio.Semaphore
+    ) -> tuple[str, ReceiptExtraction]:
+        """Run OCR and LLM extraction for one receipt (no database access)."""
+        async with semaphore:
             # Step 1: OCR text extraction
             logger.info(f"Extracting text from {receipt.image_path}")
             ocr_text = await extract_text_from_receipt(receipt.image_path)
@@ -81,7 +199,30 @@ class ReceiptProcessingService:
                 f"LLM extracted {len(extraction.products)} products "
                 f"(confidence: {extraction.confidence or 'N/A'})"
             )
+            return ocr_text, extraction
+
+    async def _record(
+        self,
+        receipt: Receipt,
+        outcome: Exception | tuple[str, ReceiptExtraction],
+    ) -> ProcessingResult:
+        """Store one receipt's extraction outcome."""
+        # A rollback after an earlier receipt failed expires every instance
+        await self._reload_if_expired(receipt)
+        if isinstance(outcome, Exception):
+            return await self._mark_failed(receipt, outcome)
+        return await self._complete(receipt, *outcome)
+
+    async def _reload_if_expired(self, receipt: Receipt) -> None:
+        """Reload a receipt whose attributes were expired by a rollback."""
+        if inspect(receipt).expired:
+            await self.db.refresh(receipt)
 
+    async def _complete(
+        self, receipt: Receipt, ocr_text: str, extraction: ReceiptExtraction
+    ) -> ProcessingResult:
+        """Match extracted products and store the results on the receipt."""
+        try:
             # Step 3: Fuzzy product matching
             matched_products = []
             for parsed_product in extraction.products:
@@ -116,7 +257,6 @@ class ReceiptProcessingService:
                 receipt.store_chain = extraction.store.chain
 
             await self.db.commit()
-            await self.db.refresh(receipt)
 
             # Broadcast completion status
             await broadcast_receipt_status(
@@ -140,23 +280,29 @@ class ReceiptProcessingService:
             )
 
         except Exception as e:
-            error_msg = f"Receipt processing failed: {str(e)}"
+            return await self._mark_failed(receipt, e)
 
-            # Update status to failed
-            receipt.processing_status = "failed"
-            await self.db.commit()
+    async def _mark_failed(
+        self, receipt: Receipt, error: Exception
+    ) -> ProcessingResult:
+        """Record a processing failure on the receipt and broadcast it."""
+        error_msg = f"Receipt processing failed: {str(error)}"
 
-            # Broadcast failure status
-            await broadcast_receipt_status(
-                receipt_id=receipt.id, status="failed", error=error_msg
-            )
+        # Update status to failed
+        receipt.processing_status = "failed"
+        await self.db.commit()
 
-            logger.error(error_msg, exc_info=True)
+        # Broadcast failure status
+        await broadcast_receipt_status(
+            receipt_id=receipt.id, status="failed", error=error_msg
+        )
 
-            return ProcessingResult(
-                success=False,
-                ocr_text=None,
-                extraction=None,
-                matched_products=[],
-                error=error_msg,
-            )
+        logger.error(error_msg, exc_info=error)
+
+        return ProcessingResult(
+            success=False,
+            ocr_text=None,
+            extraction=None,
+            matched_products=[],
+            error=error_msg,
+        )
@@ -0,0 +1,182 @@
+"""Redis-backed response cache for read-heavy GET endpoints.
+
+Responses are stored as JSON under ``kyokki:cache:<namespace>:v<n>:<key>``,
+where ``n`` is the namespace version kept at ``kyokki:cache:<namespace>:version``.
+A write that touches a resource bumps its namespace version, which makes
+every cached entry for it unreachable in one O(1) command; orphaned entries
+simply expire with their TTL. A read that started before the bump stores its
+result under the old version, so it cannot repopulate the cache with stale
+data. Redis failures never break a request: reads fall through to the
+database and writes simply skip caching.
+"""
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.services.broadcast_helpers import get_redis_client
+
+logger = get_logger(__name__)
+
+CACHE_PREFIX = "kyokki:cache"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{CACHE_PREFIX}:{namespace}:version"
+
+
+async def _cache_key(namespace: str, key: str) -> str | None:
+    """Build the key for the namespace's current version, or None if Redis fails."""
+    try:
+        redis = await get_redis_client()
+        version = await redis.get(_version_key(namespace))
+    except Exception:
+        logger.warning(
+            "response_cache_read_failed",
+            extra={"namespace": namespace, "key": key},
+        )
+        return None
+    return f"{CACHE_PREFIX}:{namespace}:v{int(version or 0)}:{key}"
+
+
+async def _read(cache_key: str) -> bytes | None:
+    """Fetch a cached payload, treating Redis errors as a miss."""
+    try:
+        redis = await get_redis_client()
+        return await redis.get(cache_key)
+    except Exception:
+        logger.warning("response_cache_read_failed", extra={"cache_key": cache_key})
+        return None
+
+
+async def _write(cache_key: str, payload: bytes, ttl: int | None) -> None:
+    """Store a serialized payload, ignoring Redis errors."""
+    try:
+        redis = await get_redis_client()
+        await redis.set(
+            cache_key,
+            payload,
+            ex=ttl if ttl is not None else settings.RESPONSE_CACHE_TTL,
+        )
+    except Exception:
+        logger.warning("response_cache_write_failed", extra={"cache_key": cache_key})
+
+
+async def cached_response(
+    namespace: str,
+    key: str,
+    response_type: Any,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int | None = None,
+) -> Any:
+    """Return a cached response, or load, cache and return a fresh one.
+
+    ``None`` results (e.g. 404 lookups) are never cached.
+
+    Args:
+        namespace: Resource namespace used for invalidation (e.g. "products").
+        key: Cache key within the namespace, derived from the request params.
+        response_type: Response model type used to serialize the loaded value.
+        loader: Coroutine factory that fetches the value from the database.
+        ttl: Expiry in seconds (defaults to settings.RESPONSE_CACHE_TTL).
+
+    Returns:
+        Decoded JSON on a cache hit, otherwise the loader's result.
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return await loader()
+
+    cache_key = await _cache_key(namespace, key)
+    if cache_key is None:
+        return await loader()
+
+    raw = await _read(cache_key)
+    if raw is not None:
+        return json.loads(raw)
+
+    value = await loader()
+    if value is None:
+        return None
+
+    try:
+        adapter = TypeAdapter(response_type)
+        payload = adapter.dump_json(
+            adapter.validate_python(value, from_attributes=True)
+        )
+    except Exception:
+        logger.warning("response_cache_write_failed", extra={"cache_key": cache_key})
+    else:
+        await _write(cache_key, payload, ttl)
+
+    return value
+
+
+async def cached_json(
+    namespace: str,
+    key: str,
+    adapter: TypeAdapter,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int | None = None,
+) -> bytes | None:
+    """Return the JSON body for a response, from the cache or freshly serialized.
+
+    Unlike ``cached_response`` the payload is never decoded: a hit returns the
+    stored bytes untouched, and a miss serializes the loaded rows once for
+    both the cache and the response. List endpoints use this so a large
+    result is not held as ORM objects, Python dicts and JSON all at once.
+
+    Args:
+        namespace: Resource namespace used for invalidation (e.g. "products").
+        key: Cache key within the namespace, derived from the request params.
+        adapter: TypeAdapter for the endpoint's response model.
+        loader: Coroutine factory that fetches the value from the database.
+        ttl: Expiry in seconds (defaults to settings.RESPONSE_CACHE_TTL).
+
+    Returns:
+        JSON bytes, or None if the loader found nothing.
+    """
+    cache_key = None
+    if settings.RESPONSE_CACHE_ENABLED:
+        cache_key = await _cache_key(namespace, key)
+    if cache_key is not None:
+        raw = await _read(cache_key)
+        if raw is not None:
+            return raw
+
+    value = await loader()
+    if value is None:
+        return None
+    payload = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+    if cache_key is not None:
+        await _write(cache_key, payload, ttl)
+    return payload
+
+
+async def invalidate(*namespaces: str) -> None:
+    """Drop every cached response in the given namespaces.
+
+    Bumps each namespace's version, so this costs one INCR per namespace
+    however many entries are cached.
+
+    Args:
+        namespaces: Resource namespaces to clear (e.g. "inventory").
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+
+    try:
+        redis = await get_redis_client()
+        async with redis.pipeline(transaction=False) as pipe:
+            for namespace in namespaces:
+                pipe.incr(_version_key(namespace))
+            await pipe.execute()
+    except Exception:
+        logger.warning(
+            "response_cache_invalidate_failed",
+            extra={"namespaces": list(namespaces)},
+        )
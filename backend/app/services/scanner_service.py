@@ -9,6 +9,7 @@ from app.core.logging import get_logger
 from app.crud import inventory_item as crud_inventory
 from app.crud import product_master as crud_product
 from app.schemas.inventory_item import InventoryItemCreate
+from app.services import response_cache
 from app.services.broadcast_helpers import (
     broadcast_inventory_update,
     broadcast_scanner_action,
@@ -27,6 +28,13 @@ GLOBAL_MODE_KEY = "scanner:mode:global"
 DEFAULT_MODE = "add"
 STATION_ONLINE_TTL = 300  # 5 minutes
 
+# Inventory location for items added by scan, by product storage type
+LOCATION_BY_STORAGE_TYPE = {
+    "refrigerator": "main_fridge",
+    "freezer": "freezer",
+    "pantry": "pantry",
+}
+
 # Key prefix/suffix used to extract station_id from Redis keys
 _STATION_KEY_PREFIX = "scanner:station:"
 _STATION_ONLINE_SUFFIX = ":online"
@@ -216,6 +224,9 @@ async def _handle_add(
     created_product = False
 
     if not product:
+        # End the lookup transaction so the pooled connection is free while
+        # the OFF request is in flight
+        await db.commit()
         enriched = await enrich_product_from_off(barcode)
         product, created_product = await crud_product.enrich_product_from_off_data(
             db, enriched
@@ -227,13 +238,7 @@ async def _handle_add(
     shelf_life = product.default_shelf_life_days or 365
     expiry = datetime.now(UTC).date() + timedelta(days=shelf_life)
 
-    # Map storage_type to location
-    location_map = {
-        "refrigerator": "main_fridge",
-        "freezer": "freezer",
-        "pantry": "pantry",
-    }
-    location = location_map.get(product.storage_type, "main_fridge")
+    location = LOCATION_BY_STORAGE_TYPE.get(product.storage_type, "main_fridge")
 
     item_quantity = (
         product.default_quantity if product.default_quantity is not None else quantity
@@ -249,6 +254,10 @@ async def _handle_add(
         purchase_date=datetime.now(UTC).date(),
     )
     inv_item = await crud_inventory.create_inventory_item(db, inventory_create)
+    if created_product:
+        await response_cache.invalidate("products", "inventory")
+    else:
+        await response_cache.invalidate("inventory")
 
     await broadcast_scanner_action(
         action=action,
@@ -310,6 +319,7 @@ async def _handle_consume(
     capped = consume_qty < quantity
 
     updated = await crud_inventory.consume_inventory_item(db, inv_item.id, consume_qty)
+    await response_cache.invalidate("inventory")
 
     await broadcast_scanner_action(
         action="inventory_consumed",
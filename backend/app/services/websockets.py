@@ -1,20 +1,30 @@
 """WebSocket connection manager for real-time updates."""
 
+import asyncio
 import json
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.core.config import settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and broadcasts messages."""
+    """Manages WebSocket connections and broadcasts messages.
 
-    def __init__(self):
+    Each client gets a bounded outbox drained by its own sender task, so a
+    slow client only falls behind itself instead of stalling the broadcast.
+    When an outbox is full the oldest message is dropped.
+    """
+
+    def __init__(self, queue_size: int | None = None):
         self.active_connections: list[WebSocket] = []
+        self._queue_size = queue_size or settings.WS_CLIENT_QUEUE_SIZE
+        self._outboxes: dict[WebSocket, asyncio.Queue[str]] = {}
+        self._senders: dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         """Accept WebSocket connection and add to active connections.
@@ -24,13 +34,18 @@ class ConnectionManager:
         """
         await websocket.accept()
         self.active_connections.append(websocket)
+        outbox: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
+        self._outboxes[websocket] = outbox
+        self._senders[websocket] = asyncio.create_task(
+            self._send_loop(websocket, outbox)
+        )
         logger.info(
             "websocket_connected",
             extra={"total_connections": len(self.active_connections)},
         )
 
     def disconnect(self, websocket: WebSocket):
-        """Remove WebSocket from active connections.
+        """Remove WebSocket from active connections and stop its sender.
 
         Args:
             websocket: WebSocket connection to remove.
@@ -42,29 +57,57 @@ class ConnectionManager:
                 extra={"total_connections": len(self.active_connections)},
             )
 
-    async def broadcast(self, message: str):
-        """Broadcast message to all connected clients with error handling.
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
 
-        Automatically removes disconnected clients.
+        # Discard undelivered messages so nothing waits on this outbox
+        outbox = self._outboxes.pop(websocket, None)
+        while outbox is not None and not outbox.empty():
+            outbox.get_nowait()
+            outbox.task_done()
+
+    async def _send_loop(self, websocket: WebSocket, outbox: asyncio.Queue[str]):
+        """Deliver queued messages to one client until it disconnects.
 
         Args:
-            message: Text message to broadcast.
+            websocket: Target WebSocket connection.
+            outbox: The client's message queue.
         """
-        disconnected_clients = []
-
-        for connection in self.active_connections:
+        while True:
+            message = await outbox.get()
             try:
-                await connection.send_text(message)
+                await websocket.send_text(message)
             except Exception as e:
                 logger.warning(
                     "websocket_send_failed",
                     extra={"error": str(e), "operation": "broadcast"},
                 )
-                disconnected_clients.append(connection)
+                self.disconnect(websocket)
+                return
+            finally:
+                outbox.task_done()
 
-        # Clean up disconnected clients
-        for client in disconnected_clients:
-            self.disconnect(client)
+    async def broadcast(self, message: str):
+        """Queue a message for every connected client without waiting on sends.
+
+        Clients that fail a send are removed by their sender task.
+
+        Args:
+            message: Text message to broadcast.
+        """
+        for connection in self.active_connections:
+            outbox = self._outboxes.get(connection)
+            if outbox is None:
+                continue
+            if outbox.full():
+                outbox.get_nowait()
+                outbox.task_done()
+                logger.warning(
+                    "websocket_message_dropped",
+                    extra={"queue_size": self._queue_size},
+                )
+            outbox.put_nowait(message)
 
         logger.debug(
             "broadcast_complete",
@@ -0,0 +1,6 @@
+"""Celery tasks, registered via ``celery_app``'s ``include=["app.tasks"]``."""
+
+from app.tasks.process_receipt_batch_task import process_receipt_batch_task
+from app.tasks.process_receipt_task import process_receipt_task
+
+__all__ = ["process_receipt_batch_task", "process_receipt_task"]
@@ -0,0 +1,70 @@
+"""Celery task running the receipt pipeline for a whole upload batch.
+
+All of the batch's OCR and LLM extractions are submitted together on the
+worker, so vLLM batches the prompts without holding an API request open.
+"""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from app.core.celery_app import celery_app
+from app.core.logging import get_logger
+from app.db.session import AsyncSessionLocal, engine
+from app.schemas.receipt import ReceiptBatchItemResult, ReceiptBatchProcessingResponse
+from app.services.broadcast_helpers import close_redis_client
+from app.services.http_client import close_http_client
+from app.services.receipt_processing import ReceiptProcessingService
+
+logger = get_logger(__name__)
+
+
+async def _process_batch(batch_id: UUID) -> dict[str, Any]:
+    """Run the processing pipeline for every pending receipt in a batch.
+
+    Completed and confirmed receipts are left alone, so re-queuing a batch
+    never re-extracts a receipt whose items were already added to inventory.
+
+    Args:
+        batch_id: Batch ID the receipts were uploaded with.
+
+    Returns:
+        ReceiptBatchProcessingResponse payload as a JSON-compatible dict.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            processed = await ReceiptProcessingService(db).process_batch(batch_id)
+            return ReceiptBatchProcessingResponse(
+                batch_id=batch_id,
+                results=[
+                    ReceiptBatchItemResult(
+                        receipt_id=receipt.id,
+                        success=result.success,
+                        items_extracted=(
+                            len(result.extraction.products) if result.extraction else 0
+                        ),
+                        items_matched=len(result.matched_products),
+                        error=result.error,
+                    )
+                    for receipt, result in processed or []
+                ],
+            ).model_dump(mode="json")
+    finally:
+        # Every task runs in a fresh event loop; drop loop-bound connections
+        await engine.dispose()
+        await close_redis_client()
+        await close_http_client()
+
+
+@celery_app.task(name="receipts.process_batch")
+def process_receipt_batch_task(batch_id: str) -> dict[str, Any]:
+    """Process every pending receipt in an upload batch.
+
+    Args:
+        batch_id: Batch UUID as a string.
+
+    Returns:
+        ReceiptBatchProcessingResponse payload as a dict.
+    """
+    logger.info("process_receipt_batch_task_started", extra={"batch_id": batch_id})
+    return asyncio.run(_process_batch(UUID(batch_id)))
@@ -0,0 +1,73 @@
+"""Celery task running the receipt pipeline outside the API process.
+
+OCR and LLM extraction take tens of seconds; running them on a worker frees
+the API request (and its DB session) immediately.
+"""
+
+import asyncio
+from typing import Any
+from uuid import UUID
+
+from app.core.celery_app import celery_app
+from app.core.logging import get_logger
+from app.crud import receipt as crud_receipt
+from app.db.session import AsyncSessionLocal, engine
+from app.schemas.receipt import ReceiptProcessingResponse
+from app.services.broadcast_helpers import close_redis_client
+from app.services.http_client import close_http_client
+from app.services.receipt_processing import ReceiptProcessingService
+
+logger = get_logger(__name__)
+
+
+async def _process_receipt(receipt_id: UUID) -> dict[str, Any]:
+    """Run the processing pipeline for one receipt.
+
+    Args:
+        receipt_id: Receipt UUID to process.
+
+    Returns:
+        ReceiptProcessingResponse payload as a dict.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            receipt = await crud_receipt.get_receipt(db, receipt_id)
+            if not receipt:
+                return ReceiptProcessingResponse(
+                    success=False, error=f"Receipt '{receipt_id}' not found"
+                ).model_dump()
+
+            result = await ReceiptProcessingService(db).process_receipt(receipt)
+            if result is None:
+                return ReceiptProcessingResponse(
+                    success=False,
+                    error=f"Receipt '{receipt_id}' is already being processed",
+                ).model_dump()
+
+            return ReceiptProcessingResponse(
+                success=result.success,
+                items_extracted=(
+                    len(result.extraction.products) if result.extraction else 0
+                ),
+                items_matched=len(result.matched_products),
+                error=result.error,
+            ).model_dump()
+    finally:
+        # Every task runs in a fresh event loop; drop loop-bound connections
+        await engine.dispose()
+        await close_redis_client()
+        await close_http_client()
+
+
+@celery_app.task(name="receipts.process")
+def process_receipt_task(receipt_id: str) -> dict[str, Any]:
+    """Process a receipt through OCR → LLM extraction → product matching.
+
+    Args:
+        receipt_id: Receipt UUID as a string.
+
+    Returns:
+        ReceiptProcessingResponse payload as a dict.
+    """
+    logger.info("process_receipt_task_started", extra={"receipt_id": receipt_id})
+    return asyncio.run(_process_receipt(UUID(receipt_id)))
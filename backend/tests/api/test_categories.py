@@ -76,6 +76,46 @@ class TestListCategories:
         sort_orders = [cat["sort_order"] for cat in categories]
         assert sort_orders == sorted(sort_orders)
 
+    async def test_list_categories_etag_returns_304(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """GET /api/categories should honour If-None-Match until a category changes."""
+        first = await client.get("/api/categories")
+        etag = first.headers["etag"]
+
+        cached = await client.get("/api/categories", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        await client.patch("/api/categories/dairy", json={"display_name": "Milk"})
+        changed = await client.get("/api/categories", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+    async def test_list_categories_cache_hit_returns_stored_bytes(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """A cached list should be sent back byte for byte, without a DB load."""
+        from unittest.mock import AsyncMock, patch
+
+        payload = b'[{"id":"cached"}]'
+
+        with (
+            patch(
+                "app.services.response_cache.cached_json",
+                new_callable=AsyncMock,
+                return_value=payload,
+            ),
+            patch(
+                "app.api.endpoints.categories.crud_category.get_categories"
+            ) as mock_load,
+        ):
+            response = await client.get("/api/categories")
+
+        assert response.status_code == 200
+        assert response.content == payload
+        mock_load.assert_not_called()
+
 
 class TestGetCategory:
     """Test GET /api/categories/{id} endpoint."""
@@ -0,0 +1,39 @@
+"""Tests for conditional GET helpers."""
+
+from starlette.requests import Request
+
+from app.api.conditional import compute_etag, is_not_modified
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+class TestConditional:
+    """Tests for compute_etag and is_not_modified."""
+
+    def test_etag_is_quoted_and_stable(self) -> None:
+        """Same body should always produce the same quoted ETag."""
+        etag = compute_etag(b'{"id": 1}')
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == compute_etag(b'{"id": 1}')
+        assert etag != compute_etag(b'{"id": 2}')
+
+    def test_matching_etag_is_not_modified(self) -> None:
+        """A matching If-None-Match (including weak and list forms) should match."""
+        etag = compute_etag(b"body")
+
+        assert is_not_modified(_request(etag), etag)
+        assert is_not_modified(_request(f'"other", W/{etag}'), etag)
+        assert is_not_modified(_request("*"), etag)
+
+    def test_missing_or_stale_etag_is_modified(self) -> None:
+        """No header or a different ETag should require a full response."""
+        etag = compute_etag(b"body")
+
+        assert not is_not_modified(_request(), etag)
+        assert not is_not_modified(_request('"stale"'), etag)
@@ -298,6 +298,7 @@ class TestCreateInventoryItem:
         response = await client.post("/api/inventory", json=invalid_item)
 
         assert response.status_code == 400
+        assert fake_uuid in response.json()["detail"]
 
     async def test_create_inventory_item_missing_required_fields(
         self, client: AsyncClient, seeded_db: AsyncSession
@@ -313,6 +314,65 @@ class TestCreateInventoryItem:
         assert response.status_code == 422  # Validation error
 
 
+class TestBulkCreateInventoryItems:
+    """Test POST /api/inventory/bulk endpoint."""
+
+    async def test_bulk_create_inventory_items_success(
+        self, client: AsyncClient, seeded_db: AsyncSession, test_product: dict
+    ) -> None:
+        """POST /api/inventory/bulk should create every item, in order."""
+        expiry = str(date.today() + timedelta(days=7))
+        new_items = [
+            {
+                "product_master_id": test_product["id"],
+                "initial_quantity": quantity,
+                "current_quantity": quantity,
+                "unit": "ml",
+                "expiry_date": expiry,
+            }
+            for quantity in (250, 500, 1000)
+        ]
+
+        response = await client.post("/api/inventory/bulk", json=new_items)
+
+        assert response.status_code == 201
+        items = response.json()
+        assert [item["initial_quantity"] for item in items] == [
+            "250.00",
+            "500.00",
+            "1000.00",
+        ]
+        assert all(UUID(item["id"]) for item in items)
+
+        list_response = await client.get("/api/inventory")
+        assert len(list_response.json()) == 3
+
+    async def test_bulk_create_inventory_items_invalid_product(
+        self, client: AsyncClient, seeded_db: AsyncSession, test_product: dict
+    ) -> None:
+        """POST /api/inventory/bulk should reject the batch if any product is unknown."""
+        expiry = str(date.today() + timedelta(days=7))
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        new_items = [
+            {
+                "product_master_id": product_id,
+                "initial_quantity": 1,
+                "current_quantity": 1,
+                "unit": "pcs",
+                "expiry_date": expiry,
+            }
+            for product_id in (test_product["id"], fake_uuid)
+        ]
+
+        response = await client.post("/api/inventory/bulk", json=new_items)
+
+        assert response.status_code == 400
+        assert fake_uuid in response.json()["detail"]
+
+        list_response = await client.get("/api/inventory")
+        assert list_response.json() == []
+
+
 class TestUpdateInventoryItem:
     """Test PATCH /api/inventory/{id} endpoint."""
 
@@ -555,3 +615,75 @@ class TestConsumeInventoryItem:
         )
 
         assert response.status_code == 404
+
+
+class TestBulkConsumeInventoryItems:
+    """Test POST /api/inventory/consume endpoint."""
+
+    async def _create_items(
+        self, client: AsyncClient, product_id: str, quantities: list[int]
+    ) -> list[dict]:
+        expiry = str(date.today() + timedelta(days=7))
+        response = await client.post(
+            "/api/inventory/bulk",
+            json=[
+                {
+                    "product_master_id": product_id,
+                    "initial_quantity": 1000,
+                    "current_quantity": quantity,
+                    "unit": "ml",
+                    "status": "sealed",
+                    "expiry_date": expiry,
+                }
+                for quantity in quantities
+            ],
+        )
+        return response.json()
+
+    async def test_bulk_consume_applies_status_rules(
+        self, client: AsyncClient, seeded_db: AsyncSession, test_product: dict
+    ) -> None:
+        """POST /api/inventory/consume should update every item, in order."""
+        items = await self._create_items(client, test_product["id"], [1000] * 3)
+
+        response = await client.post(
+            "/api/inventory/consume",
+            json=[
+                {"item_id": items[0]["id"], "quantity": 250},
+                {"item_id": items[1]["id"], "quantity": 500},
+                {"item_id": items[2]["id"], "quantity": 1000},
+            ],
+        )
+
+        assert response.status_code == 200
+        consumed = response.json()
+        assert [item["id"] for item in consumed] == [item["id"] for item in items]
+        assert [item["current_quantity"] for item in consumed] == [
+            "750.00",
+            "500.00",
+            "0.00",
+        ]
+        assert [item["status"] for item in consumed] == ["opened", "partial", "empty"]
+        assert consumed[0]["opened_date"] == str(date.today())
+        assert consumed[2]["opened_date"] is None
+
+    async def test_bulk_consume_is_all_or_nothing(
+        self, client: AsyncClient, seeded_db: AsyncSession, test_product: dict
+    ) -> None:
+        """POST /api/inventory/consume should reject the batch if any item is short."""
+        items = await self._create_items(client, test_product["id"], [1000, 100])
+
+        response = await client.post(
+            "/api/inventory/consume",
+            json=[
+                {"item_id": items[0]["id"], "quantity": 250},
+                {"item_id": items[1]["id"], "quantity": 500},
+            ],
+        )
+
+        assert response.status_code == 400
+        assert items[1]["id"] in response.json()["detail"]
+
+        untouched = await client.get(f"/api/inventory/{items[0]['id']}")
+        assert untouched.json()["current_quantity"] == "1000.00"
+        assert untouched.json()["status"] == "sealed"
@@ -112,6 +112,35 @@ class TestListProducts:
         assert len(products) == 1
         assert "Milk" in products[0]["canonical_name"]
 
+    async def test_list_products_etag_returns_304(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """GET /api/products should return 304 until a product is written."""
+        product_data = {
+            "canonical_name": "Valio Whole Milk 1L",
+            "category": "dairy",
+            "storage_type": "refrigerator",
+            "default_shelf_life_days": 7,
+            "unit_type": "volume",
+            "default_unit": "ml",
+        }
+        await client.post("/api/products", json=product_data)
+
+        first = await client.get("/api/products")
+        etag = first.headers["etag"]
+        assert "last-modified" in first.headers
+
+        cached = await client.get("/api/products", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        await client.post(
+            "/api/products", json={**product_data, "canonical_name": "Oat Milk 1L"}
+        )
+        changed = await client.get("/api/products", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert len(changed.json()) == 2
+
 
 class TestGetProduct:
     """Test GET /api/products/{id} endpoint."""
@@ -227,6 +256,99 @@ class TestCreateProduct:
         assert response.status_code == 422  # Validation error
 
 
+class TestBulkUpsertProducts:
+    """Test POST /api/products/bulk endpoint."""
+
+    async def test_bulk_upsert_creates_and_updates(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """POST /api/products/bulk should insert new rows and update by barcode."""
+        base = {
+            "category": "dairy",
+            "storage_type": "refrigerator",
+            "default_shelf_life_days": 7,
+            "unit_type": "volume",
+            "default_unit": "ml",
+        }
+        existing = await client.post(
+            "/api/products",
+            json={**base, "canonical_name": "Old Milk", "off_product_id": "111"},
+        )
+
+        response = await client.post(
+            "/api/products/bulk",
+            json=[
+                {**base, "canonical_name": "New Milk", "off_product_id": "111"},
+                {**base, "canonical_name": "Oat Drink", "off_product_id": "222"},
+                {**base, "canonical_name": "Loose Carrots"},
+            ],
+        )
+
+        assert response.status_code == 200
+        products = response.json()
+        assert [p["canonical_name"] for p in products] == [
+            "New Milk",
+            "Oat Drink",
+            "Loose Carrots",
+        ]
+        assert products[0]["id"] == existing.json()["id"]
+
+        listed = await client.get("/api/products")
+        assert len(listed.json()) == 3
+
+    async def test_bulk_upsert_returns_payload_order(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """Results should follow the payload across batches, updates included."""
+        from unittest.mock import patch
+
+        base = {
+            "category": "dairy",
+            "storage_type": "refrigerator",
+            "default_shelf_life_days": 7,
+            "unit_type": "volume",
+            "default_unit": "ml",
+        }
+        await client.post(
+            "/api/products",
+            json={**base, "canonical_name": "Old Milk", "off_product_id": "111"},
+        )
+        names = ["Carrots", "Oat Drink", "Leeks", "Milk", "Kale"]
+        barcodes = [None, "222", None, "111", "333"]
+
+        with patch("app.crud.product_master.BULK_UPSERT_BATCH_SIZE", 2):
+            response = await client.post(
+                "/api/products/bulk",
+                json=[
+                    {**base, "canonical_name": name, "off_product_id": barcode}
+                    for name, barcode in zip(names, barcodes, strict=True)
+                ],
+            )
+
+        assert response.status_code == 200
+        assert [p["canonical_name"] for p in response.json()] == names
+
+    async def test_bulk_upsert_invalid_category(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """POST /api/products/bulk should reject unknown categories."""
+        response = await client.post(
+            "/api/products/bulk",
+            json=[
+                {
+                    "canonical_name": "Mystery",
+                    "category": "nonexistent",
+                    "storage_type": "pantry",
+                    "default_shelf_life_days": 7,
+                    "unit_type": "count",
+                    "default_unit": "pcs",
+                }
+            ],
+        )
+
+        assert response.status_code == 400
+
+
 class TestUpdateProduct:
     """Test PATCH /api/products/{id} endpoint."""
 
@@ -304,6 +426,35 @@ class TestDeleteProduct:
         get_response = await client.get(f"/api/products/{created_product['id']}")
         assert get_response.status_code == 404
 
+    async def test_delete_product_keeps_shopping_list_items(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """Deleting a product should unlink, not delete, its shopping list items."""
+        from app.models.shopping_list_item import ShoppingListItem
+
+        product_data = {
+            "canonical_name": "On The List",
+            "category": "pantry",
+            "storage_type": "pantry",
+            "default_shelf_life_days": 365,
+            "unit_type": "count",
+            "default_unit": "pcs",
+        }
+        create_response = await client.post("/api/products", json=product_data)
+        product_id = UUID(create_response.json()["id"])
+
+        item = ShoppingListItem(
+            product_master_id=product_id, name="On The List", quantity=1, unit="pcs"
+        )
+        seeded_db.add(item)
+        await seeded_db.commit()
+
+        response = await client.delete(f"/api/products/{product_id}")
+
+        assert response.status_code == 204
+        await seeded_db.refresh(item)
+        assert item.product_master_id is None
+
     async def test_delete_product_not_found(
         self, client: AsyncClient, seeded_db: AsyncSession
     ) -> None:
@@ -348,6 +499,33 @@ class TestLookupByBarcode:
 
         assert response.status_code == 404
 
+    async def test_lookup_barcode_etag_returns_304(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """GET /api/products/barcode/{barcode} should honour If-None-Match."""
+        product_data = {
+            "canonical_name": "Product with Barcode",
+            "category": "dairy",
+            "storage_type": "refrigerator",
+            "default_shelf_life_days": 7,
+            "unit_type": "volume",
+            "default_unit": "ml",
+            "off_product_id": "1234567890123",
+        }
+        await client.post("/api/products", json=product_data)
+
+        first = await client.get("/api/products/barcode/1234567890123")
+        etag = first.headers["etag"]
+
+        second = await client.get(
+            "/api/products/barcode/1234567890123",
+            headers={"If-None-Match": etag},
+        )
+
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert second.content == b""
+
 
 class TestEnrichProduct:
     """Test POST /api/products/enrich endpoint."""
@@ -384,6 +562,9 @@ class TestEnrichProduct:
             assert product["off_product_id"] == barcode
             assert product["off_data"] is not None
             assert product["off_data"]["product_name"] == "Valio Whole Milk"
+            # New products take the category's default shelf life
+            assert product["default_shelf_life_days"] == 7
+            assert product["storage_type"] == "refrigerator"
 
     async def test_enrich_updates_existing_product(
         self, client: AsyncClient, seeded_db: AsyncSession
@@ -467,6 +648,75 @@ class TestEnrichProduct:
             assert response.status_code == 503
             assert "Open Food Facts API unavailable" in response.json()["detail"]
 
+    async def test_enrich_coalesces_concurrent_requests(
+        self, client: AsyncClient, seeded_db: AsyncSession
+    ) -> None:
+        """Concurrent enrich calls for one barcode should hit OFF only once."""
+        import asyncio
+        from unittest.mock import patch
+
+        barcode = "5901234123457"
+        mock_enriched_data = {
+            "canonical_name": "Valio Whole Milk 1L",
+            "category": "dairy",
+            "off_product_id": barcode,
+            "off_data": {"product_name": "Valio Whole Milk"},
+        }
+        calls = 0
+
+        async def slow_enrich(_barcode: str) -> dict:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return mock_enriched_data
+
+        with patch(
+            "app.api.endpoints.products.enrich_product_from_off",
+            side_effect=slow_enrich,
+        ):
+            responses = await asyncio.gather(
+                *(
+                    client.post(f"/api/products/enrich?barcode={barcode}")
+                    for _ in range(3)
+                )
+            )
+
+        assert calls == 1
+        # Only the request that ran the enrichment created the product
+        assert sorted(r.status_code for r in responses) == [200, 200, 201]
+        assert len({r.json()["id"] for r in responses}) == 1
+
+    async def test_enrich_follower_takes_over_cancelled_leader(self) -> None:
+        """A waiting caller should rerun the enrichment if the leader is cancelled."""
+        import asyncio
+        from unittest.mock import patch
+
+        from app.api.endpoints.products import _enrich_coalesced
+
+        started = asyncio.Event()
+        calls = 0
+
+        async def slow_enrich(_barcode: str, _db: object) -> tuple[str, bool]:
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.05)
+            return "product", True
+
+        with patch(
+            "app.api.endpoints.products._enrich_and_store", side_effect=slow_enrich
+        ):
+            leader = asyncio.create_task(_enrich_coalesced("5901234123457", None))
+            await started.wait()
+            follower = asyncio.create_task(_enrich_coalesced("5901234123457", None))
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            assert await follower == ("product", True)
+
+        assert leader.cancelled()
+        assert calls == 2
+
     async def test_enrich_requires_barcode_parameter(
         self, client: AsyncClient, seeded_db: AsyncSession
     ) -> None:
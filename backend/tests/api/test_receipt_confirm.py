@@ -76,7 +76,7 @@ async def processed_receipt(
 ) -> dict:
     """Create and process a receipt."""
     # Upload receipt
-    file_content = b"fake receipt"
+    file_content = b"\xff\xd8\xff\xe0fake receipt"  # JPEG magic bytes
     files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
     create_response = await client.post("/api/receipts/scan", files=files)
     receipt_id = create_response.json()["id"]
@@ -1,16 +1,23 @@
 """Tests for Receipt API endpoints."""
 
+import hashlib
 import shutil
 from io import BytesIO
+from uuid import UUID
 
 import anyio
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud import receipt as crud_receipt
 from app.db.session import get_db
 from app.main import app
 
+# Uploads are validated by magic bytes, so fake files need a real header
+JPEG_HEADER = b"\xff\xd8\xff\xe0"
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
 
 @pytest.fixture
 async def test_db(db_session: AsyncSession):
@@ -45,7 +52,7 @@ class TestUploadReceipt:
     ) -> None:
         """POST /api/receipts/scan should successfully upload an image file."""
         # Create a fake image file
-        file_content = b"fake image content"
+        file_content = JPEG_HEADER + b"fake image content"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
         data = {"store_chain": "S-Market", "purchase_date": "2024-01-05"}
 
@@ -54,6 +61,7 @@ class TestUploadReceipt:
         assert response.status_code == 201
         receipt = response.json()
         assert "id" in receipt
+        assert response.headers["Location"].endswith(f"/api/receipts/{receipt['id']}")
         assert receipt["store_chain"] == "S-Market"
         assert receipt["purchase_date"] == "2024-01-05"
         assert receipt["processing_status"] == "uploaded"
@@ -81,7 +89,7 @@ class TestUploadReceipt:
         self, client: AsyncClient, test_db: AsyncSession
     ) -> None:
         """POST /api/receipts/scan should work without optional metadata."""
-        file_content = b"fake image content"
+        file_content = PNG_HEADER + b"fake image content"
         files = {"file": ("receipt.png", BytesIO(file_content), "image/png")}
 
         response = await client.post("/api/receipts/scan", files=files)
@@ -92,6 +100,19 @@ class TestUploadReceipt:
         assert receipt["purchase_date"] is None
         assert receipt["processing_status"] == "uploaded"
 
+    async def test_upload_receipt_extension_from_file_content(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """Stored file extension should follow the file content, not the filename."""
+        files = {
+            "file": ("IMG_0001", BytesIO(JPEG_HEADER + b"fake image"), "image/jpeg")
+        }
+
+        response = await client.post("/api/receipts/scan", files=files)
+
+        assert response.status_code == 201
+        assert response.json()["image_path"].endswith(".jpg")
+
     async def test_upload_receipt_no_file(
         self, client: AsyncClient, test_db: AsyncSession
     ) -> None:
@@ -113,11 +134,171 @@ class TestUploadReceipt:
         assert "detail" in response.json()
         assert "file type" in response.json()["detail"].lower()
 
+    async def test_upload_receipt_rejects_spoofed_content_type(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """A non-image body should be rejected even if labelled image/jpeg."""
+        files = {"file": ("receipt.jpg", BytesIO(b"not really a jpeg"), "image/jpeg")}
+
+        response = await client.post("/api/receipts/scan", files=files)
+
+        assert response.status_code == 400
+        # The client's label is not what was checked, so it isn't echoed back
+        assert "image/jpeg" not in response.json()["detail"]
+
+    async def test_upload_receipt_webp_with_parameterised_content_type(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """WebP is detected from its RIFF header whatever the content type says."""
+        file_content = b"RIFF\x24\x00\x00\x00WEBPVP8 fake webp"
+        files = {
+            "file": (
+                "receipt",
+                BytesIO(file_content),
+                "application/octet-stream; charset=binary",
+            )
+        }
+
+        response = await client.post("/api/receipts/scan", files=files)
+
+        assert response.status_code == 201
+        receipt = response.json()
+        assert receipt["image_path"].endswith(".webp")
+        assert await anyio.Path(receipt["image_path"]).read_bytes() == file_content
+
+    async def test_upload_receipt_durable_write(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """Uploads stored with O_DSYNC should be written out unchanged."""
+        from unittest.mock import patch
+
+        from app.core.config import settings
+
+        file_content = PNG_HEADER + b"durable" * 1000
+
+        with patch.object(settings, "RECEIPT_DURABLE_WRITE", True):
+            response = await client.post(
+                "/api/receipts/scan",
+                files={"file": ("receipt.png", BytesIO(file_content), "image/png")},
+            )
+
+        assert response.status_code == 201
+        image_path = anyio.Path(response.json()["image_path"])
+        assert await image_path.read_bytes() == file_content
+
+    async def test_upload_receipt_duplicate_returns_existing(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """Re-uploading the same file should return the first receipt, not a copy."""
+        file_content = JPEG_HEADER + b"retried upload"
+
+        first = await client.post(
+            "/api/receipts/scan",
+            files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+        )
+        retry = await client.post(
+            "/api/receipts/scan",
+            files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+        )
+
+        assert first.status_code == 201
+        assert retry.status_code == 200
+        assert retry.json()["id"] == first.json()["id"]
+        assert len((await client.get("/api/receipts")).json()) == 1
+        stored = [p async for p in anyio.Path("data/receipts").iterdir()]
+        assert len(stored) == 1
+
+    async def test_upload_retries_when_duplicate_is_deleted(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """If the conflicting receipt vanishes before it is read, insert again."""
+        from unittest.mock import patch
+
+        file_content = JPEG_HEADER + b"deleted meanwhile"
+        files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
+        first = await client.post("/api/receipts/scan", files=files)
+        first_id = UUID(first.json()["id"])
+
+        async def delete_first(db, *_args, **_kwargs):
+            await crud_receipt.delete_receipt(db, first_id)
+            return None
+
+        with patch("app.crud.receipt.get_receipt_by_sha256", side_effect=delete_first):
+            retry = await client.post(
+                "/api/receipts/scan",
+                files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+            )
+
+        assert retry.status_code == 201
+        assert retry.json()["id"] != str(first_id)
+
+    async def test_upload_conflict_when_duplicate_keeps_vanishing(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """An unreadable duplicate should give a 409 and leave no orphan file."""
+        from unittest.mock import AsyncMock, patch
+
+        file_content = JPEG_HEADER + b"vanishing"
+        first = await client.post(
+            "/api/receipts/scan",
+            files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+        )
+
+        with patch(
+            "app.crud.receipt.get_receipt_by_sha256",
+            new_callable=AsyncMock,
+            return_value=None,
+        ):
+            retry = await client.post(
+                "/api/receipts/scan",
+                files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+            )
+
+        assert retry.status_code == 409
+        stored = [str(p) async for p in anyio.Path("data/receipts").iterdir()]
+        assert stored == [first.json()["image_path"]]
+
+    async def test_failed_upload_stream_leaves_no_file(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """A stream that breaks off mid-upload should not leave a partial file."""
+
+        async def broken_upload():
+            yield JPEG_HEADER
+            raise ConnectionResetError("client went away")
+
+        with pytest.raises(ConnectionResetError):
+            await crud_receipt.create_receipt(
+                test_db, file_chunks=broken_upload(), file_extension=".jpg"
+            )
+
+        stored = [p async for p in anyio.Path("data/receipts").iterdir()]
+        assert stored == []
+
+    async def test_upload_receipt_same_file_in_new_batch_creates_receipt(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """The same file uploaded into a different batch is a separate receipt."""
+        from uuid import uuid4
+
+        file_content = JPEG_HEADER + b"same file"
+        ids = []
+        for batch_id in (str(uuid4()), str(uuid4())):
+            response = await client.post(
+                "/api/receipts/scan",
+                files={"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")},
+                data={"batch_id": batch_id},
+            )
+            assert response.status_code == 201
+            ids.append(response.json()["id"])
+
+        assert ids[0] != ids[1]
+
     async def test_upload_receipt_stores_file(
         self, client: AsyncClient, test_db: AsyncSession
     ) -> None:
         """POST /api/receipts/scan should save the file to disk."""
-        file_content = b"fake image content for storage test"
+        file_content = JPEG_HEADER + b"fake image content for storage test"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
 
         response = await client.post("/api/receipts/scan", files=files)
@@ -131,6 +312,7 @@ class TestUploadReceipt:
 
         # Verify file content matches
         assert await file_path.read_bytes() == file_content
+        assert receipt["file_sha256"] == hashlib.sha256(file_content).hexdigest()
 
 
 class TestGetReceipt:
@@ -141,7 +323,7 @@ class TestGetReceipt:
     ) -> None:
         """GET /api/receipts/{id} should return specific receipt."""
         # First create a receipt
-        file_content = b"fake image"
+        file_content = JPEG_HEADER + b"fake image"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
         data = {"store_chain": "Lidl", "purchase_date": "2024-01-03"}
 
@@ -179,6 +361,36 @@ class TestGetReceipt:
         assert response.status_code == 422
 
 
+class TestDeleteReceipt:
+    """Test crud.receipt.delete_receipt."""
+
+    async def test_delete_receipt_removes_file(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """Deleting a receipt should drop the row and its stored image."""
+        files = {"file": ("receipt.jpg", BytesIO(JPEG_HEADER + b"x"), "image/jpeg")}
+        receipt = (await client.post("/api/receipts/scan", files=files)).json()
+        image_path = anyio.Path(receipt["image_path"])
+        assert await image_path.exists()
+
+        assert await crud_receipt.delete_receipt(test_db, UUID(receipt["id"]))
+
+        assert not await image_path.exists()
+        response = await client.get(f"/api/receipts/{receipt['id']}")
+        assert response.status_code == 404
+
+    async def test_delete_receipt_with_missing_file(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """A receipt whose image is already gone should still be deleted."""
+        files = {"file": ("receipt.jpg", BytesIO(JPEG_HEADER + b"y"), "image/jpeg")}
+        receipt = (await client.post("/api/receipts/scan", files=files)).json()
+        await anyio.Path(receipt["image_path"]).unlink()
+
+        assert await crud_receipt.delete_receipt(test_db, UUID(receipt["id"]))
+        assert not await crud_receipt.delete_receipt(test_db, UUID(receipt["id"]))
+
+
 class TestListReceipts:
     """Test GET /api/receipts endpoint."""
 
@@ -199,7 +411,7 @@ class TestListReceipts:
         """GET /api/receipts should return all receipts."""
         # Create multiple receipts
         for i in range(3):
-            file_content = f"fake image {i}".encode()
+            file_content = JPEG_HEADER + f"fake image {i}".encode()
             files = {"file": (f"receipt{i}.jpg", BytesIO(file_content), "image/jpeg")}
             data = {"store_chain": f"Store{i}"}
             await client.post("/api/receipts/scan", files=files, data=data)
@@ -218,7 +430,7 @@ class TestListReceipts:
         """GET /api/receipts should return receipts sorted by created_at descending."""
         # Create receipts
         for i in range(3):
-            file_content = f"fake image {i}".encode()
+            file_content = JPEG_HEADER + f"fake image {i}".encode()
             files = {"file": (f"receipt{i}.jpg", BytesIO(file_content), "image/jpeg")}
             await client.post("/api/receipts/scan", files=files)
 
@@ -236,7 +448,7 @@ class TestListReceipts:
     ) -> None:
         """GET /api/receipts should support filtering by processing_status."""
         # Create a receipt
-        file_content = b"fake image"
+        file_content = JPEG_HEADER + b"fake image"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
         await client.post("/api/receipts/scan", files=files)
 
@@ -252,8 +464,8 @@ class TestListReceipts:
     ) -> None:
         """GET /api/receipts should support filtering by store_chain."""
         # Create receipts from different stores
-        for store in ["S-Market", "K-Citymarket", "S-Market"]:
-            file_content = f"fake image {store}".encode()
+        for i, store in enumerate(["S-Market", "K-Citymarket", "S-Market"]):
+            file_content = JPEG_HEADER + f"fake image {i} {store}".encode()
             files = {
                 "file": (f"receipt_{store}.jpg", BytesIO(file_content), "image/jpeg")
             }
@@ -267,6 +479,45 @@ class TestListReceipts:
         assert len(receipts) == 2
         assert all(r["store_chain"] == "S-Market" for r in receipts)
 
+    async def test_list_receipts_keyset_pagination(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """GET /api/receipts should page through receipts with X-Next-Cursor."""
+        for i in range(5):
+            files = {
+                "file": (
+                    f"r{i}.jpg",
+                    BytesIO(JPEG_HEADER + f"img {i}".encode()),
+                    "image/jpeg",
+                )
+            }
+            await client.post("/api/receipts/scan", files=files)
+
+        seen: list[str] = []
+        params: dict[str, str | int] = {"limit": 2}
+        page_sizes = []
+        while True:
+            response = await client.get("/api/receipts", params=params)
+            assert response.status_code == 200
+            page = response.json()
+            page_sizes.append(len(page))
+            seen.extend(r["id"] for r in page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        assert page_sizes == [2, 2, 1]
+        assert len(set(seen)) == 5
+
+    async def test_list_receipts_invalid_cursor(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """GET /api/receipts should reject a malformed cursor."""
+        response = await client.get("/api/receipts?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
 
 class TestProcessReceipt:
     """Test POST /api/receipts/{id}/process endpoint."""
@@ -280,7 +531,7 @@ class TestProcessReceipt:
         from app.parsers.base import ParsedProduct, ReceiptExtraction, StoreInfo
 
         # Create a receipt
-        file_content = b"fake receipt image"
+        file_content = JPEG_HEADER + b"fake receipt image"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
         create_response = await client.post("/api/receipts/scan", files=files)
         receipt_id = create_response.json()["id"]
@@ -331,7 +582,7 @@ class TestProcessReceipt:
         from app.parsers.base import ReceiptExtraction, StoreInfo
 
         # Create a receipt
-        file_content = b"fake receipt"
+        file_content = JPEG_HEADER + b"fake receipt"
         files = {"file": ("receipt.jpg", BytesIO(file_content), "image/jpeg")}
         create_response = await client.post("/api/receipts/scan", files=files)
         receipt_id = create_response.json()["id"]
@@ -362,3 +613,275 @@ class TestProcessReceipt:
             receipt = get_response.json()
             assert receipt["processing_status"] == "completed"
             assert receipt["ocr_raw_text"] is not None
+
+    async def test_process_receipt_rejects_confirmed_receipt(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/{id}/process should 409 once a receipt is confirmed."""
+        from unittest.mock import AsyncMock, patch
+
+        files = {"file": ("receipt.jpg", BytesIO(JPEG_HEADER + b"x"), "image/jpeg")}
+        create_response = await client.post("/api/receipts/scan", files=files)
+        receipt_id = create_response.json()["id"]
+        receipt = await crud_receipt.get_receipt(test_db, UUID(receipt_id))
+        receipt.processing_status = "confirmed"
+        await test_db.commit()
+
+        with patch(
+            "app.services.receipt_processing.extract_text_from_receipt",
+            new_callable=AsyncMock,
+        ) as mock_ocr:
+            response = await client.post(f"/api/receipts/{receipt_id}/process")
+
+        assert response.status_code == 409
+        assert "confirmed" in response.json()["detail"]
+        mock_ocr.assert_not_called()
+        await test_db.refresh(receipt)
+        assert receipt.processing_status == "confirmed"
+
+
+class TestProcessReceiptBatch:
+    """Test POST /api/receipts/batches/{batch_id}/process endpoint."""
+
+    async def test_process_batch_runs_extractions_concurrently(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """All receipts in a batch should be extracted concurrently."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+        from uuid import uuid4
+
+        from app.parsers.base import ReceiptExtraction, StoreInfo
+
+        batch_id = str(uuid4())
+        receipt_ids = []
+        for name in ("a.jpg", "b.jpg"):
+            files = {"file": (name, BytesIO(JPEG_HEADER + name.encode()), "image/jpeg")}
+            response = await client.post(
+                "/api/receipts/scan", files=files, data={"batch_id": batch_id}
+            )
+            receipt_ids.append(response.json()["id"])
+        other = {"file": ("c.jpg", BytesIO(JPEG_HEADER + b"other batch"), "image/jpeg")}
+        await client.post("/api/receipts/scan", files=other)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_ocr(_path: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return "text"
+
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                side_effect=slow_ocr,
+            ),
+            patch(
+                "app.services.receipt_processing.extract_products_from_receipt",
+                new_callable=AsyncMock,
+                return_value=ReceiptExtraction(store=StoreInfo(), products=[]),
+            ),
+        ):
+            response = await client.post(f"/api/receipts/batches/{batch_id}/process")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["batch_id"] == batch_id
+        assert [r["receipt_id"] for r in data["results"]] == receipt_ids
+        assert all(r["success"] for r in data["results"])
+        assert peak == 2
+
+    async def test_process_batch_not_found(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/batches/{id}/process should 404 for unknown batches."""
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        response = await client.post(f"/api/receipts/batches/{fake_uuid}/process")
+
+        assert response.status_code == 404
+
+
+class TestProcessReceiptAsync:
+    """Test POST /api/receipts/{id}/process/async and GET /api/receipts/tasks/{id}."""
+
+    async def test_process_async_queues_task(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/{id}/process/async should queue a Celery task."""
+        from unittest.mock import MagicMock, patch
+
+        files = {
+            "file": (
+                "receipt.jpg",
+                BytesIO(JPEG_HEADER + b"fake receipt"),
+                "image/jpeg",
+            )
+        }
+        create_response = await client.post("/api/receipts/scan", files=files)
+        receipt_id = create_response.json()["id"]
+
+        with patch(
+            "app.api.endpoints.receipts.process_receipt_task.delay",
+            return_value=MagicMock(id="task-123"),
+        ) as mock_delay:
+            response = await client.post(f"/api/receipts/{receipt_id}/process/async")
+
+        assert response.status_code == 202
+        assert response.json() == {"task_id": "task-123", "status": "queued"}
+        mock_delay.assert_called_once_with(receipt_id)
+
+    async def test_process_async_not_found(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/{id}/process/async should 404 for unknown receipts."""
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        response = await client.post(f"/api/receipts/{fake_uuid}/process/async")
+
+        assert response.status_code == 404
+
+    async def test_process_batch_async_queues_task(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/batches/{id}/process/async should queue one task."""
+        from unittest.mock import MagicMock, patch
+        from uuid import uuid4
+
+        batch_id = str(uuid4())
+        for name in ("a.jpg", "b.jpg"):
+            files = {"file": (name, BytesIO(JPEG_HEADER + name.encode()), "image/jpeg")}
+            await client.post(
+                "/api/receipts/scan", files=files, data={"batch_id": batch_id}
+            )
+
+        with patch(
+            "app.api.endpoints.receipts.process_receipt_batch_task.delay",
+            return_value=MagicMock(id="batch-task-1"),
+        ) as mock_delay:
+            response = await client.post(
+                f"/api/receipts/batches/{batch_id}/process/async"
+            )
+
+        assert response.status_code == 202
+        assert response.json() == {"task_id": "batch-task-1", "status": "queued"}
+        mock_delay.assert_called_once_with(batch_id)
+
+    async def test_batch_task_leaves_confirmed_receipts_alone(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """Re-queuing a batch must not re-extract an already confirmed receipt."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from uuid import uuid4
+
+        from app.tasks.process_receipt_batch_task import _process_batch
+
+        batch_id = uuid4()
+        files = {"file": ("a.jpg", BytesIO(JPEG_HEADER + b"a"), "image/jpeg")}
+        response = await client.post(
+            "/api/receipts/scan", files=files, data={"batch_id": str(batch_id)}
+        )
+        receipt = await crud_receipt.get_receipt(test_db, UUID(response.json()["id"]))
+        receipt.processing_status = "confirmed"
+        await test_db.commit()
+
+        @asynccontextmanager
+        async def task_session():
+            yield test_db
+
+        with (
+            patch(
+                "app.tasks.process_receipt_batch_task.AsyncSessionLocal", task_session
+            ),
+            patch(
+                "app.tasks.process_receipt_batch_task.engine",
+                MagicMock(dispose=AsyncMock()),
+            ),
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+            ) as mock_ocr,
+        ):
+            result = await _process_batch(batch_id)
+
+        assert result["results"] == []
+        mock_ocr.assert_not_called()
+        await test_db.refresh(receipt)
+        assert receipt.processing_status == "confirmed"
+
+    async def test_process_batch_async_not_found(
+        self, client: AsyncClient, test_db: AsyncSession
+    ) -> None:
+        """POST /api/receipts/batches/{id}/process/async should 404 for unknown batches."""
+        fake_uuid = "00000000-0000-0000-0000-000000000000"
+        response = await client.post(f"/api/receipts/batches/{fake_uuid}/process/async")
+
+        assert response.status_code == 404
+
+    async def test_task_status_success(self, client: AsyncClient) -> None:
+        """GET /api/receipts/tasks/{id} should return the result once finished."""
+        from unittest.mock import MagicMock, patch
+
+        task = MagicMock(state="SUCCESS")
+        task.successful.return_value = True
+        task.result = {
+            "success": True,
+            "items_extracted": 3,
+            "items_matched": 2,
+            "error": None,
+        }
+
+        with patch("app.api.endpoints.receipts.AsyncResult", return_value=task):
+            response = await client.get("/api/receipts/tasks/task-123")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"] == "SUCCESS"
+        assert data["result"]["items_extracted"] == 3
+
+    async def test_task_status_batch_result(self, client: AsyncClient) -> None:
+        """GET /api/receipts/tasks/{id} should return batch task results too."""
+        from unittest.mock import MagicMock, patch
+        from uuid import uuid4
+
+        batch_id, receipt_id = str(uuid4()), str(uuid4())
+        task = MagicMock(state="SUCCESS")
+        task.successful.return_value = True
+        task.result = {
+            "batch_id": batch_id,
+            "results": [
+                {
+                    "receipt_id": receipt_id,
+                    "success": True,
+                    "items_extracted": 4,
+                    "items_matched": 1,
+                    "error": None,
+                }
+            ],
+        }
+
+        with patch("app.api.endpoints.receipts.AsyncResult", return_value=task):
+            response = await client.get("/api/receipts/tasks/batch-task-1")
+
+        assert response.status_code == 200
+        result = response.json()["result"]
+        assert result["batch_id"] == batch_id
+        assert result["results"][0]["receipt_id"] == receipt_id
+
+    async def test_task_status_pending(self, client: AsyncClient) -> None:
+        """GET /api/receipts/tasks/{id} should report pending tasks without result."""
+        from unittest.mock import MagicMock, patch
+
+        task = MagicMock(state="PENDING")
+        task.successful.return_value = False
+        task.failed.return_value = False
+
+        with patch("app.api.endpoints.receipts.AsyncResult", return_value=task):
+            response = await client.get("/api/receipts/tasks/task-123")
+
+        assert response.status_code == 200
+        assert response.json()["state"] == "PENDING"
+        assert response.json()["result"] is None
@@ -0,0 +1,46 @@
+"""Tests for API router registration."""
+
+from collections import Counter
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.api.endpoints import (
+    categories,
+    health,
+    inventory,
+    products,
+    receipts,
+    scanner,
+    shopping,
+    websockets,
+)
+
+
+class TestRouteRegistration:
+    """FastAPI silently accepts overlapping routes; the first one wins."""
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            categories,
+            health,
+            inventory,
+            products,
+            receipts,
+            scanner,
+            shopping,
+            websockets,
+        ],
+    )
+    def test_no_duplicate_routes(self, module) -> None:
+        """Each endpoint router should register every method/path pair once."""
+        registrations = Counter(
+            (method, route.path)
+            for route in module.router.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        )
+
+        duplicates = [key for key, count in registrations.items() if count > 1]
+        assert duplicates == []
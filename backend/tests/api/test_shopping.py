@@ -7,8 +7,10 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.shopping_list_item import shopping_list_item
 from app.models.product_master import ProductMaster
 from app.models.shopping_list_item import ShoppingListItem
+from app.schemas.shopping_list_item import ShoppingListItemCreate
 
 
 @pytest.mark.asyncio
@@ -81,7 +83,7 @@ class TestShoppingListAPI:
         )
 
         assert response.status_code == 422
-        assert "Invalid priority" in response.json()["detail"]
+        assert response.json()["detail"][0]["loc"] == ["body", "priority"]
 
     async def test_create_shopping_item_invalid_source(self, client: AsyncClient):
         """Test creating item with invalid source fails."""
@@ -97,7 +99,7 @@ class TestShoppingListAPI:
         )
 
         assert response.status_code == 422
-        assert "Invalid source" in response.json()["detail"]
+        assert response.json()["detail"][0]["loc"] == ["body", "source"]
 
     async def test_get_shopping_list(
         self, client: AsyncClient, db_session: AsyncSession
@@ -457,3 +459,101 @@ class TestShoppingListAPI:
         response = await client.get("/api/shopping/?skip=10&limit=10")
         assert response.status_code == 200
         assert len(response.json()) == 5
+
+    async def test_cursor_pagination(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """Test keyset pagination keeps priority order across pages."""
+        for i, priority in enumerate(["low", "urgent", "normal", "urgent", "low"]):
+            db_session.add(
+                ShoppingListItem(
+                    name=f"Item {i}",
+                    quantity=Decimal("1"),
+                    unit="pcs",
+                    priority=priority,
+                    source="manual",
+                )
+            )
+        await db_session.commit()
+
+        first = await client.get("/api/shopping/?limit=3")
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = await client.get(
+            "/api/shopping/", params={"limit": 3, "cursor": cursor}
+        )
+        assert second.status_code == 200
+        assert "X-Next-Cursor" not in second.headers
+
+        priorities = [item["priority"] for item in first.json() + second.json()]
+        assert priorities == ["urgent", "urgent", "normal", "low", "low"]
+
+    async def test_cursor_ignores_skip(self, db_session: AsyncSession) -> None:
+        """A keyset cursor should position the page on its own, without OFFSET."""
+        for i in range(4):
+            db_session.add(
+                ShoppingListItem(
+                    name=f"Item {i}",
+                    quantity=Decimal("1"),
+                    unit="pcs",
+                    priority="normal",
+                    source="manual",
+                )
+            )
+        await db_session.commit()
+
+        first = await shopping_list_item.get_all(db_session, limit=2)
+        last = first[-1]
+        second = await shopping_list_item.get_all(
+            db_session,
+            skip=2,
+            limit=2,
+            after=(last.priority_rank, last.added_at, last.id),
+        )
+
+        assert [item.name for item in first + second] == [
+            "Item 0",
+            "Item 1",
+            "Item 2",
+            "Item 3",
+        ]
+
+
+class TestBulkCreateShoppingItems:
+    """Test CRUDShoppingListItem.bulk_create."""
+
+    async def test_bulk_create_returns_items_in_order(
+        self, db_session: AsyncSession, sample_product: ProductMaster
+    ) -> None:
+        """bulk_create should insert every item and keep the input order."""
+        items_in = [
+            ShoppingListItemCreate(
+                product_master_id=sample_product.id,
+                name=sample_product.canonical_name,
+                quantity=Decimal("2"),
+                unit=sample_product.default_unit,
+                priority="urgent",
+                source="auto_restock",
+            ),
+            ShoppingListItemCreate(
+                name="Bananas", quantity=Decimal("6"), unit="pcs", source="manual"
+            ),
+        ]
+
+        created = await shopping_list_item.bulk_create(db_session, items_in)
+
+        assert [item.name for item in created] == [
+            sample_product.canonical_name,
+            "Bananas",
+        ]
+        assert created[0].product_master.id == sample_product.id
+        assert created[1].product_master is None
+        assert all(item.added_at is not None for item in created)
+
+        stored = await shopping_list_item.get_all(db_session)
+        assert len(stored) == 2
+
+    async def test_bulk_create_empty(self, db_session: AsyncSession) -> None:
+        """An empty batch should not touch the database."""
+        assert await shopping_list_item.bulk_create(db_session, []) == []
@@ -1,7 +1,6 @@
 """Tests for WebSocket real-time updates endpoint."""
 
 import json
-from datetime import UTC
 
 import pytest
 from fastapi.testclient import TestClient
@@ -79,7 +78,7 @@ class TestWebSocketMessageFormat:
         from decimal import Decimal
         from uuid import uuid4
 
-        from app.services.broadcast_helpers import _build_message
+        from app.services.broadcast_helpers import _build_message, _encode
 
         item_id = uuid4()
         message = _build_message(
@@ -98,27 +97,28 @@ class TestWebSocketMessageFormat:
         assert message["entity_id"] == str(item_id)
         assert "timestamp" in message
         assert message["data"]["action"] == "consumed"
-        assert message["data"]["current_quantity"] == "750.00"
         assert message["data"]["status"] == "opened"
         assert message["data"]["product_name"] == "Milk 1L"
 
+        # UUIDs and Decimals are converted when the message is encoded
+        published = json.loads(_encode(message))
+        assert published["timestamp"] == message["timestamp"].isoformat()
+        assert published["data"]["inventory_item_id"] == str(item_id)
+        assert published["data"]["current_quantity"] == "750.00"
+
     def test_value_serialization(self):
-        """Test that UUIDs and Decimals are serialized correctly."""
-        from datetime import datetime
+        """Decimals are stringified; anything else orjson can't encode is rejected."""
         from decimal import Decimal
-        from uuid import uuid4
 
-        from app.services.broadcast_helpers import _serialize_value
+        import orjson
 
-        test_uuid = uuid4()
-        test_decimal = Decimal("123.45")
-        test_datetime = datetime.now(UTC)
+        from app.services.broadcast_helpers import _encode, _serialize_value
 
-        assert _serialize_value(test_uuid) == str(test_uuid)
-        assert _serialize_value(test_decimal) == str(test_decimal)
-        assert isinstance(_serialize_value(test_datetime), str)
-        assert _serialize_value("string") == "string"
-        assert _serialize_value(42) == 42
+        assert _serialize_value(Decimal("123.45")) == "123.45"
+        with pytest.raises(TypeError):
+            _serialize_value(object())
+        with pytest.raises(orjson.JSONEncodeError):
+            _encode({"data": {"value": object()}})
 
 
 class TestConnectionManagerBroadcast:
@@ -136,17 +136,23 @@ class TestConnectionManagerBroadcast:
 
         # Create mock websockets
         mock_ws1 = MagicMock()
+        mock_ws1.accept = AsyncMock()
         mock_ws1.send_text = AsyncMock()  # Working connection
         mock_ws2 = MagicMock()
+        mock_ws2.accept = AsyncMock()
         mock_ws2.send_text = AsyncMock(
             side_effect=Exception("Connection closed")
         )  # Broken connection
 
         # Add both to manager
-        test_manager.active_connections = [mock_ws1, mock_ws2]
+        await test_manager.connect(mock_ws1)
+        await test_manager.connect(mock_ws2)
+        outboxes = list(test_manager._outboxes.values())
 
-        # Broadcast a message
+        # Broadcast a message and wait for the sender tasks to deliver it
         await test_manager.broadcast("test message")
+        for outbox in outboxes:
+            await outbox.join()
 
         # Only the working connection should remain
         assert len(test_manager.active_connections) == 1
@@ -161,13 +167,112 @@ class TestConnectionManagerBroadcast:
 
         test_manager = ConnectionManager()
         mock_ws = MagicMock()
+        mock_ws.accept = AsyncMock()
         mock_ws.send_text = AsyncMock()
-        test_manager.active_connections = [mock_ws]
+        await test_manager.connect(mock_ws)
 
         test_data = {"type": "test", "data": "value"}
         await test_manager.broadcast_json(test_data)
+        await test_manager._outboxes[mock_ws].join()
 
         # Verify send_text was called with JSON string
         mock_ws.send_text.assert_called_once()
         call_arg = mock_ws.send_text.call_args[0][0]
         assert json.loads(call_arg) == test_data
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_broadcast(self):
+        """Test that a stuck client drops its oldest messages instead of blocking."""
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        from app.services.websockets import ConnectionManager
+
+        test_manager = ConnectionManager(queue_size=2)
+        stuck = asyncio.Event()
+
+        async def block_until_released(_message: str) -> None:
+            await stuck.wait()
+
+        slow_ws = MagicMock()
+        slow_ws.accept = AsyncMock()
+        slow_ws.send_text = AsyncMock(side_effect=block_until_released)
+        fast_ws = MagicMock()
+        fast_ws.accept = AsyncMock()
+        fast_ws.send_text = AsyncMock()
+        await test_manager.connect(slow_ws)
+        await test_manager.connect(fast_ws)
+
+        # The slow sender takes "m0" and blocks; "m1" is dropped on overflow
+        await test_manager.broadcast("m0")
+        await asyncio.sleep(0)
+        for message in ("m1", "m2", "m3"):
+            await test_manager.broadcast(message)
+            await asyncio.sleep(0)
+
+        await test_manager._outboxes[fast_ws].join()
+        assert [c.args[0] for c in fast_ws.send_text.call_args_list] == [
+            "m0",
+            "m1",
+            "m2",
+            "m3",
+        ]
+        slow_outbox = test_manager._outboxes[slow_ws]
+        assert [slow_outbox.get_nowait() for _ in range(2)] == ["m2", "m3"]
+
+        stuck.set()
+        test_manager.disconnect(slow_ws)
+        test_manager.disconnect(fast_ws)
+
+
+class TestPublishMessages:
+    """Test pipelined publishing of bursts of updates."""
+
+    async def test_inventory_updates_share_one_pipeline(self):
+        """Every update should be queued on one pipeline and executed once."""
+        from decimal import Decimal
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from uuid import uuid4
+
+        from app.services.broadcast_helpers import broadcast_inventory_updates
+
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock()
+        redis_client = MagicMock()
+        redis_client.pipeline.return_value = pipe
+        item_ids = [uuid4(), uuid4()]
+
+        with patch(
+            "app.services.broadcast_helpers.get_redis_client",
+            AsyncMock(return_value=redis_client),
+        ):
+            await broadcast_inventory_updates(
+                {
+                    "inventory_item_id": item_id,
+                    "action": "created",
+                    "current_quantity": Decimal("1000"),
+                }
+                for item_id in item_ids
+            )
+
+        redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        published = [json.loads(call.args[1]) for call in pipe.publish.call_args_list]
+        assert [message["entity_id"] for message in published] == [
+            str(item_id) for item_id in item_ids
+        ]
+        assert all(call.args[0] == "updates" for call in pipe.publish.call_args_list)
+
+    async def test_empty_burst_skips_redis(self):
+        """No updates should mean no Redis call at all."""
+        from unittest.mock import AsyncMock, patch
+
+        from app.services.broadcast_helpers import publish_messages
+
+        get_client = AsyncMock()
+        with patch("app.services.broadcast_helpers.get_redis_client", get_client):
+            await publish_messages([])
+
+        get_client.assert_not_awaited()
@@ -4,18 +4,29 @@ from collections.abc import AsyncGenerator
 from decimal import Decimal
 from uuid import uuid4
 
+import orjson
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
 from app.db.base_class import Base
+from app.db.session import json_dumps
 from app.main import app
 from app.models.category import Category
 from app.models.product_master import ProductMaster
 
 
+@pytest.fixture(autouse=True)
+def disable_response_cache(monkeypatch):
+    """Keep the Redis response cache out of tests (tables are recreated per test)."""
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+
+
 @pytest.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """
@@ -103,7 +114,12 @@ async def db_engine():
     Uses the same PostgreSQL instance as dev, but creates/drops tables
     per test for isolation. Skips automatically when PostgreSQL is unavailable.
     """
-    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=False,
+        json_serializer=json_dumps,
+        json_deserializer=orjson.loads,
+    )
 
     try:
         async with engine.begin() as conn:
@@ -123,7 +139,10 @@ async def db_engine():
 @pytest.fixture(scope="function")
 async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create async database session for testing."""
-    async_session = sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    # Same session options as app.db.session.AsyncSessionLocal
+    async_session = async_sessionmaker(
+        db_engine, expire_on_commit=False, autoflush=False
+    )
 
     async with async_session() as session:
         try:
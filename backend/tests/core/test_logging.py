@@ -0,0 +1,140 @@
+"""Tests for structured JSON logging."""
+
+import json
+import logging
+import queue
+import sys
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.logging import (
+    JSONFormatter,
+    _DeferredQueueHandler,
+    log_performance,
+)
+
+
+def _record(msg: str = "hello %s", args: tuple = ("world",)) -> logging.LogRecord:
+    return logging.LogRecord("app.test", logging.INFO, "test.py", 42, msg, args, None)
+
+
+class TestJSONFormatter:
+    """Test JSONFormatter output."""
+
+    def test_format_base_fields(self) -> None:
+        """Records should serialize to one JSON object with the base fields."""
+        entry = json.loads(JSONFormatter().format(_record()))
+
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "app.test"
+        assert entry["message"] == "hello world"
+        assert entry["line"] == 42
+        assert entry["timestamp"].endswith("Z")
+
+    def test_format_timestamp_from_record(self) -> None:
+        """The timestamp should be the record's creation time in UTC."""
+        record = _record()
+        record.created = 1700000000.25
+        record.msecs = 250.0
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["timestamp"] == "2023-11-14T22:13:20.250Z"
+
+    def test_format_extra_fields(self) -> None:
+        """Known extras are included; unencodable values fall back to str."""
+        record = _record()
+        record.request_id = "req-1"
+        record.duration = Decimal("1.5")
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["request_id"] == "req-1"
+        assert entry["duration_ms"] == "1.5"
+        assert "user_id" not in entry
+
+    def test_format_keeps_non_ascii(self) -> None:
+        """Non-ASCII text should be written as UTF-8, not escaped."""
+        output = JSONFormatter().format(_record("maito %s", ("ä",)))
+
+        assert "maito ä" in output
+
+
+class TestQueuedFileLogging:
+    """Test the queue handler that moves file logging off the caller's thread."""
+
+    def test_prepare_defers_formatting(self) -> None:
+        """Queued records keep exc_info and extras for the JSON formatter."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "app.test",
+                logging.ERROR,
+                "test.py",
+                1,
+                "failed %s",
+                ("task",),
+                sys.exc_info(),
+            )
+        record.request_id = "req-1"
+
+        handler = _DeferredQueueHandler(queue.SimpleQueue())
+        queued = handler.prepare(record)
+        entry = json.loads(JSONFormatter().format(queued))
+
+        assert queued.args is None
+        assert entry["message"] == "failed task"
+        assert entry["request_id"] == "req-1"
+        assert "ValueError: boom" in entry["exception"]
+
+
+class TestLogPerformance:
+    """Test the opt-in performance logging decorator."""
+
+    def test_disabled_returns_function_unchanged(self, monkeypatch) -> None:
+        """Without PERF_LOGGING the decorator adds no wrapper at all."""
+        monkeypatch.setattr(settings, "PERF_LOGGING", False)
+
+        def work() -> int:
+            return 1
+
+        assert log_performance("work")(work) is work
+
+    async def test_enabled_logs_duration(self, monkeypatch) -> None:
+        """With PERF_LOGGING each call logs its operation and duration."""
+        monkeypatch.setattr(settings, "PERF_LOGGING", True)
+        logger = MagicMock()
+
+        with patch("app.core.logging.get_logger", return_value=logger):
+
+            @log_performance("work")
+            async def work() -> int:
+                return 1
+
+        assert await work() == 1
+        extra = logger.info.call_args.kwargs["extra"]
+        assert extra["operation"] == "work"
+        assert extra["status"] == "success"
+        assert extra["duration"] >= 0
+
+    def test_enabled_logs_failure(self, monkeypatch) -> None:
+        """Failures are logged lazily and re-raised."""
+        monkeypatch.setattr(settings, "PERF_LOGGING", True)
+        logger = MagicMock()
+
+        with patch("app.core.logging.get_logger", return_value=logger):
+
+            @log_performance("work")
+            def work() -> None:
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            work()
+
+        args = logger.error.call_args.args
+        assert args[0] == "Operation failed: %s"
+        assert logger.error.call_args.kwargs["extra"]["error"] == "boom"
@@ -0,0 +1,23 @@
+"""Tests for database session configuration."""
+
+import json
+
+from app.db.session import json_dumps
+
+
+class TestJsonDumps:
+    """Test the JSON serializer used for JSON/JSONB columns."""
+
+    def test_matches_stdlib_output(self) -> None:
+        """json_dumps should produce the same document as json.dumps."""
+        value = {
+            "store": {"name": "Prisma Jyväskylä", "country": "FI"},
+            "products": [{"name": "Maito", "quantity": 2.0, "price": None}],
+            "confidence": 0.9,
+        }
+
+        assert json.loads(json_dumps(value)) == value
+
+    def test_non_string_keys_are_stringified(self) -> None:
+        """Integer keys should become strings, as with the stdlib encoder."""
+        assert json.loads(json_dumps({1: "a"})) == {"1": "a"}
@@ -0,0 +1,27 @@
+"""Tests for the shared OCR/LLM HTTP client."""
+
+from app.services.http_client import close_http_client, get_http_client
+
+
+class TestSharedHttpClient:
+    """The client is created once and reused until closed."""
+
+    async def test_client_is_reused(self):
+        """Repeated calls should return the same pooled client."""
+        try:
+            first = await get_http_client()
+            assert await get_http_client() is first
+        finally:
+            await close_http_client()
+
+    async def test_close_resets_client(self):
+        """Closing should dispose the client so the next call gets a fresh one."""
+        first = await get_http_client()
+        await close_http_client()
+
+        assert first.is_closed
+        second = await get_http_client()
+        try:
+            assert second is not first
+        finally:
+            await close_http_client()
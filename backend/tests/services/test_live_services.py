@@ -54,7 +54,7 @@ class TestLiveVLLMService:
         assert len(result.products) >= 1, "vLLM should extract at least one product"
 
         # Verify store detection (may or may not work depending on LLM)
-        store_info = result.get_store_info()
+        store_info = result.store
         print(f"\nExtracted store: {store_info.name}, chain: {store_info.chain}")
         print(f"Extracted {len(result.products)} products:")
         for i, product in enumerate(result.products, 1):
@@ -82,7 +82,7 @@ class TestLiveVLLMService:
         assert isinstance(result, ReceiptExtraction)
         assert len(result.products) >= 1
 
-        store_info = result.get_store_info()
+        store_info = result.store
         print(f"\nExtracted store: {store_info.name}")
         print(f"Language: {store_info.language}, Country: {store_info.country}")
         print(f"Currency: {store_info.currency}")
@@ -105,7 +105,7 @@ class TestLiveVLLMService:
         assert isinstance(result, ReceiptExtraction)
         assert len(result.products) >= 1
 
-        store_info = result.get_store_info()
+        store_info = result.store
         print("\nWith hint 'Prisma (S-Group)':")
         print(f"Detected: {store_info.name}, chain: {store_info.chain}")
 
@@ -190,7 +190,7 @@ class TestLiveEndToEndPipeline:
             "Should extract at least one product from real receipt"
         )
 
-        store_info = result.get_store_info()
+        store_info = result.store
         print(f"\nStore: {store_info.name}")
         print(f"Chain: {store_info.chain}")
         print(f"Country: {store_info.country}, Language: {store_info.language}")
@@ -223,7 +223,7 @@ class TestLiveEndToEndPipeline:
 
         assert isinstance(result, ReceiptExtraction)
 
-        store_info = result.get_store_info()
+        store_info = result.store
         print(f"\nStore: {store_info.name}")
         print(f"Chain: {store_info.chain}")
         print(f"Extracted {len(result.products)} products")
@@ -9,6 +9,7 @@ import pytest
 from app.core.config import settings
 from app.parsers.base import ReceiptExtraction
 from app.services.llm_extractor import (
+    EXTRACTION_SYSTEM_PROMPT,
     build_prompt_for_store,
     extract_products_from_receipt,
     extract_with_store_hint,
@@ -85,7 +86,7 @@ class TestExtractProductsFromReceipt:
 
     async def test_successful_extraction(self, mock_vllm_response, sample_ocr_text):
         """Test successful product extraction with valid vLLM response."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             # Mock the response object
             mock_response = AsyncMock()
             mock_response.json = lambda: mock_vllm_response  # Sync method
@@ -93,7 +94,7 @@ class TestExtractProductsFromReceipt:
 
             # Mock the post method
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             # Execute extraction
             result = await extract_products_from_receipt(sample_ocr_text)
@@ -101,9 +102,9 @@ class TestExtractProductsFromReceipt:
             # Verify result
             assert isinstance(result, ReceiptExtraction)
             assert len(result.products) == 2
-            assert result.get_store_info().name == "Prisma Jyväskylä"
-            assert result.get_store_info().chain == "s-group"
-            assert result.get_store_info().country == "FI"
+            assert result.store.name == "Prisma Jyväskylä"
+            assert result.store.chain == "s-group"
+            assert result.store.country == "FI"
             assert result.confidence == 0.95
 
             # Verify first product
@@ -132,6 +133,7 @@ class TestExtractProductsFromReceipt:
             # Note: response_format is NOT included because it causes thinking loops in vLLM
             # The prompt itself instructs the model to output JSON
             assert "response_format" not in payload
+            assert "guided_json" not in payload
 
     async def test_extraction_with_minimal_response(self):
         """Test extraction with minimal valid response (no store info)."""
@@ -152,24 +154,24 @@ class TestExtractProductsFromReceipt:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: minimal_response
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await extract_products_from_receipt("Some OCR text")
 
             assert isinstance(result, ReceiptExtraction)
             assert len(result.products) == 1
             assert result.products[0].name == "Product"
-            assert result.get_store_info().name is None
+            assert result.store.name is None
 
     async def test_http_error_handling(self, sample_ocr_text):
         """Test handling of vLLM API HTTP errors."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             # Create mock request and response for HTTPStatusError
             mock_request = AsyncMock()
             mock_error_response = AsyncMock()
@@ -186,7 +188,7 @@ class TestExtractProductsFromReceipt:
             mock_response.raise_for_status = raise_status_error
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with pytest.raises(httpx.HTTPStatusError):
                 await extract_products_from_receipt(sample_ocr_text)
@@ -195,13 +197,13 @@ class TestExtractProductsFromReceipt:
         """Test handling of invalid JSON in response."""
         invalid_response = {"choices": [{"message": {"content": "not valid json"}}]}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: invalid_response
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with pytest.raises(Exception):  # noqa: B017  # Pydantic validation error
                 await extract_products_from_receipt(sample_ocr_text)
@@ -210,7 +212,7 @@ class TestExtractProductsFromReceipt:
         """Test that OCR text is truncated to 4000 characters."""
         long_text = "A" * 5000
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: {
                 "choices": [
@@ -220,20 +222,70 @@ class TestExtractProductsFromReceipt:
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             await extract_products_from_receipt(long_text)
 
             # Verify OCR text was truncated to 4000 chars
             call_args = mock_post.call_args
             payload = call_args.kwargs["json"]
-            prompt = payload["messages"][0]["content"]
+            prompt = payload["messages"][1]["content"]
 
             # Check that "AAAA..." appears in prompt but not all 5000 As
             # OCR text should be limited to 4000 chars (prompt template adds overhead)
             assert "A" * 4000 in prompt  # Truncated text is present
             assert "A" * 4001 not in prompt  # But not more than 4000 chars
 
+    async def test_instructions_sent_as_shared_system_message(self):
+        """Test every receipt gets the same system message, receipt in user turn."""
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
+            mock_response = AsyncMock()
+            mock_response.json = lambda: {
+                "choices": [
+                    {"message": {"content": json.dumps({"store": {}, "products": []})}}
+                ]
+            }
+            mock_response.raise_for_status = lambda: None
+
+            mock_post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = mock_post
+
+            await extract_products_from_receipt("Receipt one")
+            first = mock_post.call_args.kwargs["json"]["messages"]
+            await extract_products_from_receipt("Receipt two")
+            second = mock_post.call_args.kwargs["json"]["messages"]
+
+            assert first[0] == second[0]
+            assert first[0] == {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT}
+            assert first[1]["role"] == "user"
+            assert "Receipt one" in first[1]["content"]
+            assert "Receipt one" not in EXTRACTION_SYSTEM_PROMPT
+
+    async def test_guided_json_when_enabled(
+        self, mock_vllm_response, sample_ocr_text, monkeypatch
+    ):
+        """Test that the receipt schema is sent for vLLM guided decoding."""
+        monkeypatch.setattr(settings, "LLM_GUIDED_JSON", True)
+
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
+            mock_response = AsyncMock()
+            mock_response.json = lambda: mock_vllm_response
+            mock_response.raise_for_status = lambda: None
+
+            mock_post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.post = mock_post
+
+            result = await extract_products_from_receipt(sample_ocr_text)
+
+            assert len(result.products) == 2
+            payload = mock_post.call_args.kwargs["json"]
+            assert payload["guided_json"] == ReceiptExtraction.model_json_schema()
+            assert (
+                payload["guided_decoding_backend"]
+                == settings.LLM_GUIDED_DECODING_BACKEND
+            )
+            assert "response_format" not in payload
+
 
 class TestBuildPromptForStore:
     """Test prompt building with store hints."""
@@ -243,7 +295,7 @@ class TestBuildPromptForStore:
         prompt = build_prompt_for_store("Sample OCR text")
 
         assert "Sample OCR text" in prompt
-        assert "language-agnostic" in prompt.lower() or "any language" in prompt.lower()
+        assert "any language" in EXTRACTION_SYSTEM_PROMPT.lower()
         assert "Note: This receipt appears to be from" not in prompt
 
     def test_prompt_with_store_hint(self):
@@ -261,9 +313,9 @@ class TestBuildPromptForStore:
 
         # Should contain truncated text (max 4000 chars)
         assert "X" * 4000 in prompt
-        # Prompt should be truncated: 4000 char text + ~2000 char template = ~6000 chars
-        assert len(prompt) < 7000  # Allow for template overhead
-        assert len(prompt) > 5000  # Should have text + template
+        assert "X" * 4001 not in prompt
+        # Instructions are in the system message, so only a short wrapper remains
+        assert len(prompt) < 4100
 
 
 class TestExtractWithStoreHint:
@@ -301,31 +353,31 @@ class TestExtractWithStoreHint:
 
     async def test_extraction_with_hint(self, mock_vllm_response):
         """Test extraction includes store hint in prompt."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: mock_vllm_response
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await extract_with_store_hint("Sample OCR", "Prisma")
 
             assert isinstance(result, ReceiptExtraction)
             assert len(result.products) == 1
-            assert result.get_store_info().name == "Prisma"
+            assert result.store.name == "Prisma"
 
             # Verify prompt included hint
             call_args = mock_post.call_args
             payload = call_args.kwargs["json"]
-            prompt = payload["messages"][0]["content"]
+            prompt = payload["messages"][1]["content"]
 
             assert "Prisma" in prompt
             assert "Note: This receipt appears to be from Prisma" in prompt
 
     async def test_http_error_with_hint(self):
         """Test error handling with store hint."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             # Create mock request and response for HTTPStatusError
             mock_request = AsyncMock()
             mock_error_response = AsyncMock()
@@ -342,7 +394,7 @@ class TestExtractWithStoreHint:
             mock_response.raise_for_status = raise_status_error
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with pytest.raises(httpx.HTTPStatusError):
                 await extract_with_store_hint("OCR text", "K-Citymarket")
@@ -384,17 +436,17 @@ class TestLanguageAgnosticExtraction:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_resp = AsyncMock()
             mock_resp.json = lambda: mock_response
             mock_resp.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_resp)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await extract_products_from_receipt(f"{store_name} receipt text")
 
-            assert result.get_store_info().language == language
+            assert result.store.language == language
             assert len(result.products) == len(product_names)
             for i, product in enumerate(result.products):
                 assert product.name == product_names[i]
@@ -426,13 +478,13 @@ class TestPydanticValidation:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: invalid_response
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with pytest.raises(Exception):  # noqa: B017  # Pydantic validation error
                 await extract_products_from_receipt("OCR text")
@@ -460,13 +512,13 @@ class TestPydanticValidation:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.llm_extractor.get_http_client") as mock_client:
             mock_response = AsyncMock()
             mock_response.json = lambda: invalid_response
             mock_response.raise_for_status = lambda: None
 
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             with pytest.raises(Exception):  # noqa: B017  # Pydantic validation error
                 await extract_products_from_receipt("OCR text")
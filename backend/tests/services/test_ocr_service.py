@@ -1,5 +1,6 @@
 """Tests for OCR service."""
 
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -29,6 +30,20 @@ class TestExtractTextFromReceipt:
             assert result == "PDF TEXT"
             mock_pdf.assert_called_once()
 
+    async def test_pdf_extraction_runs_off_event_loop(self, tmp_path):
+        """pdfplumber should run in a worker thread, not on the event loop."""
+        pdf_file = tmp_path / "receipt.pdf"
+        pdf_file.write_bytes(b"fake pdf content")
+        loop_thread = threading.get_ident()
+
+        with patch(
+            "app.services.ocr_service._extract_from_pdf",
+            side_effect=lambda _: threading.get_ident(),
+        ):
+            worker_thread = await extract_text_from_receipt(str(pdf_file))
+
+        assert worker_thread != loop_thread
+
     async def test_routes_jpg_to_mineru(self, tmp_path):
         """JPG files should be routed to MinerU."""
         img_file = tmp_path / "receipt.jpg"
@@ -132,12 +147,10 @@ class TestExtractFromImage:
         mock_response.raise_for_status = Mock()
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch(
-            "app.services.ocr_service.httpx.AsyncClient", return_value=mock_client
+            "app.services.ocr_service.get_http_client", return_value=mock_client
         ):
             result = await _extract_from_image(img_file)
 
@@ -161,12 +174,10 @@ class TestExtractFromImage:
         mock_response.raise_for_status = Mock()
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch(
-            "app.services.ocr_service.httpx.AsyncClient", return_value=mock_client
+            "app.services.ocr_service.get_http_client", return_value=mock_client
         ):
             result = await _extract_from_image(img_file)
 
@@ -181,14 +192,10 @@ class TestExtractFromImage:
         img_file.write_bytes(b"fake image")
 
         mock_client = AsyncMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
         mock_client.post = AsyncMock(side_effect=httpx.HTTPError("API Error"))
 
         with (
-            patch(
-                "app.services.ocr_service.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("app.services.ocr_service.get_http_client", return_value=mock_client),
             pytest.raises(httpx.HTTPError),
         ):
             await _extract_from_image(img_file)
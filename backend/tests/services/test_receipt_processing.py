@@ -1,5 +1,7 @@
 """Tests for receipt processing service (OCR → LLM → Matching integration)."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 from uuid import uuid4
@@ -7,6 +9,8 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.crud import receipt as crud_receipt
 from app.models.category import Category
 from app.models.product_master import ProductMaster
 from app.models.receipt import Receipt
@@ -185,6 +189,241 @@ TOTAL                      7.48
             assert sample_receipt.items_extracted == 2
             assert sample_receipt.items_matched >= 1
 
+    async def test_process_receipt_skips_receipt_already_processing(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+    ):
+        """A receipt claimed by another worker should not run the pipeline again."""
+        sample_receipt.processing_status = "processing"
+        sample_receipt.processing_started_at = datetime.now(UTC)
+        await db_session.commit()
+
+        with patch(
+            "app.services.receipt_processing.extract_text_from_receipt",
+            new_callable=AsyncMock,
+        ) as mock_ocr:
+            result = await processing_service.process_receipt(sample_receipt)
+
+        assert result is None
+        mock_ocr.assert_not_called()
+
+    async def test_claim_receipts_skips_confirmed(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+    ):
+        """The claim itself refuses confirmed receipts, whatever the caller."""
+        sample_receipt.processing_status = "confirmed"
+        await db_session.commit()
+
+        claimed = await crud_receipt.claim_receipts(db_session, [sample_receipt])
+
+        assert claimed == []
+        await db_session.refresh(sample_receipt)
+        assert sample_receipt.processing_status == "confirmed"
+
+    async def test_process_receipt_reclaims_stale_processing(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+        mock_ocr_response: str,
+        mock_llm_extraction: ReceiptExtraction,
+    ):
+        """A claim older than the processing timeout is taken over."""
+        sample_receipt.processing_status = "processing"
+        sample_receipt.processing_started_at = datetime.now(UTC) - timedelta(
+            seconds=settings.RECEIPT_PROCESSING_TIMEOUT + 60
+        )
+        await db_session.commit()
+
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+                return_value=mock_ocr_response,
+            ),
+            patch(
+                "app.services.receipt_processing.extract_products_from_receipt",
+                new_callable=AsyncMock,
+                return_value=mock_llm_extraction,
+            ),
+        ):
+            result = await processing_service.process_receipt(sample_receipt)
+
+        assert result is not None
+        assert result.success is True
+
+    async def test_process_receipt_cancelled_releases_claim(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+    ):
+        """Cancellation mid-pipeline marks the receipt failed instead of claimed."""
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+                side_effect=asyncio.CancelledError,
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await processing_service.process_receipt(sample_receipt)
+
+        await db_session.refresh(sample_receipt)
+        assert sample_receipt.processing_status == "failed"
+
+    async def test_process_receipts_records_each_outcome_independently(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+        mock_ocr_response: str,
+        mock_llm_extraction: ReceiptExtraction,
+    ):
+        """A receipt whose result cannot be saved doesn't affect the others."""
+        other = Receipt(
+            id=uuid4(),
+            image_path="/fake/path/other.pdf",
+            processing_status="uploaded",
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        complete = processing_service._complete
+
+        async def fail_first(receipt, *outcome):
+            if receipt.id == sample_receipt.id:
+                raise RuntimeError("commit failed")
+            return await complete(receipt, *outcome)
+
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+                return_value=mock_ocr_response,
+            ),
+            patch(
+                "app.services.receipt_processing.extract_products_from_receipt",
+                new_callable=AsyncMock,
+                return_value=mock_llm_extraction,
+            ),
+            patch.object(processing_service, "_complete", side_effect=fail_first),
+        ):
+            processed = await processing_service.process_receipts(
+                [sample_receipt, other]
+            )
+
+        results = {receipt.id: result for receipt, result in processed}
+        assert results[sample_receipt.id].success is False
+        assert "commit failed" in results[sample_receipt.id].error
+        assert results[other.id].success is True
+        assert sample_receipt.processing_status == "failed"
+        assert other.processing_status == "completed"
+
+    async def test_process_receipts_aborted_extraction_keeps_other_results(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+        mock_ocr_response: str,
+        mock_llm_extraction: ReceiptExtraction,
+    ):
+        """A cancelled extraction is re-raised only after the rest are saved."""
+        other = Receipt(
+            id=uuid4(),
+            image_path="/fake/path/other.pdf",
+            processing_status="uploaded",
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+                side_effect=[asyncio.CancelledError(), mock_ocr_response],
+            ),
+            patch(
+                "app.services.receipt_processing.extract_products_from_receipt",
+                new_callable=AsyncMock,
+                return_value=mock_llm_extraction,
+            ),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await processing_service.process_receipts([sample_receipt, other])
+
+        await db_session.refresh(sample_receipt)
+        await db_session.refresh(other)
+        assert sample_receipt.processing_status == "failed"
+        assert other.processing_status == "completed"
+
+    async def test_process_receipts_publishes_processing_status_once(
+        self,
+        processing_service: ReceiptProcessingService,
+        sample_receipt: Receipt,
+        db_session: AsyncSession,
+    ):
+        """The "processing" updates for a batch go out in one pipelined publish."""
+        other = Receipt(
+            id=uuid4(),
+            image_path="/fake/path/other.pdf",
+            processing_status="uploaded",
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        with (
+            patch(
+                "app.services.receipt_processing.extract_text_from_receipt",
+                new_callable=AsyncMock,
+                side_effect=Exception("OCR service unavailable"),
+            ),
+            patch(
+                "app.services.receipt_processing.broadcast_receipt_statuses",
+                new_callable=AsyncMock,
+            ) as mock_broadcast,
+        ):
+            await processing_service.process_receipts([sample_receipt, other])
+
+        mock_broadcast.assert_awaited_once()
+        (updates,) = mock_broadcast.call_args.args
+        assert list(updates) == [
+            {"receipt_id": sample_receipt.id, "status": "processing"},
+            {"receipt_id": other.id, "status": "processing"},
+        ]
+
+    async def test_process_batch_skips_confirmed_receipts(
+        self,
+        processing_service: ReceiptProcessingService,
+        db_session: AsyncSession,
+    ):
+        """Confirmed receipts in a batch must not be extracted again."""
+        batch_id = uuid4()
+        confirmed = Receipt(
+            id=uuid4(),
+            image_path="/fake/path/confirmed.pdf",
+            processing_status="confirmed",
+            batch_id=batch_id,
+        )
+        db_session.add(confirmed)
+        await db_session.commit()
+
+        with patch(
+            "app.services.receipt_processing.extract_text_from_receipt",
+            new_callable=AsyncMock,
+        ) as mock_ocr:
+            processed = await processing_service.process_batch(batch_id)
+
+        assert processed == []
+        mock_ocr.assert_not_called()
+        await db_session.refresh(confirmed)
+        assert confirmed.processing_status == "confirmed"
+
     async def test_process_receipt_ocr_failure(
         self,
         processing_service: ReceiptProcessingService,
@@ -343,3 +582,53 @@ class TestProcessingResult:
 
         assert result.success is False
         assert result.error == "OCR failed"
+
+
+class TestParsedProduct:
+    """Test ParsedProduct serialization."""
+
+    def test_to_dict_matches_model_dump(self):
+        """to_dict should return every field, like model_dump."""
+        product = ParsedProduct(name="Maito", name_en="Milk", quantity=2, price=1.5)
+
+        data = product.to_dict()
+
+        assert data == product.model_dump()
+        assert list(data) == list(ParsedProduct.model_fields)
+
+    def test_to_dict_returns_a_copy(self):
+        """Mutating the result should not touch the model."""
+        product = ParsedProduct(name="Maito")
+
+        product.to_dict()["name"] = "changed"
+
+        assert product.name == "Maito"
+
+
+class TestReceiptExtraction:
+    """Test ReceiptExtraction parsing of LLM output."""
+
+    def test_legacy_store_fields_fold_into_store(self):
+        """Flat store keys from the old schema should end up in store."""
+        extraction = ReceiptExtraction.model_validate_json(
+            '{"store": {"name": "Prisma", "country": "FI"},'
+            ' "store_chain": "s-group", "currency": "EUR", "language": null,'
+            ' "products": []}'
+        )
+
+        assert extraction.store == StoreInfo(
+            name="Prisma", chain="s-group", country="FI", currency="EUR"
+        )
+        assert "store_chain" not in ReceiptExtraction.model_fields
+
+    def test_legacy_store_name_overrides_store(self):
+        """A non-empty legacy value should win, as the old merge did."""
+        extraction = ReceiptExtraction(store=StoreInfo(name="Old"), store_name="New")
+
+        assert extraction.store.name == "New"
+
+    def test_schema_has_no_legacy_fields(self):
+        """The JSON schema used for guided decoding should only describe store."""
+        properties = ReceiptExtraction.model_json_schema()["properties"]
+
+        assert set(properties) == {"store", "products", "confidence"}
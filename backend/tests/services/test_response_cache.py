@@ -0,0 +1,210 @@
+"""Tests for the Redis response cache helpers."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.schemas.category import CategoryResponse
+from app.services import response_cache
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch):
+    """Re-enable the response cache for these tests."""
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+
+@pytest.fixture
+def mock_redis():
+    """Mock Redis client for cache operations."""
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    redis.set = AsyncMock(return_value=True)
+    return redis
+
+
+CATEGORY = {
+    "id": "dairy",
+    "display_name": "Dairy",
+    "icon": None,
+    "default_shelf_life_days": 7,
+    "meal_contexts": None,
+    "sort_order": 1,
+}
+
+
+class TestCachedResponse:
+    """Tests for cached_response."""
+
+    async def test_cache_miss_loads_and_stores(self, cache_enabled, mock_redis):
+        """A miss should call the loader and store the serialized result."""
+        loader = AsyncMock(return_value=[CATEGORY])
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_response(
+                "categories", "list", list[CategoryResponse], loader
+            )
+
+        assert result == [CATEGORY]
+        loader.assert_awaited_once()
+        key, payload = mock_redis.set.call_args.args
+        assert key == "kyokki:cache:categories:v0:list"
+        assert json.loads(payload) == [CATEGORY]
+        assert mock_redis.set.call_args.kwargs["ex"] == settings.RESPONSE_CACHE_TTL
+
+    async def test_cache_hit_skips_loader(self, cache_enabled, mock_redis):
+        """A hit should return the cached JSON without calling the loader."""
+        mock_redis.get = AsyncMock(side_effect=[b"3", json.dumps([CATEGORY]).encode()])
+        loader = AsyncMock()
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_response(
+                "categories", "list", list[CategoryResponse], loader
+            )
+
+        assert result == [CATEGORY]
+        loader.assert_not_awaited()
+        assert mock_redis.get.call_args.args == ("kyokki:cache:categories:v3:list",)
+
+    async def test_none_is_not_cached(self, cache_enabled, mock_redis):
+        """A None result (not found) should not be written to the cache."""
+        loader = AsyncMock(return_value=None)
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_response(
+                "categories", "id:missing", CategoryResponse, loader
+            )
+
+        assert result is None
+        mock_redis.set.assert_not_called()
+
+    async def test_redis_failure_falls_through_to_loader(self, cache_enabled):
+        """Redis errors should never break the request."""
+        loader = AsyncMock(return_value=[CATEGORY])
+
+        with patch(
+            "app.services.response_cache.get_redis_client",
+            side_effect=ConnectionError("redis down"),
+        ):
+            result = await response_cache.cached_response(
+                "categories", "list", list[CategoryResponse], loader
+            )
+
+        assert result == [CATEGORY]
+
+    async def test_disabled_cache_bypasses_redis(self, mock_redis):
+        """With the cache disabled the loader is called directly."""
+        loader = AsyncMock(return_value=[CATEGORY])
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            await response_cache.cached_response(
+                "categories", "list", list[CategoryResponse], loader
+            )
+
+        mock_redis.get.assert_not_called()
+
+
+class TestCachedJson:
+    """Tests for cached_json."""
+
+    async def test_cache_hit_returns_stored_bytes(self, cache_enabled, mock_redis):
+        """A hit should return the cached payload without decoding it."""
+        payload = json.dumps([CATEGORY]).encode()
+        mock_redis.get = AsyncMock(side_effect=[None, payload])
+        loader = AsyncMock()
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_json(
+                "categories", "list", TypeAdapter(list[CategoryResponse]), loader
+            )
+
+        assert result is payload
+        loader.assert_not_awaited()
+
+    async def test_cache_miss_serializes_once(self, cache_enabled, mock_redis):
+        """A miss should store and return the same serialized body."""
+        loader = AsyncMock(return_value=[CATEGORY])
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_json(
+                "categories", "list", TypeAdapter(list[CategoryResponse]), loader
+            )
+
+        assert json.loads(result) == [CATEGORY]
+        _, stored = mock_redis.set.call_args.args
+        assert stored is result
+
+    async def test_disabled_cache_bypasses_redis(self, mock_redis):
+        """With the cache disabled the loader result is serialized directly."""
+        loader = AsyncMock(return_value=[CATEGORY])
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            result = await response_cache.cached_json(
+                "categories", "list", TypeAdapter(list[CategoryResponse]), loader
+            )
+
+        assert json.loads(result) == [CATEGORY]
+        mock_redis.get.assert_not_called()
+        mock_redis.set.assert_not_called()
+
+
+class TestInvalidate:
+    """Tests for invalidate."""
+
+    async def test_bumps_namespace_versions(self, cache_enabled):
+        """Invalidation should INCR each namespace version in one pipeline."""
+        pipe = MagicMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=None)
+        pipe.execute = AsyncMock()
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+
+        with patch("app.services.response_cache.get_redis_client", return_value=redis):
+            await response_cache.invalidate("products", "inventory")
+
+        assert [call.args for call in pipe.incr.call_args_list] == [
+            ("kyokki:cache:products:version",),
+            ("kyokki:cache:inventory:version",),
+        ]
+        pipe.execute.assert_awaited_once()
+        redis.scan_iter.assert_not_called()
+
+    async def test_fill_started_before_invalidation_is_orphaned(
+        self, cache_enabled, mock_redis
+    ):
+        """A load that races an invalidation should store under the old version."""
+        versions = {"kyokki:cache:products:version": b"1"}
+        mock_redis.get = AsyncMock(side_effect=lambda key: versions.get(key))
+
+        async def loader():
+            # A write lands while the database is being read
+            versions["kyokki:cache:products:version"] = b"2"
+            return [CATEGORY]
+
+        with patch(
+            "app.services.response_cache.get_redis_client", return_value=mock_redis
+        ):
+            await response_cache.cached_json(
+                "products", "list", TypeAdapter(list[CategoryResponse]), loader
+            )
+
+        key, _ = mock_redis.set.call_args.args
+        assert key == "kyokki:cache:products:v1:list"
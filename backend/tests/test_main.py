@@ -0,0 +1,55 @@
+"""Tests for the Redis-to-WebSocket listener in app.main."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.main import redis_listener
+
+
+class FakePubSub:
+    """Pub/sub stub that yields the given messages, then blocks like Redis."""
+
+    def __init__(self, messages: list[dict]):
+        self._messages = messages
+        self.subscribe = AsyncMock()
+        self.aclose = AsyncMock()
+
+    async def listen(self):
+        for message in self._messages:
+            yield message
+        await asyncio.Event().wait()
+
+
+class TestRedisListener:
+    """Test redis_listener."""
+
+    async def test_broadcasts_messages_without_polling(self) -> None:
+        """Published messages are broadcast as they arrive; acks are skipped."""
+        pubsub = FakePubSub(
+            [
+                {"type": "subscribe", "data": 1},
+                {"type": "message", "data": b'{"type": "a"}'},
+                {"type": "message", "data": b'{"type": "b"}'},
+            ]
+        )
+        client = MagicMock(pubsub=MagicMock(return_value=pubsub), aclose=AsyncMock())
+        broadcast = AsyncMock()
+
+        with (
+            patch("app.main.redis.from_url", return_value=client),
+            patch("app.main.manager.broadcast", broadcast),
+        ):
+            task = asyncio.create_task(redis_listener(MagicMock()))
+            for _ in range(10):
+                await asyncio.sleep(0)
+            # Idle listener waits on the subscription instead of looping
+            assert not task.done()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert [call.args[0] for call in broadcast.await_args_list] == [
+            '{"type": "a"}',
+            '{"type": "b"}',
+        ]
+        pubsub.subscribe.assert_awaited_once_with("updates")
+        pubsub.aclose.assert_awaited_once()